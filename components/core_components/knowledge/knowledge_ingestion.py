@@ -4,6 +4,7 @@ import asyncio
 import contextlib
 import hashlib
 import json
+import os
 import re
 import uuid
 from dataclasses import asdict, dataclass, field
@@ -36,6 +37,7 @@ if not knowledge_directory:
     msg = "Knowledge bases directory is not set in the settings."
     raise ValueError(msg)
 KNOWLEDGE_BASES_ROOT_PATH = Path(knowledge_directory).expanduser()
+CHECKPOINT_FILENAME = "ingestion_checkpoint.json"
 
 
 class KBIngestionComponent(Component):
@@ -168,6 +170,21 @@ class KBIngestionComponent(Component):
             advanced=True,
             value=False,
         ),
+        IntInput(
+            name="ingest_batch_size",
+            display_name="Ingestion Batch Size",
+            info="Rows converted, embedded and written to the knowledge base per batch. "
+            "Progress is checkpointed after every batch.",
+            advanced=True,
+            value=1000,
+        ),
+        BoolInput(
+            name="resume_ingestion",
+            display_name="Resume Interrupted Ingestion",
+            info="Continue from the last checkpoint when the same data is ingested again after a failure.",
+            advanced=True,
+            value=True,
+        ),
     ]
 
     # ------ Outputs -------------------------------------------------------
@@ -333,10 +350,52 @@ class KBIngestionComponent(Component):
 
         return metadata
 
+    def _ingestion_fingerprint(self, df_source: pd.DataFrame, config_list: list[dict[str, Any]]) -> str:
+        """Identify an ingestion run by its input data and column configuration."""
+        digest = hashlib.sha256(
+            json.dumps(
+                {"kb": self.knowledge_base, "columns": list(map(str, df_source.columns)), "config": config_list},
+                sort_keys=True,
+                default=str,
+            ).encode()
+        )
+        digest.update(str(len(df_source)).encode())
+        try:
+            digest.update(pd.util.hash_pandas_object(df_source, index=False).to_numpy().tobytes())
+        except TypeError:
+            # Unhashable cells (lists, dicts): fall back to shape and configuration only
+            pass
+        return digest.hexdigest()
+
+    def _load_checkpoint(self, checkpoint_path: Path, fingerprint: str) -> int:
+        """Return the number of rows already ingested for this fingerprint, or 0."""
+        if not self.resume_ingestion or not checkpoint_path.exists():
+            return 0
+        try:
+            checkpoint = json.loads(checkpoint_path.read_text())
+        except (OSError, ValueError) as e:
+            self.log(f"Ignoring unreadable ingestion checkpoint: {e}")
+            return 0
+        if checkpoint.get("fingerprint") != fingerprint:
+            return 0
+        return int(checkpoint.get("rows_done", 0))
+
+    def _save_checkpoint(self, checkpoint_path: Path, checkpoint: dict[str, Any]) -> None:
+        """Write the checkpoint atomically so a crash never leaves it half-written."""
+        tmp_path = checkpoint_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(checkpoint, indent=2))
+        os.replace(tmp_path, checkpoint_path)
+
     async def _create_vector_store(
         self, df_source: pd.DataFrame, config_list: list[dict[str, Any]], embedding_model: str, api_key: str
-    ) -> None:
-        """Create vector store following Local DB component pattern."""
+    ) -> dict[str, Any]:
+        """Create vector store following Local DB component pattern.
+
+        Rows are converted, embedded and written one batch at a time, so memory does not grow with the
+        size of the input. After every batch a checkpoint is saved in the knowledge base directory; if
+        ingestion fails, running the same data again resumes after the last completed batch.
+        """
+        progress: dict[str, Any] = {"rows_done": 0, "documents_added": 0, "resumed_from": 0}
         try:
             # Set up vector store directory
             vector_store_dir = await self._kb_path()
@@ -348,9 +407,6 @@ class KBIngestionComponent(Component):
             # Create embeddings model
             embedding_function = self._build_embeddings(embedding_model, api_key)
 
-            # Convert DataFrame to Data objects (following Local DB pattern)
-            data_objects = await self._convert_df_to_data_objects(df_source, config_list)
-
             # Create vector store
             chroma = Chroma(
                 persist_directory=str(vector_store_dir),
@@ -358,42 +414,55 @@ class KBIngestionComponent(Component):
                 collection_name=self.knowledge_base,
             )
 
-            # Convert Data objects to LangChain Documents
-            documents = []
-            for data_obj in data_objects:
-                doc = data_obj.to_lc_document()
-                documents.append(doc)
+            total_rows = len(df_source)
+            batch_size = max(1, self.ingest_batch_size or 1)
+            checkpoint_path = vector_store_dir / CHECKPOINT_FILENAME
+            fingerprint = self._ingestion_fingerprint(df_source, config_list)
+            rows_done = min(self._load_checkpoint(checkpoint_path, fingerprint), total_rows)
+            progress.update(rows_done=rows_done, resumed_from=rows_done)
+            if rows_done:
+                self.log(f"Resuming ingestion of '{self.knowledge_base}' at row {rows_done}/{total_rows}")
+
+            for start in range(rows_done, total_rows, batch_size):
+                batch_df = df_source.iloc[start : start + batch_size]
+
+                # Convert the batch to Data objects and LangChain Documents (following Local DB pattern)
+                data_objects = await self._convert_df_to_data_objects(batch_df, config_list, chroma=chroma)
+                documents = [data_obj.to_lc_document() for data_obj in data_objects]
+
+                # Each add is persisted by Chroma before the checkpoint moves past the batch
+                if documents:
+                    await asyncio.to_thread(chroma.add_documents, documents)
+
+                progress["rows_done"] = start + len(batch_df)
+                progress["documents_added"] += len(documents)
+                self._save_checkpoint(
+                    checkpoint_path,
+                    {
+                        "fingerprint": fingerprint,
+                        "rows_done": progress["rows_done"],
+                        "total_rows": total_rows,
+                        "updated_at": datetime.now(timezone.utc).isoformat(),
+                    },
+                )
+                self.log(
+                    f"Ingested {progress['rows_done']}/{total_rows} rows "
+                    f"({progress['rows_done'] / total_rows:.0%}) into '{self.knowledge_base}'"
+                )
 
-            # Add documents to vector store
-            if documents:
-                chroma.add_documents(documents)
-                self.log(f"Added {len(documents)} documents to vector store '{self.knowledge_base}'")
+            # The run is complete, so the next ingestion starts from scratch
+            checkpoint_path.unlink(missing_ok=True)
+            self.log(f"Added {progress['documents_added']} documents to vector store '{self.knowledge_base}'")
 
         except (OSError, ValueError, RuntimeError) as e:
-            self.log(f"Error creating vector store: {e}")
-
-    async def _convert_df_to_data_objects(
-        self, df_source: pd.DataFrame, config_list: list[dict[str, Any]]
-    ) -> list[Data]:
-        """Convert DataFrame to Data objects for vector store."""
-        data_objects: list[Data] = []
-
-        # Set up vector store directory
-        kb_path = await self._kb_path()
-
-        # If we don't allow duplicates, we need to get the existing hashes
-        chroma = Chroma(
-            persist_directory=str(kb_path),
-            collection_name=self.knowledge_base,
-        )
-
-        # Get all documents and their metadata
-        all_docs = chroma.get()
-
-        # Extract all _id values from metadata
-        id_list = [metadata.get("_id") for metadata in all_docs["metadatas"] if metadata.get("_id")]
+            self.log(
+                f"Error creating vector store after {progress['rows_done']} rows: {e}. "
+                "Run the ingestion again with the same data to resume."
+            )
+        return progress
 
-        # Get column roles
+    def _get_column_roles(self, config_list: list[dict[str, Any]]) -> tuple[list[str], list[str]]:
+        """Split configured columns into content (vectorized) and identifier columns."""
         content_cols = []
         identifier_cols = []
 
@@ -407,43 +476,92 @@ class KBIngestionComponent(Component):
             elif identifier:
                 identifier_cols.append(col_name)
 
-        # Convert each row to a Data object
-        for _, row in df_source.iterrows():
-            # Build content text from identifier columns using list comprehension
-            identifier_parts = [str(row[col]) for col in content_cols if col in row and pd.notna(row[col])]
+        return content_cols, identifier_cols
+
+    @staticmethod
+    def _column_as_str(column: pd.Series) -> list[str | None]:
+        """Stringify a column in one pass, with None for missing values."""
+        # Built explicitly: Series.where(..., None) yields NaN instead of None on pandas 3
+        return [
+            None if pd.api.types.is_scalar(value) and pd.isna(value) else str(value) for value in column.tolist()
+        ]
+
+    def _join_columns(self, df_source: pd.DataFrame, columns: list[str]) -> list[str]:
+        """Join the non-missing values of ``columns`` with spaces, column by column instead of row by row."""
+        frame = df_source.reset_index(drop=True)
+        joined = pd.Series("", index=frame.index, dtype=object)
+        started = pd.Series(False, index=frame.index)
+        for col in columns:
+            if col not in frame.columns:
+                continue
+            present = frame[col].notna()
+            values = frame[col].map(str, na_action="ignore").fillna("")
+            separator = started.map({True: " ", False: ""})
+            joined = joined.where(~present, joined + separator + values)
+            started |= present
+        return joined.tolist()
+
+    @staticmethod
+    def _hash_texts(texts: list[str]) -> list[str]:
+        """SHA-256 every text of a batch."""
+        sha256 = hashlib.sha256
+        return [sha256(text.encode()).hexdigest() for text in texts]
+
+    @staticmethod
+    def _get_existing_ids(chroma: Chroma, hashes: list[str], batch_size: int = 500) -> set[str]:
+        """Return which of ``hashes`` are already stored, querying only those ``_id`` values."""
+        existing: set[str] = set()
+        unique_hashes = list(dict.fromkeys(hashes))
+        for start in range(0, len(unique_hashes), batch_size):
+            batch = unique_hashes[start : start + batch_size]
+            result = chroma.get(where={"_id": {"$in": batch}}, include=["metadatas"])
+            existing.update(metadata["_id"] for metadata in result["metadatas"] if metadata and metadata.get("_id"))
+        return existing
+
+    async def _convert_df_to_data_objects(
+        self, df_source: pd.DataFrame, config_list: list[dict[str, Any]], chroma: Chroma | None = None
+    ) -> list[Data]:
+        """Convert DataFrame to Data objects for vector store."""
+        if chroma is None:
+            # Set up vector store directory
+            kb_path = await self._kb_path()
 
-            # Join all parts into a single string
-            page_content = " ".join(identifier_parts)
+            # If we don't allow duplicates, we need to get the existing hashes
+            chroma = Chroma(
+                persist_directory=str(kb_path),
+                collection_name=self.knowledge_base,
+            )
 
-            # Build metadata from NON-vectorized columns only (simple key-value pairs)
-            data_dict = {
-                "text": page_content,  # Main content for vectorization
-            }
+        # Get column roles
+        content_cols, identifier_cols = self._get_column_roles(config_list)
 
-            # Add identifier columns if they exist
-            if identifier_cols:
-                identifier_parts = [str(row[col]) for col in identifier_cols if col in row and pd.notna(row[col])]
-                page_content = " ".join(identifier_parts)
+        # Build content text from vectorized columns, and hash identifier columns when there are any
+        texts = self._join_columns(df_source, content_cols)
+        id_texts = self._join_columns(df_source, identifier_cols) if identifier_cols else texts
+        hashes = self._hash_texts(id_texts)
 
-            # Add metadata columns as simple key-value pairs
-            for col in df_source.columns:
-                if col not in content_cols and col in row and pd.notna(row[col]):
-                    # Convert to simple types for Chroma metadata
-                    value = row[col]
-                    data_dict[col] = str(value)  # Convert complex types to string
+        # Build metadata from NON-vectorized columns only (simple key-value pairs)
+        metadata_columns = [
+            (col, self._column_as_str(df_source[col])) for col in df_source.columns if col not in content_cols
+        ]
 
-            # Hash the page_content for unique ID
-            page_content_hash = hashlib.sha256(page_content.encode()).hexdigest()
-            data_dict["_id"] = page_content_hash
+        seen_ids = set() if self.allow_duplicates else self._get_existing_ids(chroma, hashes)
 
+        data_objects: list[Data] = []
+        for i, (page_content, page_content_hash) in enumerate(zip(texts, hashes)):
             # If duplicates are disallowed, and hash exists, prevent adding this row
-            if not self.allow_duplicates and page_content_hash in id_list:
-                self.log(f"Skipping duplicate row with hash {page_content_hash}")
-                continue
+            if not self.allow_duplicates:
+                if page_content_hash in seen_ids:
+                    self.log(f"Skipping duplicate row with hash {page_content_hash}")
+                    continue
+                seen_ids.add(page_content_hash)
+
+            data_dict = {"text": page_content}  # Main content for vectorization
+            data_dict.update({col: values[i] for col, values in metadata_columns if values[i] is not None})
+            data_dict["_id"] = page_content_hash
 
             # Create Data object - everything except "text" becomes metadata
-            data_obj = Data(data=data_dict)
-            data_objects.append(data_obj)
+            data_objects.append(Data(data=data_dict))
 
         return data_objects
 
@@ -537,7 +655,9 @@ class KBIngestionComponent(Component):
                 )
 
             # Create vector store following Local DB component pattern
-            await self._create_vector_store(df_source, config_list, embedding_model=embedding_model, api_key=api_key)
+            progress = await self._create_vector_store(
+                df_source, config_list, embedding_model=embedding_model, api_key=api_key
+            )
 
             # Save KB files (using File Component storage patterns)
             self._save_kb_files(kb_path, config_list)
@@ -547,6 +667,9 @@ class KBIngestionComponent(Component):
                 "kb_id": str(uuid.uuid4()),
                 "kb_name": self.knowledge_base,
                 "rows": len(df_source),
+                "rows_ingested": progress["rows_done"],
+                "documents_added": progress["documents_added"],
+                "resumed_from_row": progress["resumed_from"],
                 "column_metadata": column_metadata,
                 "path": str(kb_path),
                 "config_columns": len(config_list),
@@ -554,7 +677,13 @@ class KBIngestionComponent(Component):
             }
 
             # Set status message
-            self.status = f"✅ KB **{self.knowledge_base}** saved · {len(df_source)} chunks."
+            if progress["rows_done"] < len(df_source):
+                self.status = (
+                    f"⚠️ KB **{self.knowledge_base}** partially saved · "
+                    f"{progress['rows_done']}/{len(df_source)} chunks. Run again to resume."
+                )
+            else:
+                self.status = f"✅ KB **{self.knowledge_base}** saved · {len(df_source)} chunks."
 
             return Data(data=meta)
 
@@ -0,0 +1,245 @@
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from array import array
+from pathlib import Path
+
+from langchain_core.embeddings import Embeddings
+
+from lfx.base.embeddings.model import LCEmbeddingsModel
+from lfx.io import HandleInput, IntInput, Output, StrInput
+from lfx.schema.data import Data
+
+DEFAULT_CACHE_PATH = os.path.join(tempfile.gettempdir(), "langflow_embedding_cache.sqlite")
+
+# SQLite limits the number of bound parameters per statement
+SQLITE_BATCH_SIZE = 500
+
+
+class SQLiteCachedEmbeddings(Embeddings):
+    """Embeddings wrapper that stores vectors in SQLite, keyed by model id and text hash.
+
+    Vectors are stored as float32 blobs. When the cache grows beyond ``max_entries`` the least
+    recently used entries are evicted. Hit and miss counters are persisted per model id.
+    """
+
+    def __init__(self, embeddings: Embeddings, db_path: str, model_id: str, max_entries: int = 0):
+        self.embeddings = embeddings
+        self.db_path = str(Path(db_path).expanduser())
+        self.model_id = model_id
+        self.max_entries = max_entries
+        self.session_hits = 0
+        self.session_misses = 0
+        self._lock = threading.Lock()
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, model_id TEXT NOT NULL, vector BLOB NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_last_access ON embeddings (last_access)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_stats ("
+            "model_id TEXT PRIMARY KEY, hits INTEGER NOT NULL DEFAULT 0, misses INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.commit()
+
+    def _key(self, text: str, kind: str) -> str:
+        # Queries and documents are cached separately: some models embed them differently
+        return hashlib.sha256(f"{self.model_id}\0{kind}\0{text}".encode()).hexdigest()
+
+    def _lookup(self, keys: list[str]) -> dict[str, list[float]]:
+        found = {}
+        for start in range(0, len(keys), SQLITE_BATCH_SIZE):
+            batch = keys[start : start + SQLITE_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",  # noqa: S608
+                batch,
+            ).fetchall()
+            for key, blob in rows:
+                found[key] = array("f", blob).tolist()
+        return found
+
+    def _touch(self, keys: list[str], now: float) -> None:
+        for start in range(0, len(keys), SQLITE_BATCH_SIZE):
+            batch = keys[start : start + SQLITE_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            self._conn.execute(
+                f"UPDATE embeddings SET last_access = ? WHERE key IN ({placeholders})",  # noqa: S608
+                [now, *batch],
+            )
+
+    def _evict(self) -> None:
+        if self.max_entries <= 0:
+            return
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM embeddings WHERE key IN (SELECT key FROM embeddings ORDER BY last_access LIMIT ?)",
+                (overflow,),
+            )
+
+    def _record_stats(self, hits: int, misses: int) -> None:
+        self.session_hits += hits
+        self.session_misses += misses
+        self._conn.execute(
+            "INSERT INTO cache_stats (model_id, hits, misses) VALUES (?, ?, ?) "
+            "ON CONFLICT(model_id) DO UPDATE SET hits = hits + excluded.hits, misses = misses + excluded.misses",
+            (self.model_id, hits, misses),
+        )
+
+    def _embed(self, texts: list[str], kind: str, embed_missing) -> list[list[float]]:
+        keys = [self._key(text, kind) for text in texts]
+        unique_keys = list(dict.fromkeys(keys))
+
+        with self._lock:
+            cached = self._lookup(unique_keys)
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+
+        # Only texts that were never embedded with this model reach the provider
+        new_vectors = embed_missing(list(missing.values())) if missing else []
+
+        now = time.time()
+        with self._lock:
+            self._touch([key for key in unique_keys if key in cached], now)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, model_id, vector, last_access) VALUES (?, ?, ?, ?)",
+                [
+                    (key, self.model_id, array("f", vector).tobytes(), now)
+                    for key, vector in zip(missing, new_vectors)
+                ],
+            )
+            self._evict()
+            self._record_stats(len(texts) - len(missing), len(missing))
+            self._conn.commit()
+
+        cached.update(zip(missing, new_vectors))
+        return [cached[key] for key in keys]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self._embed(texts, "document", self.embeddings.embed_documents)
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._embed([text], "query", lambda texts: [self.embeddings.embed_query(texts[0])])[0]
+
+    def stats(self) -> dict:
+        """Return lifetime and current-session hit rates for this model id."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT hits, misses FROM cache_stats WHERE model_id = ?", (self.model_id,)
+            ).fetchone()
+            (entries,) = self._conn.execute(
+                "SELECT COUNT(*) FROM embeddings WHERE model_id = ?", (self.model_id,)
+            ).fetchone()
+        hits, misses = row or (0, 0)
+        session_total = self.session_hits + self.session_misses
+        return {
+            "model_id": self.model_id,
+            "cache_path": self.db_path,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "session_hits": self.session_hits,
+            "session_misses": self.session_misses,
+            "session_hit_rate": round(self.session_hits / session_total, 4) if session_total else 0.0,
+        }
+
+
+class CachedEmbeddingsComponent(LCEmbeddingsModel):
+    display_name = "Cached Embeddings"
+    description = (
+        "Wraps an embedding model with a persistent SQLite cache so unchanged texts are never re-embedded. "
+        "Connect it between any embedding model and a vector store."
+    )
+    icon = "database"
+    name = "CachedEmbeddings"
+
+    inputs = [
+        HandleInput(
+            name="embedding",
+            display_name="Embedding Model",
+            input_types=["Embeddings"],
+            info="The embedding model whose results are cached.",
+            required=True,
+        ),
+        StrInput(
+            name="model_id",
+            display_name="Model ID",
+            info=(
+                "Identifier used to key the cache. Leave empty to derive it from the embedding model class and "
+                "model name. Change it whenever the model or its settings (e.g. dimensions) change."
+            ),
+            value="",
+        ),
+        StrInput(
+            name="cache_path",
+            display_name="Cache Path",
+            info="Path of the SQLite cache file. Defaults to a file in the system temp directory.",
+            value="",
+            advanced=True,
+        ),
+        IntInput(
+            name="max_entries",
+            display_name="Max Entries",
+            info="Maximum number of cached vectors across all models. Least recently used entries are evicted. "
+            "Use 0 for no limit.",
+            value=1000000,
+            advanced=True,
+        ),
+    ]
+
+    outputs = [
+        *LCEmbeddingsModel.outputs,
+        Output(display_name="Cache Stats", name="cache_stats", method="get_cache_stats"),
+    ]
+
+    def _resolve_model_id(self) -> str:
+        if self.model_id and self.model_id.strip():
+            return self.model_id.strip()
+        model_name = next(
+            (
+                getattr(self.embedding, attribute)
+                for attribute in ("model", "model_name", "model_id", "deployment")
+                if getattr(self.embedding, attribute, None)
+            ),
+            "default",
+        )
+        dimensions = getattr(self.embedding, "dimensions", None)
+        suffix = f":{dimensions}" if dimensions else ""
+        return f"{type(self.embedding).__name__}:{model_name}{suffix}"
+
+    def _get_cached_embeddings(self) -> SQLiteCachedEmbeddings:
+        if getattr(self, "_cached_embeddings", None) is None:
+            self._cached_embeddings = SQLiteCachedEmbeddings(
+                embeddings=self.embedding,
+                db_path=(self.cache_path or "").strip() or DEFAULT_CACHE_PATH,
+                model_id=self._resolve_model_id(),
+                max_entries=max(0, int(self.max_entries or 0)),
+            )
+        return self._cached_embeddings
+
+    def build_embeddings(self) -> Embeddings:
+        cached_embeddings = self._get_cached_embeddings()
+        stats = cached_embeddings.stats()
+        self.status = (
+            f"{stats['model_id']}: {stats['entries']} cached vectors, "
+            f"lifetime hit rate {stats['hit_rate']:.1%} ({stats['hits']} hits / {stats['misses']} misses)"
+        )
+        return cached_embeddings
+
+    def get_cache_stats(self) -> Data:
+        stats = self._get_cached_embeddings().stats()
+        self.status = stats
+        return Data(data=stats)
@@ -0,0 +1,284 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.embeddings import Embeddings
+
+from lfx.base.embeddings.model import LCEmbeddingsModel
+from lfx.io import HandleInput, IntInput
+
+RATE_LIMIT_MARKERS = ("429", "rate limit", "ratelimit", "too many requests", "quota")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token), used when tiktoken is unavailable."""
+    return max(1, len(text) // 4)
+
+
+def get_token_counter():
+    try:
+        import tiktoken
+    except ImportError:
+        return estimate_tokens
+    encoding = tiktoken.get_encoding("cl100k_base")
+    return lambda text: max(1, len(encoding.encode(text, disallowed_special=())))
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``per_minute / 60`` units per second.
+
+    The state is guarded by a thread lock rather than an ``asyncio.Lock`` so a single bucket can be
+    shared by every call, even though each synchronous call runs its own event loop.
+    """
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self, amount: int) -> None:
+        # A single request larger than the whole budget can only wait for a full bucket
+        amount = min(float(amount), self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                wait = (amount - self.tokens) / self.rate
+            await asyncio.sleep(wait)
+
+
+class RateLimitedEmbeddings(Embeddings):
+    """Embeddings wrapper that schedules batches under tokens/requests-per-minute limits.
+
+    Texts are split into batches bounded by both text count and estimated tokens. Batches run with
+    bounded async concurrency. Rate-limit and transient errors are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        max_batch_texts: int = 256,
+        max_batch_tokens: int = 8000,
+        max_concurrency: int = 4,
+        tokens_per_minute: int = 0,
+        requests_per_minute: int = 0,
+        max_retries: int = 6,
+        on_stats=None,
+    ):
+        self.embeddings = embeddings
+        # Called with stats() after every embed_documents call, e.g. to log throughput
+        self.on_stats = on_stats
+        self.max_batch_texts = max(1, max_batch_texts)
+        self.max_batch_tokens = max(1, max_batch_tokens)
+        self.max_concurrency = max(1, max_concurrency)
+        self.tokens_per_minute = max(0, tokens_per_minute)
+        self.requests_per_minute = max(0, requests_per_minute)
+        self.max_retries = max(0, max_retries)
+        self.count_tokens = get_token_counter()
+        # Shared by all calls so the per-minute budgets hold across batches, not just within one call
+        self.token_bucket = TokenBucket(self.tokens_per_minute) if self.tokens_per_minute else None
+        self.request_bucket = TokenBucket(self.requests_per_minute) if self.requests_per_minute else None
+        self.total_embeddings = 0
+        self.total_tokens = 0
+        self.total_batches = 0
+        self.total_retries = 0
+        self.total_seconds = 0.0
+
+    def make_batches(self, texts: list[str]) -> list[tuple[list[int], int]]:
+        """Group text positions into batches, returning (positions, estimated tokens) per batch."""
+        batches = []
+        positions: list[int] = []
+        batch_tokens = 0
+        for position, text in enumerate(texts):
+            tokens = self.count_tokens(text)
+            if positions and (
+                len(positions) >= self.max_batch_texts or batch_tokens + tokens > self.max_batch_tokens
+            ):
+                batches.append((positions, batch_tokens))
+                positions, batch_tokens = [], 0
+            positions.append(position)
+            batch_tokens += tokens
+        if positions:
+            batches.append((positions, batch_tokens))
+        return batches
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+        if status is not None:
+            return status == 429 or status >= 500
+        message = f"{type(error).__name__} {error}".lower()
+        return any(marker in message for marker in RATE_LIMIT_MARKERS) or isinstance(
+            error, (TimeoutError, ConnectionError)
+        )
+
+    async def _call_with_limits(self, call, tokens, semaphore):
+        """Await ``call()`` once both per-minute budgets allow it, retrying rate-limit and transient errors."""
+        attempt = 0
+        while True:
+            if self.token_bucket is not None:
+                await self.token_bucket.acquire(tokens)
+            if self.request_bucket is not None:
+                await self.request_bucket.acquire(1)
+            try:
+                async with semaphore:
+                    return await call()
+            except Exception as e:
+                if attempt >= self.max_retries or not self.is_retryable(e):
+                    raise
+                self.total_retries += 1
+                await asyncio.sleep(min(60.0, 2**attempt) + random.uniform(0, 1))
+                attempt += 1
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        batches = self.make_batches(texts)
+        results = await asyncio.gather(
+            *[
+                self._call_with_limits(
+                    lambda batch=[texts[position] for position in positions]: self.embeddings.aembed_documents(batch),
+                    tokens,
+                    semaphore,
+                )
+                for positions, tokens in batches
+            ]
+        )
+
+        vectors: list[list[float]] = [[] for _ in texts]
+        for (positions, _), batch_vectors in zip(batches, results):
+            for position, vector in zip(positions, batch_vectors):
+                vectors[position] = vector
+
+        self.total_embeddings += len(texts)
+        self.total_tokens += sum(tokens for _, tokens in batches)
+        self.total_batches += len(batches)
+        self.total_seconds += time.perf_counter() - start
+        if self.on_stats is not None:
+            self.on_stats(self.stats())
+        return vectors
+
+    @staticmethod
+    def _run(coroutine):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        # Called synchronously from inside an event loop: run the scheduler on its own loop in a worker thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self._run(self.aembed_documents(texts))
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._run(self.aembed_query(text))
+
+    async def aembed_query(self, text: str) -> list[float]:
+        # Queries share the same key and per-minute budgets as document batches
+        return await self._call_with_limits(
+            lambda: self.embeddings.aembed_query(text), self.count_tokens(text), asyncio.Semaphore(1)
+        )
+
+    def stats(self) -> dict:
+        return {
+            "embeddings": self.total_embeddings,
+            "estimated_tokens": self.total_tokens,
+            "batches": self.total_batches,
+            "retries": self.total_retries,
+            "seconds": round(self.total_seconds, 3),
+            "embeddings_per_second": round(self.total_embeddings / self.total_seconds, 2)
+            if self.total_seconds
+            else 0.0,
+        }
+
+
+class RateLimitedEmbeddingsComponent(LCEmbeddingsModel):
+    display_name = "Rate-Limited Embeddings"
+    description = (
+        "Schedules embedding requests in token-budgeted batches with bounded concurrency under "
+        "tokens/requests-per-minute limits, retrying rate-limit errors with backoff."
+    )
+    icon = "gauge"
+    name = "RateLimitedEmbeddings"
+
+    inputs = [
+        HandleInput(
+            name="embedding",
+            display_name="Embedding Model",
+            input_types=["Embeddings"],
+            info="The embedding model whose requests are scheduled.",
+            required=True,
+        ),
+        IntInput(
+            name="tokens_per_minute",
+            display_name="Tokens per Minute",
+            info="Provider token limit per minute. Use 0 for no limit.",
+            value=1000000,
+        ),
+        IntInput(
+            name="requests_per_minute",
+            display_name="Requests per Minute",
+            info="Provider request limit per minute. Use 0 for no limit.",
+            value=3000,
+        ),
+        IntInput(
+            name="max_batch_tokens",
+            display_name="Max Tokens per Batch",
+            info="Maximum estimated tokens sent in a single embedding request.",
+            value=8000,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_batch_texts",
+            display_name="Max Texts per Batch",
+            info="Maximum number of texts sent in a single embedding request.",
+            value=256,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of embedding requests in flight at once.",
+            value=4,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_retries",
+            display_name="Max Retries",
+            info="Retries with exponential backoff for rate-limit (429) and transient errors.",
+            value=6,
+            advanced=True,
+        ),
+    ]
+
+    def _report_stats(self, stats: dict) -> None:
+        message = (
+            f"{stats['embeddings']} embeddings in {stats['batches']} batches, "
+            f"{stats['embeddings_per_second']} embeddings/sec, {stats['retries']} retries"
+        )
+        self.status = message
+        self.log(message)
+
+    def build_embeddings(self) -> Embeddings:
+        return RateLimitedEmbeddings(
+            embeddings=self.embedding,
+            max_batch_texts=int(self.max_batch_texts or 256),
+            max_batch_tokens=int(self.max_batch_tokens or 8000),
+            max_concurrency=int(self.max_concurrency or 4),
+            tokens_per_minute=int(self.tokens_per_minute or 0),
+            requests_per_minute=int(self.requests_per_minute or 0),
+            max_retries=int(self.max_retries or 0),
+            on_stats=self._report_stats,
+        )
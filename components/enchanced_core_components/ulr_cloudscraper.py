@@ -1,4 +1,13 @@
+import hashlib
+import json
+import os
 import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import cloudscraper
 from bs4 import BeautifulSoup
 from langchain_community.document_loaders import RecursiveUrlLoader
@@ -14,6 +23,7 @@ from lfx.io import (
     MessageTextInput,
     Output,
     SliderInput,
+    StrInput,
     TableInput,
 )
 from lfx.schema.dataframe import DataFrame
@@ -23,6 +33,8 @@ from lfx.services.deps import get_settings_service
 DEFAULT_TIMEOUT = 30
 DEFAULT_MAX_DEPTH = 1
 DEFAULT_FORMAT = "Text"
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "langflow_url_cache")
 
 URL_REGEX = re.compile(
     r"^(https?:\/\/)?" r"(www\.)?" r"([a-zA-Z0-9.-]+)" r"(\.[a-zA-Z]{2,})?" r"(:\d+)?" r"(\/[^\s]*)?$",
@@ -30,6 +42,133 @@ URL_REGEX = re.compile(
 )
 
 
+class HTTPDiskCache:
+    """Small RFC 7234-style on-disk HTTP cache.
+
+    Responses are stored per URL and request headers with their validators. Entries are served without
+    a request while ``Cache-Control: max-age`` says they are fresh, and revalidated with ``If-None-Match`` /
+    ``If-Modified-Since`` otherwise. ``no-store``, ``private`` and ``Vary: *`` responses are never written,
+    and requests that carry credentials bypass the cache entirely.
+    """
+
+    STORED_HEADERS = ("content-type", "etag", "last-modified")
+    # Responses to these requests belong to one user and must never be served to another
+    CREDENTIAL_HEADERS = ("authorization", "proxy-authorization", "cookie")
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def _paths(self, url, headers):
+        # Every request header is part of the key, so each value of a header named by Vary gets its own entry
+        canonical_headers = json.dumps(sorted((name.lower(), str(value)) for name, value in headers.items()))
+        key = hashlib.sha256(f"{url}\0{canonical_headers}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    @staticmethod
+    def _parse_cache_control(headers):
+        directives = {}
+        for part in (headers.get("cache-control") or "").split(","):
+            name, _, value = part.strip().partition("=")
+            if name:
+                directives[name.lower()] = value.strip('"')
+        return directives
+
+    def _max_age(self, headers):
+        directives = self._parse_cache_control(headers)
+        if "no-cache" in directives:
+            return 0
+        try:
+            return max(0, int(directives.get("max-age", 0)))
+        except ValueError:
+            return 0
+
+    def _is_storable(self, headers):
+        directives = self._parse_cache_control(headers)
+        if "no-store" in directives or "private" in directives:
+            return False
+        return "*" not in (headers.get("vary") or "")
+
+    def _write_atomic(self, path, payload):
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+
+    def _load(self, paths):
+        meta_path, body_path = paths
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8")), body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, paths, url, headers, body):
+        if not self._is_storable(headers):
+            return
+        meta_path, body_path = paths
+        meta = {
+            "url": url,
+            "stored_at": time.time(),
+            "max_age": self._max_age(headers),
+            "headers": {name: headers[name] for name in self.STORED_HEADERS if headers.get(name)},
+        }
+        self._write_atomic(body_path, body)
+        self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def _refresh(self, paths, meta, headers):
+        meta["stored_at"] = time.time()
+        meta["max_age"] = self._max_age(headers)
+        for name in ("etag", "last-modified"):
+            if headers.get(name):
+                meta["headers"][name] = headers[name]
+        self._write_atomic(paths[0], json.dumps(meta).encode("utf-8"))
+
+    def get(self, fetch, url, headers):
+        """Fetch ``url`` through the cache.
+
+        ``fetch(url, headers)`` must return a requests/httpx style response. Returns the body bytes,
+        the stored response headers and the cache status ("hit", "revalidated", "miss" or "bypass").
+        """
+        request_headers = dict(headers)
+        if any(name.lower() in self.CREDENTIAL_HEADERS for name in request_headers):
+            response = fetch(url, request_headers)
+            response.raise_for_status()
+            stored_headers = {
+                name: response.headers[name] for name in self.STORED_HEADERS if response.headers.get(name)
+            }
+            return response.content, stored_headers, "bypass"
+
+        paths = self._paths(url, request_headers)
+        entry = self._load(paths)
+        if entry is not None:
+            meta, body = entry
+            if time.time() - meta.get("stored_at", 0) < meta.get("max_age", 0):
+                return body, meta["headers"], "hit"
+            if meta["headers"].get("etag"):
+                request_headers["If-None-Match"] = meta["headers"]["etag"]
+            if meta["headers"].get("last-modified"):
+                request_headers["If-Modified-Since"] = meta["headers"]["last-modified"]
+
+        response = fetch(url, request_headers)
+        if entry is not None and response.status_code == 304:
+            self._refresh(paths, meta, response.headers)
+            return body, meta["headers"], "revalidated"
+
+        response.raise_for_status()
+        self._store(paths, url, response.headers, response.content)
+        stored_headers = {name: response.headers[name] for name in self.STORED_HEADERS if response.headers.get(name)}
+        return response.content, stored_headers, "miss"
+
+
+def user_cache_dir(user_id=None) -> str:
+    """Cache folder private to one Langflow user (or OS user), so cached pages are never shared across users."""
+    if user_id:
+        owner = f"user:{user_id}"
+    else:
+        owner = f"os:{os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', '')}"
+    return os.path.join(DEFAULT_CACHE_DIR, hashlib.sha256(owner.encode("utf-8")).hexdigest()[:16])
+
 class URLComponent(Component):
     display_name = "URL"
     description = "Fetch content from one or more web pages, including those protected by Cloudflare."
@@ -98,6 +237,27 @@ class URLComponent(Component):
         BoolInput(name="continue_on_failure", display_name="Continue on Failure", value=True, advanced=True),
         BoolInput(name="check_response_status", display_name="Check Response Status", value=False, advanced=True),
         BoolInput(name="autoset_encoding", display_name="Autoset Encoding", value=True, advanced=True),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of URLs fetched in parallel over a shared connection pool.",
+            value=DEFAULT_MAX_CONCURRENCY,
+            advanced=True,
+        ),
+        BoolInput(
+            name="use_cache",
+            display_name="Use HTTP Cache",
+            info="Cache responses on disk and revalidate them with ETag/Last-Modified instead of re-downloading.",
+            value=True,
+            advanced=True,
+        ),
+        StrInput(
+            name="cache_dir",
+            display_name="Cache Directory",
+            info="Directory for the HTTP cache. Defaults to a per-user folder in the system temp directory.",
+            value="",
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -117,12 +277,46 @@ class URLComponent(Component):
             raise ValueError(f"Invalid URL: {url}")
         return url
 
-    def cloudflare_request(self, url: str, headers: dict, timeout: int) -> str:
+    def create_scraper(self, pool_size: int):
+        """Create one scraper whose connection pool is shared by all fetch workers."""
         scraper = cloudscraper.create_scraper()
+        # Keep cloudscraper's own TLS adapters and only widen their per-host pools
+        for adapter in scraper.adapters.values():
+            adapter.poolmanager.connection_pool_kw["maxsize"] = pool_size
+        return scraper
+
+    def cloudflare_request(self, url: str, headers: dict, timeout: int, scraper=None) -> str:
+        scraper = scraper or cloudscraper.create_scraper()
         response = scraper.get(url, headers=headers, timeout=timeout)
         response.raise_for_status()
         return response.text
 
+    def get_cache(self) -> HTTPDiskCache | None:
+        if not getattr(self, "use_cache", True):
+            return None
+        cache_dir = (getattr(self, "cache_dir", "") or "").strip()
+        if not cache_dir:
+            try:
+                user_id = self.user_id
+            except Exception:  # noqa: BLE001
+                user_id = None
+            cache_dir = user_cache_dir(user_id)
+        return HTTPDiskCache(cache_dir)
+
+    def cached_request(self, url: str, headers: dict, timeout: int, scraper, cache: HTTPDiskCache) -> tuple[str, str]:
+        """Fetch a page through the HTTP cache and return its decoded text and the cache status."""
+
+        def fetch(request_url, request_headers):
+            return scraper.get(request_url, headers=request_headers, timeout=timeout)
+
+        body, response_headers, cache_status = cache.get(fetch, url, headers)
+        charset_match = re.search(r"charset=([\w-]+)", response_headers.get("content-type", ""), re.IGNORECASE)
+        encoding = charset_match.group(1) if charset_match else "utf-8"
+        try:
+            return body.decode(encoding, errors="replace"), cache_status
+        except LookupError:
+            return body.decode("utf-8", errors="replace"), cache_status
+
     def fetch_url_contents(self) -> list[dict]:
         urls = list({self.ensure_url(url) for url in self.urls if url.strip()})
         if not urls:
@@ -131,23 +325,44 @@ class URLComponent(Component):
         headers_dict = {header["key"]: header["value"] for header in self.headers}
         extractor = (lambda x: x) if self.format == "HTML" else (lambda x: BeautifulSoup(x, "lxml").get_text())
 
-        all_docs = []
-        for url in urls:
+        max_concurrency = max(1, int(getattr(self, "max_concurrency", DEFAULT_MAX_CONCURRENCY) or 1))
+        scraper = self.create_scraper(max_concurrency)
+        cache = self.get_cache()
+
+        def fetch_one(url: str):
+            start = time.perf_counter()
             try:
-                raw_html = self.cloudflare_request(url, headers_dict, self.timeout)
+                if cache is None:
+                    raw_html = self.cloudflare_request(url, headers_dict, self.timeout, scraper=scraper)
+                    cache_status = "disabled"
+                else:
+                    raw_html, cache_status = self.cached_request(url, headers_dict, self.timeout, scraper, cache)
+                fetch_time_ms = round((time.perf_counter() - start) * 1000, 2)
                 extracted = extractor(raw_html)
-                all_docs.append({
-                    "text": safe_convert(extracted, clean_data=True),
-                    "url": url,
-                    "title": "",
-                    "description": "",
-                    "content_type": "text/html",
-                    "language": "",
-                })
             except Exception as e:
-                self.log(f"Failed to fetch {url}: {e}")
+                return None, e
+            return {
+                "text": safe_convert(extracted, clean_data=True),
+                "url": url,
+                "title": "",
+                "description": "",
+                "content_type": "text/html",
+                "language": "",
+                "fetch_time_ms": fetch_time_ms,
+                "cache_status": cache_status,
+            }, None
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(urls))) as executor:
+            results = list(executor.map(fetch_one, urls))
+
+        all_docs = []
+        for url, (doc, error) in zip(urls, results):
+            if error is not None:
+                self.log(f"Failed to fetch {url}: {error}")
                 if not self.continue_on_failure:
-                    raise
+                    raise error
+                continue
+            all_docs.append(doc)
         if not all_docs:
             raise ValueError("No documents were successfully loaded from any URL")
         return all_docs
@@ -1,5 +1,14 @@
 import re
 import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import httpx
 from bs4 import BeautifulSoup
 from langchain_community.document_loaders import RecursiveUrlLoader
@@ -10,7 +19,7 @@ import io
 from lfx.custom.custom_component.component import Component
 from lfx.helpers.data import data_to_text
 from lfx.inputs.inputs import TableInput
-from lfx.io import BoolInput, DropdownInput, IntInput, MessageTextInput, Output
+from lfx.io import BoolInput, DropdownInput, IntInput, MessageTextInput, Output, StrInput
 from lfx.schema import Data
 from lfx.schema.dataframe import DataFrame
 from lfx.schema.message import Message
@@ -43,6 +52,137 @@ def try_decode_content(content):
         except Exception:
             return f"[binary content, {len(content)} bytes]"
 
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "langflow_url_cache")
+
+
+class HTTPDiskCache:
+    """Small RFC 7234-style on-disk HTTP cache.
+
+    Responses are stored per URL and request headers with their validators. Entries are served without
+    a request while ``Cache-Control: max-age`` says they are fresh, and revalidated with ``If-None-Match`` /
+    ``If-Modified-Since`` otherwise. ``no-store``, ``private`` and ``Vary: *`` responses are never written,
+    and requests that carry credentials bypass the cache entirely.
+    """
+
+    STORED_HEADERS = ("content-type", "etag", "last-modified")
+    # Responses to these requests belong to one user and must never be served to another
+    CREDENTIAL_HEADERS = ("authorization", "proxy-authorization", "cookie")
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def _paths(self, url, headers):
+        # Every request header is part of the key, so each value of a header named by Vary gets its own entry
+        canonical_headers = json.dumps(sorted((name.lower(), str(value)) for name, value in headers.items()))
+        key = hashlib.sha256(f"{url}\0{canonical_headers}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    @staticmethod
+    def _parse_cache_control(headers):
+        directives = {}
+        for part in (headers.get("cache-control") or "").split(","):
+            name, _, value = part.strip().partition("=")
+            if name:
+                directives[name.lower()] = value.strip('"')
+        return directives
+
+    def _max_age(self, headers):
+        directives = self._parse_cache_control(headers)
+        if "no-cache" in directives:
+            return 0
+        try:
+            return max(0, int(directives.get("max-age", 0)))
+        except ValueError:
+            return 0
+
+    def _is_storable(self, headers):
+        directives = self._parse_cache_control(headers)
+        if "no-store" in directives or "private" in directives:
+            return False
+        return "*" not in (headers.get("vary") or "")
+
+    def _write_atomic(self, path, payload):
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+
+    def _load(self, paths):
+        meta_path, body_path = paths
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8")), body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, paths, url, headers, body):
+        if not self._is_storable(headers):
+            return
+        meta_path, body_path = paths
+        meta = {
+            "url": url,
+            "stored_at": time.time(),
+            "max_age": self._max_age(headers),
+            "headers": {name: headers[name] for name in self.STORED_HEADERS if headers.get(name)},
+        }
+        self._write_atomic(body_path, body)
+        self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def _refresh(self, paths, meta, headers):
+        meta["stored_at"] = time.time()
+        meta["max_age"] = self._max_age(headers)
+        for name in ("etag", "last-modified"):
+            if headers.get(name):
+                meta["headers"][name] = headers[name]
+        self._write_atomic(paths[0], json.dumps(meta).encode("utf-8"))
+
+    def get(self, fetch, url, headers):
+        """Fetch ``url`` through the cache.
+
+        ``fetch(url, headers)`` must return a requests/httpx style response. Returns the body bytes,
+        the stored response headers and the cache status ("hit", "revalidated", "miss" or "bypass").
+        """
+        request_headers = dict(headers)
+        if any(name.lower() in self.CREDENTIAL_HEADERS for name in request_headers):
+            response = fetch(url, request_headers)
+            response.raise_for_status()
+            stored_headers = {
+                name: response.headers[name] for name in self.STORED_HEADERS if response.headers.get(name)
+            }
+            return response.content, stored_headers, "bypass"
+
+        paths = self._paths(url, request_headers)
+        entry = self._load(paths)
+        if entry is not None:
+            meta, body = entry
+            if time.time() - meta.get("stored_at", 0) < meta.get("max_age", 0):
+                return body, meta["headers"], "hit"
+            if meta["headers"].get("etag"):
+                request_headers["If-None-Match"] = meta["headers"]["etag"]
+            if meta["headers"].get("last-modified"):
+                request_headers["If-Modified-Since"] = meta["headers"]["last-modified"]
+
+        response = fetch(url, request_headers)
+        if entry is not None and response.status_code == 304:
+            self._refresh(paths, meta, response.headers)
+            return body, meta["headers"], "revalidated"
+
+        response.raise_for_status()
+        self._store(paths, url, response.headers, response.content)
+        stored_headers = {name: response.headers[name] for name in self.STORED_HEADERS if response.headers.get(name)}
+        return response.content, stored_headers, "miss"
+
+
+def user_cache_dir(user_id=None) -> str:
+    """Cache folder private to one Langflow user (or OS user), so cached pages are never shared across users."""
+    if user_id:
+        owner = f"user:{user_id}"
+    else:
+        owner = f"os:{os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', '')}"
+    return os.path.join(DEFAULT_CACHE_DIR, hashlib.sha256(owner.encode("utf-8")).hexdigest()[:16])
+
 class URLComponent(Component):
     """A component that loads and parses child links from a root URL recursively."""
 
@@ -134,6 +274,33 @@ class URLComponent(Component):
             advanced=True,
             input_types=["DataFrame"],
         ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of URLs loaded in parallel. PDF downloads share one connection pool.",
+            value=8,
+            required=False,
+            advanced=True,
+        ),
+        BoolInput(
+            name="use_cache",
+            display_name="Use HTTP Cache",
+            info=(
+                "Cache downloaded PDFs on disk and revalidate them with ETag/Last-Modified "
+                "instead of downloading them again on every run."
+            ),
+            value=True,
+            required=False,
+            advanced=True,
+        ),
+        StrInput(
+            name="cache_dir",
+            display_name="Cache Directory",
+            info="Directory for the HTTP cache. Defaults to a per-user folder in the system temp directory.",
+            value="",
+            required=False,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -161,16 +328,139 @@ class URLComponent(Component):
 
         return url
 
-    def baixar_pdf_binario(self, url, headers=None, timeout=30):
-        logger.error(f"Baixando PDF binário de: {url}")
-        resp = httpx.get(url, headers=headers, timeout=timeout)
-        resp.raise_for_status()
-        logger.error(f"Download concluído, tamanho: {len(resp.content)} bytes")
-        return resp.content
+    def baixar_pdf_binario(self, url, headers=None, timeout=30, client=None, cache=None):
+        """Download a PDF, reusing the shared client and the on-disk cache when available.
+
+        Returns the PDF bytes and the cache status.
+        """
+        logger.info(f"Baixando PDF binário de: {url}")
+
+        def fetch(request_url, request_headers):
+            if client is not None:
+                return client.get(request_url, headers=request_headers)
+            return httpx.get(request_url, headers=request_headers, timeout=timeout)
+
+        if cache is not None:
+            content, _, cache_status = cache.get(fetch, url, headers or {})
+        else:
+            resp = fetch(url, headers or {})
+            resp.raise_for_status()
+            content, cache_status = resp.content, "disabled"
+        logger.info(f"Download concluído, tamanho: {len(content)} bytes ({cache_status})")
+        return content, cache_status
+
+    def extract_pdf_text(self, pdf_bytes: bytes) -> str:
+        """Extract the text of every page of a PDF."""
+        reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+        return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+    def extract_html(self, content) -> str:
+        """Return clean text or raw HTML depending on the selected output format."""
+        content = try_decode_content(content) if isinstance(content, bytes) else content
+        if self.format == "HTML":
+            return content
+        return BeautifulSoup(content, "lxml").get_text()
+
+    def get_cache(self) -> HTTPDiskCache | None:
+        if not getattr(self, "use_cache", True):
+            return None
+        cache_dir = (getattr(self, "cache_dir", "") or "").strip()
+        if not cache_dir:
+            try:
+                user_id = self.user_id
+            except Exception:  # noqa: BLE001
+                user_id = None
+            cache_dir = user_cache_dir(user_id)
+        return HTTPDiskCache(cache_dir)
+
+    def load_url(self, processed_url, headers_dict, single_url, client, cache) -> list[Data]:
+        """Load a single URL (PDF download or recursive crawl) and return its documents."""
+        msg = f"Loading documents from {processed_url}"
+        logger.info(msg)
+        start = time.perf_counter()
+
+        # Se for PDF do Supabase ou terminar com .pdf, baixe como binário
+        if processed_url.endswith('.pdf') or 'supabase.co/storage/' in processed_url:
+            try:
+                pdf_bytes, cache_status = self.baixar_pdf_binario(
+                    processed_url, headers=headers_dict, timeout=self.timeout, client=client, cache=cache
+                )
+                fetch_time_ms = round((time.perf_counter() - start) * 1000, 2)
+                logger.info(f"PDF processado e texto extraído de {processed_url}")
+                return [
+                    Data(
+                        text=self.extract_pdf_text(pdf_bytes),
+                        url=processed_url,
+                        fetch_time_ms=fetch_time_ms,
+                        cache_status=cache_status,
+                    )
+                ]
+            except Exception as e:
+                logger.error(f"Erro ao baixar ou extrair PDF de {processed_url}: {e}")
+                return [
+                    Data(
+                        text=f"[Erro ao baixar ou extrair PDF: {e}]",
+                        url=processed_url,
+                        fetch_time_ms=round((time.perf_counter() - start) * 1000, 2),
+                        cache_status="error",
+                    )
+                ]
+
+        # Caso contrário, use o loader normalmente
+        loader = RecursiveUrlLoader(
+            url=processed_url,
+            max_depth=self.max_depth,
+            prevent_outside=self.prevent_outside,
+            use_async=self.use_async,
+            continue_on_failure=not single_url,
+            extractor=self.extract_html,
+            timeout=self.timeout,
+            headers=headers_dict,
+        )
+
+        docs = []
+        try:
+            docs = loader.load()
+            if not docs:
+                msg = f"No documents found for {processed_url}"
+                logger.warning(msg)
+                if single_url:
+                    message = f"No documents found for {processed_url}"
+                    raise ValueError(message)
+            else:
+                msg = f"Found {len(docs)} documents from {processed_url}"
+                logger.info(msg)
+        except (httpx.HTTPError, httpx.RequestError) as e:
+            msg = f"Error loading documents from {processed_url}: {e}"
+            logger.error(msg)
+            if single_url:
+                raise
+        except UnicodeDecodeError as e:
+            msg = f"Error decoding content from {processed_url}: {e}"
+            logger.error(msg)
+            return [
+                Data(
+                    text=f"[decode error] {e}",
+                    url=processed_url,
+                    fetch_time_ms=round((time.perf_counter() - start) * 1000, 2),
+                    cache_status="error",
+                )
+            ]
+        except Exception as e:
+            msg = f"Unexpected error loading documents from {processed_url}: {e}"
+            logger.error(msg)
+            if single_url:
+                raise
+
+        # The loader already ran the extractor on each page
+        fetch_time_ms = round((time.perf_counter() - start) * 1000, 2)
+        return [
+            Data(text=doc.page_content, **{**doc.metadata, "fetch_time_ms": fetch_time_ms, "cache_status": "bypass"})
+            for doc in docs
+        ]
 
     def fetch_content(self) -> list[Data]:
         """Load documents from the URLs."""
-        all_docs = []
         data = []
         try:
             urls = list({self.ensure_url(url.strip()) for url in self.urls if url.strip()})
@@ -180,68 +470,18 @@ class URLComponent(Component):
                 raise ValueError(no_urls_msg)
 
             single_url = len(urls) == 1
+            headers_dict = {header["key"]: header["value"] for header in self.headers}
+            max_concurrency = max(1, int(getattr(self, "max_concurrency", 8) or 1))
+            cache = self.get_cache()
 
-            for processed_url in urls:
-                msg = f"Loading documents from {processed_url}"
-                logger.info(msg)
-
-                headers_dict = {header["key"]: header["value"] for header in self.headers}
-
-                # Se for PDF do Supabase ou terminar com .pdf, baixe como binário
-                if processed_url.endswith('.pdf') or 'supabase.co/storage/' in processed_url:
-                    try:
-                        pdf_bytes = self.baixar_pdf_binario(processed_url, headers=headers_dict, timeout=self.timeout)
-                        data.append(Data(text=extractor(pdf_bytes), url=processed_url))
-                        logger.error(f"PDF processado e texto extraído de {processed_url}")
-                    except Exception as e:
-                        logger.error(f"Erro ao baixar ou extrair PDF de {processed_url}: {e}")
-                        data.append(Data(text=f"[Erro ao baixar ou extrair PDF: {e}]", url=processed_url))
-                    continue
-
-                # Caso contrário, use o loader normalmente
-                loader = RecursiveUrlLoader(
-                    url=processed_url,
-                    max_depth=self.max_depth,
-                    prevent_outside=self.prevent_outside,
-                    use_async=self.use_async,
-                    continue_on_failure=not single_url,
-                    extractor=extractor,
-                    timeout=self.timeout,
-                    headers=headers_dict,
-                )
-
-                try:
-                    docs = loader.load()
-                    if not docs:
-                        msg = f"No documents found for {processed_url}"
-                        logger.warning(msg)
-                        if single_url:
-                            message = f"No documents found for {processed_url}"
-                            raise ValueError(message)
-                    else:
-                        msg = f"Found {len(docs)} documents from {processed_url}"
-                        logger.info(msg)
-                        all_docs.extend(docs)
-                except (httpx.HTTPError, httpx.RequestError) as e:
-                    msg = f"Error loading documents from {processed_url}: {e}"
-                    logger.error(msg)
-                    if single_url:
-                        raise
-                except UnicodeDecodeError as e:
-                    msg = f"Error decoding content from {processed_url}: {e}"
-                    logger.error(msg)
-                    all_docs.append(type('Doc', (), {'page_content': f"[decode error] {e}", 'metadata': {'url': processed_url}})())
-                    if single_url:
-                        pass
-                except Exception as e:
-                    msg = f"Unexpected error loading documents from {processed_url}: {e}"
-                    logger.error(msg)
-                    if single_url:
-                        raise
-
-            # Para docs HTML/texto, use extractor normalmente
-            data.extend([Data(text=extractor(doc.page_content), **doc.metadata) for doc in all_docs])
-            self.status = data
+            limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+            with httpx.Client(limits=limits, timeout=self.timeout, follow_redirects=True) as client:
+                with ThreadPoolExecutor(max_workers=min(max_concurrency, len(urls))) as executor:
+                    results = executor.map(
+                        lambda url: self.load_url(url, headers_dict, single_url, client, cache), urls
+                    )
+                    for url_data in results:
+                        data.extend(url_data)
 
         except Exception as e:
             error_msg = e.message if hasattr(e, "message") else e
@@ -9,7 +9,7 @@ from fastapi.encoders import jsonable_encoder
 
 from lfx.api.v2.files import upload_user_file
 from lfx.custom import Component
-from lfx.io import DropdownInput, HandleInput, StrInput
+from lfx.io import BoolInput, DropdownInput, HandleInput, IntInput, StrInput
 from lfx.schema import Data, DataFrame, Message
 from lfx.services.database.models.user.crud import get_user_by_id
 from lfx.services.deps import get_settings_service, get_storage_service, session_scope
@@ -24,9 +24,21 @@ class SaveToFileComponent(Component):
     name = "SaveToFile"
 
     # File format options for different types
-    DATA_FORMAT_CHOICES = ["csv", "excel", "json", "markdown"]
+    DATA_FORMAT_CHOICES = ["csv", "excel", "json", "markdown", "parquet", "feather"]
     MESSAGE_FORMAT_CHOICES = ["txt", "json", "markdown"]
 
+    # Compression codecs supported by each format, and the file suffix added for stream codecs
+    COMPRESSION_CHOICES = ["none", "gzip", "bz2", "xz", "zstd", "snappy", "lz4", "brotli"]
+    FORMAT_COMPRESSION_CHOICES = {
+        "csv": ["gzip", "bz2", "xz", "zstd"],
+        "parquet": ["snappy", "gzip", "zstd", "lz4", "brotli"],
+        "feather": ["zstd", "lz4"],
+    }
+    COMPRESSION_SUFFIXES = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz", "zstd": ".zst"}
+
+    # Formats that can be appended to without rewriting the existing file
+    APPEND_FORMAT_CHOICES = ["csv", "txt", "markdown"]
+
     inputs = [
         HandleInput(
             name="input",
@@ -49,6 +61,34 @@ class SaveToFileComponent(Component):
             info="Select the file format to save the input. If not provided, the default format will be used.",
             value="",
         ),
+        DropdownInput(
+            name="compression",
+            display_name="Compression",
+            options=COMPRESSION_CHOICES,
+            info=(
+                "Compression codec for CSV (gzip, bz2, xz, zstd), Parquet (snappy, gzip, zstd, lz4, brotli) "
+                "or Feather (zstd, lz4) output."
+            ),
+            value="none",
+            advanced=True,
+        ),
+        IntInput(
+            name="chunk_size",
+            display_name="CSV Chunk Size",
+            info="Number of rows written per batch when saving CSV. Use 0 to write all rows in a single batch.",
+            value=10000,
+            advanced=True,
+        ),
+        BoolInput(
+            name="append",
+            display_name="Append to Existing File",
+            info=(
+                "Append to the file if it already exists instead of overwriting it. "
+                "Supported for CSV, TXT and Markdown. CSV headers are only written when the file is new."
+            ),
+            value=False,
+            advanced=True,
+        ),
     ]
 
     outputs = [Output(display_name="File Path", name="message", method="save_to_file")]
@@ -72,11 +112,19 @@ class SaveToFileComponent(Component):
             msg = f"Invalid file format '{file_format}' for {self._get_input_type()}. Allowed: {allowed_formats}"
             raise ValueError(msg)
 
+        # Reject codecs the format cannot write before anything is created on disk
+        self._get_compression(file_format)
+
         # Prepare file path
         file_path = Path(self.file_name).expanduser()
         if not file_path.parent.exists():
             file_path.parent.mkdir(parents=True, exist_ok=True)
         file_path = self._adjust_file_path_with_format(file_path, file_format)
+        file_path = self._adjust_file_path_with_compression(file_path, file_format)
+
+        if self._is_append_mode() and file_format not in self.APPEND_FORMAT_CHOICES:
+            msg = f"Append mode is not supported for '{file_format}'. Supported: {self.APPEND_FORMAT_CHOICES}"
+            raise ValueError(msg)
 
         # Save the input to file based on type
         if self._get_input_type() == "DataFrame":
@@ -123,13 +171,80 @@ class SaveToFileComponent(Component):
 
     def _adjust_file_path_with_format(self, path: Path, fmt: str) -> Path:
         """Adjust the file path to include the correct extension."""
+        # A compression suffix (e.g. 'out.csv.gz') is stripped here and re-added by the compression step
+        if path.suffix.lower() in self.COMPRESSION_SUFFIXES.values():
+            path = path.with_suffix("")
         file_extension = path.suffix.lower().lstrip(".")
         if fmt == "excel":
             return Path(f"{path}.xlsx").expanduser() if file_extension not in ["xlsx", "xls"] else path
         return Path(f"{path}.{fmt}").expanduser() if file_extension != fmt else path
 
+    def _get_compression(self, fmt: str) -> str | None:
+        """Return the selected compression codec for the format, or None when no compression is used."""
+        compression = getattr(self, "compression", "none") or "none"
+        if compression == "none":
+            return None
+        allowed = self.FORMAT_COMPRESSION_CHOICES.get(fmt, [])
+        if compression not in allowed:
+            msg = f"Compression '{compression}' is not supported for '{fmt}'. Allowed: {allowed or ['none']}"
+            raise ValueError(msg)
+        return compression
+
+    def _adjust_file_path_with_compression(self, path: Path, fmt: str) -> Path:
+        """Add the compression suffix for stream-compressed formats (e.g. '.csv.gz')."""
+        if fmt != "csv":
+            return path
+        suffix = self.COMPRESSION_SUFFIXES.get(self._get_compression(fmt) or "")
+        if not suffix or path.suffix.lower() == suffix:
+            return path
+        return Path(f"{path}{suffix}")
+
+    def _is_append_mode(self) -> bool:
+        """Return True when the component should append to an existing file."""
+        return bool(getattr(self, "append", False))
+
+    def _write_csv(self, dataframe: pd.DataFrame, path: Path) -> None:
+        """Write a DataFrame to CSV in row batches, optionally appending and compressing."""
+        compression = self._get_compression("csv")
+        append = self._is_append_mode() and path.exists() and path.stat().st_size > 0
+        chunk_size = int(getattr(self, "chunk_size", 0) or 0)
+        dataframe.to_csv(
+            path,
+            index=False,
+            mode="a" if append else "w",
+            header=not append,
+            chunksize=chunk_size if chunk_size > 0 else None,
+            compression=compression,
+        )
+
+    def _write_columnar(self, dataframe: pd.DataFrame, path: Path, fmt: str) -> None:
+        """Write a DataFrame to Parquet or Feather using pyarrow."""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            msg = f"pyarrow is not installed. Please install it using `uv pip install pyarrow` to save as {fmt}."
+            raise ImportError(msg) from e
+
+        compression = self._get_compression(fmt)
+        if fmt == "parquet":
+            dataframe.to_parquet(path, index=False, compression=compression)
+        else:
+            dataframe.reset_index(drop=True).to_feather(path, compression=compression or "uncompressed")
+
+    def _write_text(self, path: Path, content: str) -> None:
+        """Write text to the file, appending when append mode is enabled."""
+        if self._is_append_mode() and path.exists() and path.stat().st_size > 0:
+            with path.open("a", encoding="utf-8") as f:
+                f.write("\n" + content)
+        else:
+            path.write_text(content, encoding="utf-8")
+
     async def _upload_file(self, file_path: Path) -> None:
-        """Upload the saved file using the upload_user_file service."""
+        """Upload the saved file using the upload_user_file service.
+
+        The file is handed over as an open handle so the content is streamed from disk
+        rather than loaded into memory by this component.
+        """
         if not file_path.exists():
             msg = f"File not found: {file_path}"
             raise FileNotFoundError(msg)
@@ -152,13 +267,15 @@ class SaveToFileComponent(Component):
     def _save_dataframe(self, dataframe: DataFrame, path: Path, fmt: str) -> str:
         """Save a DataFrame to the specified file format."""
         if fmt == "csv":
-            dataframe.to_csv(path, index=False)
+            self._write_csv(dataframe, path)
         elif fmt == "excel":
             dataframe.to_excel(path, index=False, engine="openpyxl")
         elif fmt == "json":
             dataframe.to_json(path, orient="records", indent=2)
         elif fmt == "markdown":
-            path.write_text(dataframe.to_markdown(index=False), encoding="utf-8")
+            self._write_text(path, dataframe.to_markdown(index=False))
+        elif fmt in {"parquet", "feather"}:
+            self._write_columnar(dataframe, path, fmt)
         else:
             msg = f"Unsupported DataFrame format: {fmt}"
             raise ValueError(msg)
@@ -167,7 +284,7 @@ class SaveToFileComponent(Component):
     def _save_data(self, data: Data, path: Path, fmt: str) -> str:
         """Save a Data object to the specified file format."""
         if fmt == "csv":
-            pd.DataFrame(data.data).to_csv(path, index=False)
+            self._write_csv(pd.DataFrame(data.data), path)
         elif fmt == "excel":
             pd.DataFrame(data.data).to_excel(path, index=False, engine="openpyxl")
         elif fmt == "json":
@@ -175,7 +292,9 @@ class SaveToFileComponent(Component):
                 orjson.dumps(jsonable_encoder(data.data), option=orjson.OPT_INDENT_2).decode("utf-8"), encoding="utf-8"
             )
         elif fmt == "markdown":
-            path.write_text(pd.DataFrame(data.data).to_markdown(index=False), encoding="utf-8")
+            self._write_text(path, pd.DataFrame(data.data).to_markdown(index=False))
+        elif fmt in {"parquet", "feather"}:
+            self._write_columnar(pd.DataFrame(data.data), path, fmt)
         else:
             msg = f"Unsupported Data format: {fmt}"
             raise ValueError(msg)
@@ -196,11 +315,11 @@ class SaveToFileComponent(Component):
             content = str(message.text)
 
         if fmt == "txt":
-            path.write_text(content, encoding="utf-8")
+            self._write_text(path, content)
         elif fmt == "json":
             path.write_text(json.dumps({"message": content}, indent=2), encoding="utf-8")
         elif fmt == "markdown":
-            path.write_text(f"**Message:**\n\n{content}", encoding="utf-8")
+            self._write_text(path, f"**Message:**\n\n{content}")
         else:
             msg = f"Unsupported Message format: {fmt}"
             raise ValueError(msg)
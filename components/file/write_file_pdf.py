@@ -9,7 +9,7 @@ from fastapi.encoders import jsonable_encoder
 
 from langflow.custom import Component
 from langflow.inputs import SortableListInput
-from langflow.io import DropdownInput, HandleInput, SecretStrInput, StrInput
+from langflow.io import DropdownInput, HandleInput, IntInput, SecretStrInput, StrInput
 from langflow.schema import Data, DataFrame, Message
 from langflow.services.deps import get_settings_service, get_storage_service, session_scope
 from langflow.template.field.base import Output
@@ -41,6 +41,7 @@ class SaveToFileComponent(Component):
         "zip",
     ]
     GDRIVE_FORMAT_CHOICES = ["txt", "json", "csv", "xlsx", "slides", "docs", "jpg", "mp3"]
+    PDF_SAMPLING_CHOICES = ["head", "systematic", "random"]
 
     inputs = [
         # Storage location selection
@@ -83,6 +84,42 @@ class SaveToFileComponent(Component):
             value="json",
             show=False,
         ),
+        # PDF rendering options (local storage)
+        IntInput(
+            name="pdf_rows_per_table",
+            display_name="PDF Rows per Table",
+            info=(
+                "Number of DataFrame rows rendered per PDF table chunk. Smaller chunks keep table layout fast. "
+                "All chunks are held in memory until the PDF is built; use 'PDF Max Rows' to bound memory."
+            ),
+            value=500,
+            show=False,
+            advanced=True,
+        ),
+        IntInput(
+            name="pdf_max_rows",
+            display_name="PDF Max Rows",
+            info=(
+                "Maximum number of DataFrame rows written to the PDF. This is what bounds memory and build time "
+                "for large DataFrames. Use 0 to write all rows."
+            ),
+            value=0,
+            show=False,
+            advanced=True,
+        ),
+        DropdownInput(
+            name="pdf_sampling",
+            display_name="PDF Row Sampling",
+            options=PDF_SAMPLING_CHOICES,
+            info=(
+                "How rows are selected when the DataFrame exceeds 'PDF Max Rows': "
+                "'head' keeps the first rows, 'systematic' keeps evenly spaced rows, "
+                "'random' keeps a reproducible random sample."
+            ),
+            value="head",
+            show=False,
+            advanced=True,
+        ),
         DropdownInput(
             name="aws_format",
             display_name="File Format",
@@ -169,6 +206,9 @@ class SaveToFileComponent(Component):
         dynamic_fields = [
             "file_name",  # Common fields (input is always visible)
             "local_format",
+            "pdf_rows_per_table",
+            "pdf_max_rows",
+            "pdf_sampling",
             "aws_format",
             "gdrive_format",
             "aws_access_key_id",
@@ -193,8 +233,10 @@ class SaveToFileComponent(Component):
                 build_config["file_name"]["show"] = True
 
             if location == "Local":
-                if "local_format" in build_config:
-                    build_config["local_format"]["show"] = True
+                local_fields = ["local_format", "pdf_rows_per_table", "pdf_max_rows", "pdf_sampling"]
+                for f_name in local_fields:
+                    if f_name in build_config:
+                        build_config[f_name]["show"] = True
 
             elif location == "AWS":
                 aws_fields = [
@@ -633,42 +675,88 @@ class SaveToFileComponent(Component):
             return str(self.input.text) if self.input.text else str(self.input)
         return str(self.input)
 
+    def _sample_dataframe_for_pdf(self, dataframe: DataFrame) -> tuple[pd.DataFrame, int]:
+        """Apply the configured row cap and sampling strategy, returning the rows to render and the total count."""
+        total_rows = len(dataframe)
+        max_rows = int(getattr(self, "pdf_max_rows", 0) or 0)
+        if max_rows <= 0 or total_rows <= max_rows:
+            return dataframe, total_rows
+
+        sampling = getattr(self, "pdf_sampling", "head") or "head"
+        if sampling == "systematic":
+            step = total_rows / max_rows
+            positions = [int(i * step) for i in range(max_rows)]
+            return dataframe.iloc[positions], total_rows
+        if sampling == "random":
+            return dataframe.sample(n=max_rows, random_state=42).sort_index(), total_rows
+        if sampling == "head":
+            return dataframe.head(max_rows), total_rows
+        msg = f"Unsupported PDF sampling option: {sampling}"
+        raise ValueError(msg)
+
+    def _iter_dataframe_row_batches(self, dataframe: pd.DataFrame, batch_size: int) -> Iterator[list[list[str]]]:
+        """Yield rows of the DataFrame as lists of strings, one batch at a time."""
+        for start in range(0, len(dataframe), batch_size):
+            chunk = dataframe.iloc[start : start + batch_size]
+            yield chunk.astype(str).to_numpy().tolist()
+
     def _save_dataframe_to_pdf(self, dataframe: DataFrame, path: Path) -> None:
-        """Save a DataFrame to PDF format using reportlab."""
+        """Save a DataFrame to PDF format using reportlab.
+
+        Rows are rendered in fixed-size ``LongTable`` chunks with a repeated header row, so layout
+        cost grows linearly with the number of rows instead of laying out one huge flowable. Every
+        chunk is kept until ``doc.build`` runs, so peak memory is bounded by ``pdf_max_rows`` only.
+        """
         try:
             from reportlab.lib import colors
             from reportlab.lib.pagesizes import letter
-            from reportlab.platypus import SimpleDocTemplate, Table, TableStyle
+            from reportlab.lib.styles import getSampleStyleSheet
+            from reportlab.platypus import LongTable, Paragraph, SimpleDocTemplate, TableStyle
         except ImportError as e:
             msg = "reportlab is not installed. Please install it using `uv pip install reportlab`."
             raise ImportError(msg) from e
 
+        rows_per_table = getattr(self, "pdf_rows_per_table", None)
+        rows_per_table = 500 if rows_per_table is None else int(rows_per_table)
+        if rows_per_table <= 0:
+            msg = "PDF Rows per Table must be a positive integer."
+            raise ValueError(msg)
+
         doc = SimpleDocTemplate(str(path), pagesize=letter)
         elements = []
 
-        # Convert DataFrame to list of lists for table
-        data = [dataframe.columns.tolist()] + dataframe.values.tolist()
-
-        # Create table
-        table = Table(data)
-        table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 12),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                    ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                    ("FONTSIZE", (0, 1), (-1, -1), 10),
-                    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-                ]
-            )
+        table_style = TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, 0), 12),
+                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+                ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+                ("GRID", (0, 0), (-1, -1), 1, colors.black),
+                ("FONTSIZE", (0, 1), (-1, -1), 10),
+                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+            ]
         )
 
-        elements.append(table)
+        rows, total_rows = self._sample_dataframe_for_pdf(dataframe)
+        if len(rows) < total_rows:
+            styles = getSampleStyleSheet()
+            note = f"Showing {len(rows)} of {total_rows} rows ({getattr(self, 'pdf_sampling', 'head')} sampling)."
+            elements.append(Paragraph(note, styles["Italic"]))
+
+        header = [str(column) for column in dataframe.columns.tolist()]
+        if rows.empty:
+            table = LongTable([header], repeatRows=1)
+            table.setStyle(table_style)
+            elements.append(table)
+        else:
+            for batch in self._iter_dataframe_row_batches(rows, rows_per_table):
+                table = LongTable([header, *batch], repeatRows=1)
+                table.setStyle(table_style)
+                elements.append(table)
+
         doc.build(elements)
 
     def _save_data_to_pdf(self, data: Data, path: Path) -> None:
@@ -1,12 +1,14 @@
 from lfx.custom import Component
-from lfx.io import StrInput, FileInput, MultilineInput, DropdownInput, Output, MessageInput, SecretStrInput, TabInput
+from lfx.io import StrInput, FileInput, MultilineInput, DropdownInput, Output, MessageInput, SecretStrInput, TabInput, IntInput
 from lfx.schema import Data
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseUpload
 from google.oauth2 import service_account
-import os
+import io
 import base64
 import json
+import random
 import time
 import re
 
@@ -18,6 +20,10 @@ class GoogleDriveUploader(Component):
 
     FILE_TYPE_CHOICES = ["jpg", "txt", "json", "mp3", "slides", "docs"]
 
+    # Resumable uploads must use chunk sizes that are multiples of 256 KB
+    UPLOAD_CHUNK_ALIGNMENT = 256 * 1024
+    RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
     inputs = [
         TabInput(
             name="auth_type",
@@ -72,6 +78,20 @@ class GoogleDriveUploader(Component):
             advanced=True,
             show=False,
         ),
+        IntInput(
+            name="chunk_size_mb",
+            display_name="Upload Chunk Size (MB)",
+            info="Size of each resumable upload chunk. Large files are sent in chunks and resumed on transient errors.",
+            value=8,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_retries",
+            display_name="Max Retries",
+            info="Maximum retries with exponential backoff for transient errors and readiness polling.",
+            value=6,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -146,6 +166,58 @@ class GoogleDriveUploader(Component):
         
         return folder_id
 
+    def _get_max_retries(self):
+        return max(0, int(getattr(self, "max_retries", 6) or 0))
+
+    def _backoff_delay(self, attempt):
+        """Exponential backoff with jitter, capped at 32 seconds."""
+        return min(32.0, (2 ** attempt) * 0.25) + random.uniform(0, 0.25)
+
+    def _is_retryable(self, error):
+        return isinstance(error, HttpError) and error.resp.status in self.RETRYABLE_STATUS_CODES
+
+    def _wait_until_ready(self, probe):
+        """Poll ``probe`` with exponential backoff until it succeeds instead of sleeping a fixed time.
+
+        Newly created Google Apps files can briefly return 404 (or transient 5xx) right after creation.
+        """
+        max_retries = self._get_max_retries()
+        for attempt in range(max_retries + 1):
+            try:
+                return probe()
+            except HttpError as e:
+                if attempt >= max_retries or (e.resp.status != 404 and not self._is_retryable(e)):
+                    raise
+                time.sleep(self._backoff_delay(attempt))
+        return None
+
+    def _get_chunk_size(self):
+        chunk_size_mb = max(1, int(getattr(self, "chunk_size_mb", 8) or 8))
+        chunk_size = chunk_size_mb * 1024 * 1024
+        return chunk_size - (chunk_size % self.UPLOAD_CHUNK_ALIGNMENT)
+
+    def _upload_resumable(self, drive_service, file_metadata, file_data, mime_type):
+        """Upload bytes to Drive with a chunked resumable session, retrying transient chunk failures."""
+        media = MediaIoBaseUpload(
+            io.BytesIO(file_data), mimetype=mime_type, chunksize=self._get_chunk_size(), resumable=True
+        )
+        request = drive_service.files().create(body=file_metadata, media_body=media, fields="id")
+
+        max_retries = self._get_max_retries()
+        response = None
+        attempt = 0
+        while response is None:
+            try:
+                _, response = request.next_chunk()
+                attempt = 0
+            except HttpError as e:
+                if not self._is_retryable(e) or attempt >= max_retries:
+                    raise
+                # The resumable session keeps its offset, so the next call resumes the failed chunk
+                time.sleep(self._backoff_delay(attempt))
+                attempt += 1
+        return response
+
     def upload_file(self) -> Data:
         try:
             # Validate and sanitize filename
@@ -199,10 +271,10 @@ class GoogleDriveUploader(Component):
                 created_file = drive_service.files().create(body=file_metadata, fields="id").execute()
                 presentation_id = created_file["id"]
 
-                # Espera brevemente para garantir que o arquivo esteja disponível
-                time.sleep(2)
-
-                presentation = slides_service.presentations().get(presentationId=presentation_id).execute()
+                # Poll until the new presentation is available instead of sleeping a fixed time
+                presentation = self._wait_until_ready(
+                    lambda: slides_service.presentations().get(presentationId=presentation_id).execute()
+                )
                 slide_id = presentation["slides"][0]["objectId"]
 
                 text_box_id = "TextBox_01"
@@ -255,8 +327,8 @@ class GoogleDriveUploader(Component):
                 created_file = drive_service.files().create(body=file_metadata, fields="id").execute()
                 document_id = created_file["id"]
 
-                # Espera brevemente para garantir que o arquivo esteja disponível
-                time.sleep(2)
+                # Poll until the new document is available instead of sleeping a fixed time
+                self._wait_until_ready(lambda: docs_service.documents().get(documentId=document_id).execute())
 
                 # Insert text into the document
                 requests = [
@@ -308,17 +380,12 @@ class GoogleDriveUploader(Component):
             else:
                 raise ValueError("Unsupported file type.")
 
-            with open(file_path, "wb") as file:
-                file.write(file_data)
-
-            file_metadata = {"name": os.path.basename(file_path), "parents": [extracted_folder_id]}
-            media = MediaFileUpload(file_path, mimetype=mime_type, resumable=True)
-
-            uploaded_file = drive_service.files().create(body=file_metadata, media_body=media, fields="id").execute()
+            # Upload straight from memory instead of writing a temporary file to the working directory
+            file_metadata = {"name": file_path, "parents": [extracted_folder_id]}
+            uploaded_file = self._upload_resumable(drive_service, file_metadata, file_data, mime_type)
             file_id = uploaded_file.get("id")
             file_url = f"https://drive.google.com/file/d/{file_id}/view"
 
-            os.remove(file_path)
             return Data(data={"file_url": file_url})
 
         except Exception as e:
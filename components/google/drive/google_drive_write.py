@@ -1,15 +1,20 @@
 from langflow.custom import Component
-from langflow.io import StrInput, FileInput, MultilineInput, DropdownInput, Output, MessageInput, HandleInput, SecretStrInput, TabInput
+from langflow.io import StrInput, FileInput, MultilineInput, DropdownInput, Output, MessageInput, HandleInput, SecretStrInput, TabInput, IntInput
 from langflow.schema import Data, DataFrame, Message
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseUpload
 from google.oauth2 import service_account
+from concurrent.futures import ThreadPoolExecutor
+import io
 import os
 import base64
 import json
+import random
 import time
 import re
 import tempfile
+import threading
 
 class GoogleDriveUploader(Component):
     display_name = "Google Drive Uploader"
@@ -19,6 +24,10 @@ class GoogleDriveUploader(Component):
 
     FILE_TYPE_CHOICES = ["txt", "json", "csv", "xlsx", "slides", "docs", "jpg", "mp3", "pdf"]
 
+    # Resumable uploads must use chunk sizes that are multiples of 256 KB
+    UPLOAD_CHUNK_ALIGNMENT = 256 * 1024
+    RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
     inputs = [
         TabInput(
             name="auth_type",
@@ -74,11 +83,32 @@ class GoogleDriveUploader(Component):
             required=True,
             tool_mode=True,
         ),
-
+        IntInput(
+            name="chunk_size_mb",
+            display_name="Upload Chunk Size (MB)",
+            info="Size of each resumable upload chunk. Large files are sent in chunks and resumed on transient errors.",
+            value=8,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_retries",
+            display_name="Max Retries",
+            info="Maximum retries with exponential backoff for transient errors and readiness polling.",
+            value=6,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_workers",
+            display_name="Batch Upload Workers",
+            info="Number of files uploaded in parallel by the Batch Results output.",
+            value=4,
+            advanced=True,
+        ),
     ]
 
     outputs = [
         Output(name="file_url", display_name="File URL", method="upload_file"),
+        Output(name="batch_results", display_name="Batch Results", method="upload_batch"),
     ]
 
     def update_build_config(self, build_config, field_value, field_name=None):
@@ -197,19 +227,22 @@ class GoogleDriveUploader(Component):
             self.log(f"Error extracting content from input: {str(e)}")
             return str(input_data)
 
-    def _determine_file_type_from_content(self, content, file_type):
+    def _determine_file_type_from_content(self, content, file_type, source_input=None):
         """Determine the best file type based on content and user selection"""
+        if source_input is None:
+            source_input = self.input
+
         if file_type in ["slides", "docs", "jpg", "mp3", "pdf"]:
             return file_type
         
         # Auto-detect based on input type if user selected csv/xlsx/json
-        if isinstance(self.input, DataFrame):
+        if isinstance(source_input, DataFrame):
             if file_type in ["csv", "xlsx", "pdf"]:
                 return file_type
             return "csv"  # Default for DataFrame
         
         # For Data inputs, try to detect format
-        if isinstance(self.input, Data):
+        if isinstance(source_input, Data):
             if file_type == "json":
                 try:
                     json.loads(content)
@@ -222,7 +255,7 @@ class GoogleDriveUploader(Component):
                     return "csv"
         
         # For Message inputs, default to txt unless specifically requested
-        if isinstance(self.input, Message):
+        if isinstance(source_input, Message):
             if file_type in ["txt", "json", "csv", "pdf"]:
                 return file_type
             return "txt"
@@ -230,295 +263,352 @@ class GoogleDriveUploader(Component):
         # Fallback to user selection or txt
         return file_type if file_type in self.FILE_TYPE_CHOICES else "txt"
 
-    def upload_file(self) -> Data:
-        try:
-            # Extract content from input
-            file_content = self._extract_content_from_input(self.input)
-            
-            # Validate and sanitize filename
-            sanitized_filename = self._sanitize_filename(self.file_name)
-            
-            # Extract folder ID from MessageInput
-            extracted_folder_id = self._extract_folder_id(self.folder_id)
-            
-            # Determine the actual file type to use
-            actual_file_type = self._determine_file_type_from_content(file_content, self.file_type)
-            
-            # Parse credentials based on authentication type
-            auth_type = getattr(self, "auth_type", "secret")
-            
-            # Extract auth_type value from TabInput (should be a string)
-            auth_type = str(auth_type) if auth_type else "secret"
-            
-            # Normalize to "secret" or "file"
-            if auth_type not in ["secret", "file"]:
-                auth_type = "secret"  # Default to secret
-            
-            if auth_type == "file":
-                # Load credentials from JSON file
-                if not hasattr(self, "service_account_json") or not self.service_account_json:
-                    raise ValueError("Service account JSON file is required when using file authentication.")
-                try:
-                    with open(self.service_account_json, "r", encoding="utf-8") as f:
-                        credentials_dict = json.load(f)
-                except FileNotFoundError:
-                    raise ValueError(f"Service account JSON file not found: {self.service_account_json}")
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"Invalid JSON in service account file: {str(e)}")
-            else:
-                # Parse the JSON credentials from the secret key string (default)
-                if not hasattr(self, "service_account_key") or not self.service_account_key:
-                    raise ValueError("Service account key is required when using secret string authentication.")
-                try:
-                    credentials_dict = json.loads(self.service_account_key)
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"Invalid JSON in service account key: {str(e)}")
-
-            credentials = service_account.Credentials.from_service_account_info(
-                credentials_dict,
-                scopes=[
-                    "https://www.googleapis.com/auth/drive.file",
-                    "https://www.googleapis.com/auth/presentations",
-                    "https://www.googleapis.com/auth/documents"
-                ]
-            )
-            drive_service = build("drive", "v3", credentials=credentials)
+    def _load_credentials(self):
+        """Build service account credentials from the selected authentication type."""
+        # Parse credentials based on authentication type
+        auth_type = getattr(self, "auth_type", "secret")
 
-            if actual_file_type == "slides":
-                slides_service = build("slides", "v1", credentials=credentials)
+        # Extract auth_type value from TabInput (should be a string)
+        auth_type = str(auth_type) if auth_type else "secret"
 
-                file_metadata = {
-                    "name": sanitized_filename,
-                    "mimeType": "application/vnd.google-apps.presentation",
-                    "parents": [extracted_folder_id],
-                }
+        # Normalize to "secret" or "file"
+        if auth_type not in ["secret", "file"]:
+            auth_type = "secret"  # Default to secret
+
+        if auth_type == "file":
+            # Load credentials from JSON file
+            if not hasattr(self, "service_account_json") or not self.service_account_json:
+                raise ValueError("Service account JSON file is required when using file authentication.")
+            try:
+                with open(self.service_account_json, "r", encoding="utf-8") as f:
+                    credentials_dict = json.load(f)
+            except FileNotFoundError:
+                raise ValueError(f"Service account JSON file not found: {self.service_account_json}")
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in service account file: {str(e)}")
+        else:
+            # Parse the JSON credentials from the secret key string (default)
+            if not hasattr(self, "service_account_key") or not self.service_account_key:
+                raise ValueError("Service account key is required when using secret string authentication.")
+            try:
+                credentials_dict = json.loads(self.service_account_key)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in service account key: {str(e)}")
+
+        return service_account.Credentials.from_service_account_info(
+            credentials_dict,
+            scopes=[
+                "https://www.googleapis.com/auth/drive.file",
+                "https://www.googleapis.com/auth/presentations",
+                "https://www.googleapis.com/auth/documents"
+            ]
+        )
+
+    def _get_max_retries(self):
+        return max(0, int(getattr(self, "max_retries", 6) or 0))
+
+    def _backoff_delay(self, attempt):
+        """Exponential backoff with jitter, capped at 32 seconds."""
+        return min(32.0, (2 ** attempt) * 0.25) + random.uniform(0, 0.25)
+
+    def _is_retryable(self, error):
+        return isinstance(error, HttpError) and error.resp.status in self.RETRYABLE_STATUS_CODES
+
+    def _wait_until_ready(self, probe):
+        """Poll ``probe`` with exponential backoff until it succeeds instead of sleeping a fixed time.
+
+        Newly created Google Apps files can briefly return 404 (or transient 5xx) right after creation.
+        """
+        max_retries = self._get_max_retries()
+        for attempt in range(max_retries + 1):
+            try:
+                return probe()
+            except HttpError as e:
+                if attempt >= max_retries or (e.resp.status != 404 and not self._is_retryable(e)):
+                    raise
+                time.sleep(self._backoff_delay(attempt))
+        return None
+
+    def _get_chunk_size(self):
+        chunk_size_mb = max(1, int(getattr(self, "chunk_size_mb", 8) or 8))
+        chunk_size = chunk_size_mb * 1024 * 1024
+        return chunk_size - (chunk_size % self.UPLOAD_CHUNK_ALIGNMENT)
+
+    def _upload_resumable(self, drive_service, file_metadata, file_data, mime_type):
+        """Upload bytes to Drive with a chunked resumable session, retrying transient chunk failures."""
+        media = MediaIoBaseUpload(
+            io.BytesIO(file_data), mimetype=mime_type, chunksize=self._get_chunk_size(), resumable=True
+        )
+        request = drive_service.files().create(body=file_metadata, media_body=media, fields="id")
+
+        max_retries = self._get_max_retries()
+        response = None
+        attempt = 0
+        while response is None:
+            try:
+                _, response = request.next_chunk()
+                attempt = 0
+            except HttpError as e:
+                if not self._is_retryable(e) or attempt >= max_retries:
+                    raise
+                # The resumable session keeps its offset, so the next call resumes the failed chunk
+                time.sleep(self._backoff_delay(attempt))
+                attempt += 1
+        return response
+
+    def _prepare_file_payload(self, file_content, actual_file_type, source_input):
+        """Convert extracted content into (extension, mime type, bytes) for the selected file type."""
+        if actual_file_type == "jpg":
+            try:
+                return ".jpg", "image/jpeg", base64.b64decode(file_content)
+            except Exception as e:
+                raise ValueError(f"Invalid base64 data for JPG: {str(e)}")
+        if actual_file_type == "txt":
+            return ".txt", "text/plain", file_content.encode("utf-8")
+        if actual_file_type == "json":
+            # Try to parse and format JSON, fallback to original content
+            try:
+                parsed_json = json.loads(file_content)
+                formatted_json = json.dumps(parsed_json, indent=4, ensure_ascii=False)
+                return ".json", "application/json", formatted_json.encode("utf-8")
+            except json.JSONDecodeError:
+                # If not valid JSON, save as-is
+                return ".json", "application/json", file_content.encode("utf-8")
+        if actual_file_type == "csv":
+            return ".csv", "text/csv", file_content.encode("utf-8")
+        if actual_file_type == "xlsx":
+            # For XLSX, we need to convert the content to Excel format
+            try:
+                import pandas as pd
+                from io import StringIO
 
-                created_file = drive_service.files().create(body=file_metadata, fields="id").execute()
-                presentation_id = created_file["id"]
-
-                # Espera brevemente para garantir que o arquivo esteja disponível
-                time.sleep(2)
-
-                presentation = slides_service.presentations().get(presentationId=presentation_id).execute()
-                slide_id = presentation["slides"][0]["objectId"]
-
-                text_box_id = "TextBox_01"
-                requests = [
-                    {
-                        "createShape": {
-                            "objectId": text_box_id,
-                            "shapeType": "TEXT_BOX",
-                            "elementProperties": {
-                                "pageObjectId": slide_id,
-                                "size": {
-                                    "height": {"magnitude": 3000000, "unit": "EMU"},
-                                    "width": {"magnitude": 6000000, "unit": "EMU"}
-                                },
-                                "transform": {
-                                    "scaleX": 1,
-                                    "scaleY": 1,
-                                    "translateX": 1000000,
-                                    "translateY": 1000000,
-                                    "unit": "EMU"
-                                }
+                # Try to parse as CSV first
+                try:
+                    df = pd.read_csv(StringIO(file_content))
+                except:
+                    # If not CSV, try to create DataFrame from the content
+                    if isinstance(source_input, DataFrame):
+                        df = source_input
+                    else:
+                        # Create a simple DataFrame with the content
+                        df = pd.DataFrame({'content': [file_content]})
+
+                buffer = io.BytesIO()
+                df.to_excel(buffer, index=False)
+                return (
+                    ".xlsx",
+                    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    buffer.getvalue(),
+                )
+            except ImportError:
+                # If pandas not available, fallback to CSV
+                self.log("pandas not available, saving as CSV instead of XLSX")
+                return ".csv", "text/csv", file_content.encode("utf-8")
+            except Exception as e:
+                self.log(f"Error creating XLSX: {str(e)}, falling back to CSV")
+                return ".csv", "text/csv", file_content.encode("utf-8")
+        if actual_file_type == "mp3":
+            if isinstance(file_content, str):
+                # Se for string, assume que é base64
+                try:
+                    return ".mp3", "audio/mpeg", base64.b64decode(file_content)
+                except Exception as e:
+                    raise ValueError(f"Invalid base64 data for MP3: {str(e)}")
+            if isinstance(file_content, bytes):
+                return ".mp3", "audio/mpeg", file_content
+            raise ValueError("Audio data must be passed as base64 string or bytes.")
+        if actual_file_type == "pdf":
+            # Generate PDF using reportlab to a temporary file, then read it back
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_pdf:
+                temp_pdf_path = temp_pdf.name
+            try:
+                self._create_pdf_from_content(file_content, temp_pdf_path, source_input)
+                with open(temp_pdf_path, 'rb') as f:
+                    return ".pdf", "application/pdf", f.read()
+            finally:
+                if os.path.exists(temp_pdf_path):
+                    os.remove(temp_pdf_path)
+        # Default to txt for unsupported types
+        return ".txt", "text/plain", file_content.encode("utf-8")
+
+    def _create_google_app_file(self, credentials, drive_service, app_type, name, folder_id, file_content):
+        """Create a Google Slides presentation or Google Docs document containing the content."""
+        if app_type == "slides":
+            slides_service = build("slides", "v1", credentials=credentials)
+
+            file_metadata = {
+                "name": name,
+                "mimeType": "application/vnd.google-apps.presentation",
+                "parents": [folder_id],
+            }
+
+            created_file = drive_service.files().create(body=file_metadata, fields="id").execute()
+            presentation_id = created_file["id"]
+
+            # Poll until the new presentation is available instead of sleeping a fixed time
+            presentation = self._wait_until_ready(
+                lambda: slides_service.presentations().get(presentationId=presentation_id).execute()
+            )
+            slide_id = presentation["slides"][0]["objectId"]
+
+            text_box_id = "TextBox_01"
+            requests = [
+                {
+                    "createShape": {
+                        "objectId": text_box_id,
+                        "shapeType": "TEXT_BOX",
+                        "elementProperties": {
+                            "pageObjectId": slide_id,
+                            "size": {
+                                "height": {"magnitude": 3000000, "unit": "EMU"},
+                                "width": {"magnitude": 6000000, "unit": "EMU"}
+                            },
+                            "transform": {
+                                "scaleX": 1,
+                                "scaleY": 1,
+                                "translateX": 1000000,
+                                "translateY": 1000000,
+                                "unit": "EMU"
                             }
                         }
-                    },
-                    {
-                        "insertText": {
-                            "objectId": text_box_id,
-                            "insertionIndex": 0,
-                            "text": file_content
-                        }
                     }
-                ]
+                },
+                {
+                    "insertText": {
+                        "objectId": text_box_id,
+                        "insertionIndex": 0,
+                        "text": file_content
+                    }
+                }
+            ]
 
-                slides_service.presentations().batchUpdate(
-                    presentationId=presentation_id, body={"requests": requests}
-                ).execute()
+            slides_service.presentations().batchUpdate(
+                presentationId=presentation_id, body={"requests": requests}
+            ).execute()
 
-                file_url = f"https://docs.google.com/presentation/d/{presentation_id}/edit"
-                return Data(data={"file_url": file_url})
+            return f"https://docs.google.com/presentation/d/{presentation_id}/edit"
 
-            elif actual_file_type == "docs":
-                docs_service = build("docs", "v1", credentials=credentials)
+        docs_service = build("docs", "v1", credentials=credentials)
 
-                file_metadata = {
-                    "name": sanitized_filename,
-                    "mimeType": "application/vnd.google-apps.document",
-                    "parents": [extracted_folder_id],
+        file_metadata = {
+            "name": name,
+            "mimeType": "application/vnd.google-apps.document",
+            "parents": [folder_id],
+        }
+
+        created_file = drive_service.files().create(body=file_metadata, fields="id").execute()
+        document_id = created_file["id"]
+
+        # Poll until the new document is available instead of sleeping a fixed time
+        self._wait_until_ready(lambda: docs_service.documents().get(documentId=document_id).execute())
+
+        # Insert text into the document
+        requests = [
+            {
+                "insertText": {
+                    "location": {
+                        "index": 1
+                    },
+                    "text": file_content
                 }
+            }
+        ]
 
-                created_file = drive_service.files().create(body=file_metadata, fields="id").execute()
-                document_id = created_file["id"]
+        docs_service.documents().batchUpdate(
+            documentId=document_id, body={"requests": requests}
+        ).execute()
 
-                # Espera brevemente para garantir que o arquivo esteja disponível
-                time.sleep(2)
+        return f"https://docs.google.com/document/d/{document_id}/edit"
 
-                # Insert text into the document
-                requests = [
-                    {
-                        "insertText": {
-                            "location": {
-                                "index": 1
-                            },
-                            "text": file_content
-                        }
-                    }
-                ]
+    def _upload_single(self, credentials, drive_service, source_input, file_name, folder_id):
+        """Upload one input item and return its file URL."""
+        # Extract content from input
+        file_content = self._extract_content_from_input(source_input)
 
-                docs_service.documents().batchUpdate(
-                    documentId=document_id, body={"requests": requests}
-                ).execute()
+        # Determine the actual file type to use
+        actual_file_type = self._determine_file_type_from_content(file_content, self.file_type, source_input)
 
-                file_url = f"https://docs.google.com/document/d/{document_id}/edit"
-                return Data(data={"file_url": file_url})
+        if actual_file_type in ["slides", "docs"]:
+            return self._create_google_app_file(
+                credentials, drive_service, actual_file_type, file_name, folder_id, file_content
+            )
 
-            # Handle other file types
-            # Use tempfile to avoid file locking issues on Windows
-            file_extension = ""
-            mime_type = ""
-            file_data = None
+        file_extension, mime_type, file_data = self._prepare_file_payload(file_content, actual_file_type, source_input)
 
-            if actual_file_type == "jpg":
-                file_extension = ".jpg"
-                mime_type = "image/jpeg"
-                try:
-                    file_data = base64.b64decode(file_content)
-                except Exception as e:
-                    raise ValueError(f"Invalid base64 data for JPG: {str(e)}")
-            elif actual_file_type == "txt":
-                file_extension = ".txt"
-                mime_type = "text/plain"
-                file_data = file_content.encode("utf-8")
-            elif actual_file_type == "json":
-                file_extension = ".json"
-                mime_type = "application/json"
-                # Try to parse and format JSON, fallback to original content
-                try:
-                    parsed_json = json.loads(file_content)
-                    formatted_json = json.dumps(parsed_json, indent=4, ensure_ascii=False)
-                    file_data = formatted_json.encode("utf-8")
-                except json.JSONDecodeError:
-                    # If not valid JSON, save as-is
-                    file_data = file_content.encode("utf-8")
-            elif actual_file_type == "csv":
-                file_extension = ".csv"
-                mime_type = "text/csv"
-                file_data = file_content.encode("utf-8")
-            elif actual_file_type == "xlsx":
-                file_extension = ".xlsx"
-                mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                # For XLSX, we need to convert the content to Excel format
-                try:
-                    import pandas as pd
-                    from io import StringIO
-                    
-                    # Try to parse as CSV first
-                    try:
-                        df = pd.read_csv(StringIO(file_content))
-                    except:
-                        # If not CSV, try to create DataFrame from the content
-                        if isinstance(self.input, DataFrame):
-                            df = self.input
-                        else:
-                            # Create a simple DataFrame with the content
-                            df = pd.DataFrame({'content': [file_content]})
-                    
-                    # Save as Excel to temporary file
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as temp_excel:
-                        temp_excel_path = temp_excel.name
-                        df.to_excel(temp_excel_path, index=False)
-                    
-                    with open(temp_excel_path, 'rb') as f:
-                        file_data = f.read()
-                    
-                    os.remove(temp_excel_path)
-                    
-                except ImportError:
-                    # If pandas not available, fallback to CSV
-                    self.log("pandas not available, saving as CSV instead of XLSX")
-                    file_extension = ".csv"
-                    mime_type = "text/csv"
-                    file_data = file_content.encode("utf-8")
-                except Exception as e:
-                    self.log(f"Error creating XLSX: {str(e)}, falling back to CSV")
-                    file_extension = ".csv"
-                    mime_type = "text/csv"
-                    file_data = file_content.encode("utf-8")
-            elif actual_file_type == "mp3":
-                file_extension = ".mp3"
-                mime_type = "audio/mpeg"
-                if isinstance(file_content, str):
-                    # Se for string, assume que é base64
-                    try:
-                        file_data = base64.b64decode(file_content)
-                    except Exception as e:
-                        raise ValueError(f"Invalid base64 data for MP3: {str(e)}")
-                elif isinstance(file_content, bytes):
-                    file_data = file_content
-                else:
-                    raise ValueError("Audio data must be passed as base64 string or bytes.")
-            elif actual_file_type == "pdf":
-                file_extension = ".pdf"
-                mime_type = "application/pdf"
-                # Generate PDF using reportlab to temporary file
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_pdf:
-                    temp_pdf_path = temp_pdf.name
-                    self._create_pdf_from_content(file_content, temp_pdf_path)
-                
-                with open(temp_pdf_path, 'rb') as f:
-                    file_data = f.read()
-                
-                os.remove(temp_pdf_path)
-            else:
-                # Default to txt for unsupported types
-                file_extension = ".txt"
-                mime_type = "text/plain"
-                file_data = file_content.encode("utf-8")
-
-            # Create temporary file with proper name for upload
-            # Use NamedTemporaryFile with delete=False so we can control when to delete
-            # The file is automatically closed when exiting the 'with' block
-            with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as temp_file:
-                file_path = temp_file.name
-                temp_file.write(file_data)
-                # File is closed here when exiting 'with' block
+        # Upload straight from memory: no temporary file, so no file handle to wait on before cleanup
+        file_metadata = {"name": file_name + file_extension, "parents": [folder_id]}
+        uploaded_file = self._upload_resumable(drive_service, file_metadata, file_data, mime_type)
+        file_id = uploaded_file.get("id")
+        return f"https://drive.google.com/file/d/{file_id}/view"
 
-            try:
-                file_metadata = {"name": sanitized_filename + file_extension, "parents": [extracted_folder_id]}
-                media = MediaFileUpload(file_path, mimetype=mime_type, resumable=True)
+    def upload_file(self) -> Data:
+        try:
+            # Validate and sanitize filename
+            sanitized_filename = self._sanitize_filename(self.file_name)
 
-                uploaded_file = drive_service.files().create(body=file_metadata, media_body=media, fields="id").execute()
-                file_id = uploaded_file.get("id")
-                file_url = f"https://drive.google.com/file/d/{file_id}/view"
-            finally:
-                # Ensure file is deleted even if upload fails
-                # Wait a bit to ensure MediaFileUpload releases the file handle
-                try:
-                    time.sleep(0.1)  # Small delay to ensure file handle is released
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
-                except PermissionError:
-                    # On Windows, sometimes the file is still locked
-                    # Try again after a short delay
-                    time.sleep(0.5)
-                    try:
-                        if os.path.exists(file_path):
-                            os.remove(file_path)
-                    except Exception as e:
-                        self.log(f"Warning: Could not remove temporary file {file_path}: {e}")
-                except Exception as e:
-                    self.log(f"Warning: Could not remove temporary file {file_path}: {e}")
+            # Extract folder ID from MessageInput
+            extracted_folder_id = self._extract_folder_id(self.folder_id)
+
+            credentials = self._load_credentials()
+            drive_service = build("drive", "v3", credentials=credentials)
 
+            file_url = self._upload_single(
+                credentials, drive_service, self.input, sanitized_filename, extracted_folder_id
+            )
             return Data(data={"file_url": file_url})
 
         except Exception as e:
             self.log(f"Error uploading file: {e}")
             return Data(data={"error": str(e)})
 
-    def _create_pdf_from_content(self, content: str, pdf_path: str) -> None:
+    def _get_batch_items(self):
+        """Split the input into items for batch upload: list entries or DataFrame rows."""
+        if isinstance(self.input, list):
+            return self.input
+        if isinstance(self.input, DataFrame):
+            return [Data(data=row) for row in self.input.to_dict(orient="records")]
+        return [self.input]
+
+    def upload_batch(self) -> DataFrame:
+        """Upload every input item as its own file, in parallel, and return one result row per item."""
+        try:
+            sanitized_filename = self._sanitize_filename(self.file_name)
+            extracted_folder_id = self._extract_folder_id(self.folder_id)
+            credentials = self._load_credentials()
+        except Exception as e:
+            self.log(f"Error uploading batch: {e}")
+            return DataFrame([Data(data={"error": str(e)})])
+
+        items = self._get_batch_items()
+        width = len(str(len(items)))
+        local_state = threading.local()
+
+        def upload(indexed_item):
+            index, item = indexed_item
+            file_name = f"{sanitized_filename}_{index + 1:0{width}d}"
+            # googleapiclient service objects are not thread-safe, so each worker thread gets its own
+            if getattr(local_state, "drive_service", None) is None:
+                local_state.drive_service = build("drive", "v3", credentials=credentials, cache_discovery=False)
+            try:
+                file_url = self._upload_single(
+                    credentials, local_state.drive_service, item, file_name, extracted_folder_id
+                )
+                return {"index": index, "file_name": file_name, "file_url": file_url, "error": None}
+            except Exception as e:
+                self.log(f"Error uploading {file_name}: {e}")
+                return {"index": index, "file_name": file_name, "file_url": None, "error": str(e)}
+
+        max_workers = max(1, int(getattr(self, "max_workers", 4) or 1))
+        with ThreadPoolExecutor(max_workers=min(max_workers, max(1, len(items)))) as executor:
+            results = list(executor.map(upload, enumerate(items)))
+
+        return DataFrame([Data(data=result) for result in results])
+
+    def _create_pdf_from_content(self, content: str, pdf_path: str, source_input=None) -> None:
         """Create a PDF file from content using reportlab."""
+        if source_input is None:
+            source_input = self.input
+
         try:
             from reportlab.lib import colors
             from reportlab.lib.pagesizes import letter
@@ -532,13 +622,13 @@ class GoogleDriveUploader(Component):
         styles = getSampleStyleSheet()
 
         # Try to create a table if input is DataFrame
-        if isinstance(self.input, DataFrame):
-            self._create_dataframe_pdf(self.input, elements)
+        if isinstance(source_input, DataFrame):
+            self._create_dataframe_pdf(source_input, elements)
         # Try to create a table if input is Data with tabular data
-        elif isinstance(self.input, Data):
+        elif isinstance(source_input, Data):
             try:
                 import pandas as pd
-                df = pd.DataFrame(self.input.data) if hasattr(self.input, "data") and self.input.data else None
+                df = pd.DataFrame(source_input.data) if hasattr(source_input, "data") and source_input.data else None
                 if df is not None and not df.empty:
                     self._create_dataframe_pdf(df, elements)
                 else:
@@ -1,5 +1,10 @@
+import asyncio
+import hashlib
 import re
+import threading
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 
 from astrapy import DataAPIClient, Database
@@ -22,10 +27,85 @@ from langflow.io import (
     SecretStrInput,
     StrInput,
 )
+from langflow.logging.logger import logger
 from langflow.schema.data import Data
 from langflow.serialization import serialize
 from langflow.utils.version import get_version_info
 
+# Lookups younger than this are served as is; older ones are served while a background refresh runs
+LOOKUP_CACHE_TTL_SECONDS = 60
+# Lookups older than this are discarded and fetched again before answering
+LOOKUP_CACHE_MAX_STALE_SECONDS = 600
+LOOKUP_MAX_WORKERS = 8
+
+
+class _LookupCache:
+    """Process-wide TTL cache for Astra DevOps/Data API lookups with stale-while-revalidate refresh."""
+
+    def __init__(self):
+        self._entries: dict[tuple, tuple[float, object]] = {}
+        self._refreshing: set[tuple] = set()
+        # Bumped by invalidate() so lookups already in flight cannot write back data from before it
+        self._generations: dict[tuple, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(kind: str, token: str | None, *parts) -> tuple:
+        # Never keep raw tokens around as dictionary keys
+        token_hash = hashlib.sha256((token or "").encode()).hexdigest()
+        return (kind, token_hash, *parts)
+
+    def get(self, key: tuple, loader):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            age = now - entry[0]
+            if age < LOOKUP_CACHE_TTL_SECONDS:
+                return entry[1]
+            if age < LOOKUP_CACHE_MAX_STALE_SECONDS:
+                self._refresh_in_background(key, loader)
+                return entry[1]
+        return self._load(key, loader)
+
+    def _load(self, key: tuple, loader):
+        with self._lock:
+            generation = self._generations[key[:2]]
+        value = loader()
+        # Empty results usually mean a failed lookup; do not pin them for the whole TTL
+        if value:
+            with self._lock:
+                if self._generations[key[:2]] == generation:
+                    self._entries[key] = (time.monotonic(), value)
+        return value
+
+    def _refresh_in_background(self, key: tuple, loader) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._load(key, loader)
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"Background refresh of Astra DB {key[0]} lookup failed, serving stale data: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name="astra-lookup-refresh", daemon=True).start()
+
+    def invalidate(self, kind: str, token: str | None) -> None:
+        prefix = self.key(kind, token)
+        with self._lock:
+            self._generations[prefix] += 1
+            for key in [key for key in self._entries if key[: len(prefix)] == prefix]:
+                del self._entries[key]
+
+
+_LOOKUP_CACHE = _LookupCache()
+
 
 @vector_store_connection
 class AstraDBVectorStoreComponent(LCVectorStoreComponent):
@@ -327,6 +407,13 @@ class AstraDBVectorStoreComponent(LCVectorStoreComponent):
 
     @classmethod
     def get_vectorize_providers(cls, token: str, environment: str | None = None, api_endpoint: str | None = None):
+        return _LOOKUP_CACHE.get(
+            _LOOKUP_CACHE.key("providers", token, environment, api_endpoint),
+            lambda: cls._fetch_vectorize_providers(token=token, environment=environment, api_endpoint=api_endpoint),
+        )
+
+    @classmethod
+    def _fetch_vectorize_providers(cls, token: str, environment: str | None = None, api_endpoint: str | None = None):
         try:
             # Get the admin object
             client = DataAPIClient(environment=environment)
@@ -434,6 +521,13 @@ class AstraDBVectorStoreComponent(LCVectorStoreComponent):
 
     @classmethod
     def get_database_list_static(cls, token: str, environment: str | None = None):
+        return _LOOKUP_CACHE.get(
+            _LOOKUP_CACHE.key("databases", token, environment),
+            lambda: cls._fetch_database_list(token=token, environment=environment),
+        )
+
+    @classmethod
+    def _fetch_database_list(cls, token: str, environment: str | None = None):
         client = DataAPIClient(environment=environment)
 
         # Get the admin object
@@ -442,9 +536,7 @@ class AstraDBVectorStoreComponent(LCVectorStoreComponent):
         # Get the list of databases
         db_list = admin_client.list_databases()
 
-        # Generate the api endpoint for each database
-        db_info_dict = {}
-        for db in db_list:
+        def describe(db):
             try:
                 # Get the API endpoint for the database
                 api_endpoints = [db_reg.api_endpoint for db_reg in db.regions]
@@ -460,21 +552,25 @@ class AstraDBVectorStoreComponent(LCVectorStoreComponent):
                     )
                 except Exception:  # noqa: BLE001
                     if db.status != "PENDING":
-                        continue
+                        return None
                     num_collections = 0
 
-                # Add the database to the dictionary
-                db_info_dict[db.name] = {
+                return {
                     "api_endpoints": api_endpoints,
                     "keyspaces": db.keyspaces,
                     "collections": num_collections,
                     "status": db.status if db.status != "ACTIVE" else None,
                     "org_id": db.org_id if db.org_id else None,
                 }
-            except Exception:  # noqa: BLE001, S110
-                pass
+            except Exception:  # noqa: BLE001
+                return None
 
-        return db_info_dict
+        # Count the collections of every database concurrently instead of one round-trip after another
+        with ThreadPoolExecutor(max_workers=LOOKUP_MAX_WORKERS) as executor:
+            db_infos = list(executor.map(describe, db_list))
+
+        # Generate the api endpoint for each database
+        return {db.name: info for db, info in zip(db_list, db_infos) if info is not None}
 
     def get_database_list(self):
         return self.get_database_list_static(
@@ -627,17 +723,31 @@ class AstraDBVectorStoreComponent(LCVectorStoreComponent):
         if not api_endpoint:
             return []
 
+        return _LOOKUP_CACHE.get(
+            _LOOKUP_CACHE.key("collections", self.token, self.environment, api_endpoint, self.get_keyspace()),
+            lambda: self._fetch_collection_options(api_endpoint),
+        )
+
+    def _fetch_collection_options(self, api_endpoint: str):
         # Retrieve the database object
         database = self.get_database_object(api_endpoint=api_endpoint)
 
         # Get the list of collections
         collection_list = database.list_collections(keyspace=self.get_keyspace())
 
+        # Count the records of every collection concurrently
+        with ThreadPoolExecutor(max_workers=LOOKUP_MAX_WORKERS) as executor:
+            records = list(
+                executor.map(
+                    lambda col: self.collection_data(collection_name=col.name, database=database), collection_list
+                )
+            )
+
         # Return the list of collections and metadata associated
         return [
             {
                 "name": col.name,
-                "records": self.collection_data(collection_name=col.name, database=database),
+                "records": col_records,
                 "provider": (
                     col.definition.vector.service.provider
                     if col.definition.vector and col.definition.vector.service
@@ -650,8 +760,31 @@ class AstraDBVectorStoreComponent(LCVectorStoreComponent):
                     else None
                 ),
             }
-            for col in collection_list
+            for col, col_records in zip(collection_list, records)
+        ]
+
+    def _get_reranking_providers(self, api_endpoint: str | None = None):
+        api_endpoint = api_endpoint or self.get_api_endpoint()
+
+        def fetch():
+            client = DataAPIClient(environment=self.environment)
+            admin_client = client.get_admin()
+            db_admin = admin_client.get_database_admin(api_endpoint, token=self.token)
+            return db_admin.find_reranking_providers()
+
+        return _LOOKUP_CACHE.get(_LOOKUP_CACHE.key("rerankers", self.token, self.environment, api_endpoint), fetch)
+
+    async def _prefetch_database_lookups(self, api_endpoint: str) -> None:
+        """Warm the independent per-database lookups concurrently before the build config is updated."""
+        lookups = [
+            lambda: self.get_vectorize_providers(
+                token=self.token, environment=self.environment, api_endpoint=api_endpoint
+            ),
+            lambda: self._get_reranking_providers(api_endpoint),
+            lambda: self._initialize_collection_options(api_endpoint=api_endpoint),
         ]
+        # Failures surface again, with their usual handling, when each lookup is used
+        await asyncio.gather(*(asyncio.to_thread(lookup) for lookup in lookups), return_exceptions=True)
 
     def reset_provider_options(self, build_config: dict) -> dict:
         """Reset provider options and related configurations in the build_config dictionary."""
@@ -806,14 +939,9 @@ class AstraDBVectorStoreComponent(LCVectorStoreComponent):
     def _handle_hybrid_search_options(self, build_config: dict) -> dict:
         """Set hybrid search options in the build configuration."""
         # Detect what hybrid options are available
-        # Get the admin object
-        client = DataAPIClient(environment=self.environment)
-        admin_client = client.get_admin()
-        db_admin = admin_client.get_database_admin(self.get_api_endpoint(), token=self.token)
-
         # We will try to get the reranking providers to see if its hybrid emabled
         try:
-            providers = db_admin.find_reranking_providers()
+            providers = self._get_reranking_providers()
             build_config["reranker"]["options"] = [
                 model.name for provider_data in providers.reranking_providers.values() for model in provider_data.models
             ]
@@ -874,6 +1002,9 @@ class AstraDBVectorStoreComponent(LCVectorStoreComponent):
 
         # Database selection change
         if field_name == "database_name" and not isinstance(field_value, dict):
+            database = (await asyncio.to_thread(self.get_database_list)).get(field_value) or {}
+            if database.get("api_endpoints"):
+                await self._prefetch_database_lookups(database["api_endpoints"][0])
             return self._handle_database_selection(build_config, field_value)
 
         # Keyspace selection change
@@ -924,6 +1055,8 @@ class AstraDBVectorStoreComponent(LCVectorStoreComponent):
             msg = f"Error creating database: {e}"
             raise ValueError(msg) from e
 
+        _LOOKUP_CACHE.invalidate("databases", self.token)
+
         build_config["database_name"]["options"].append(field_value["01_new_database_name"])
         build_config["database_name"]["options_metadata"].append(
             {
@@ -969,6 +1102,9 @@ class AstraDBVectorStoreComponent(LCVectorStoreComponent):
             msg = f"Error creating collection: {e}"
             raise ValueError(msg) from e
 
+        _LOOKUP_CACHE.invalidate("collections", self.token)
+        _LOOKUP_CACHE.invalidate("databases", self.token)
+
         provider = embedding_provider.lower() if embedding_provider and embedding_provider != "Bring your own" else None
         build_config["collection_name"].update(
             {
@@ -1171,6 +1307,10 @@ class AstraDBVectorStoreComponent(LCVectorStoreComponent):
         # Add documents to the vector store
         self._add_documents_to_vector_store(vector_store)
 
+        vector_store.langflow_ingested = bool(self.ingest_data)
+        # Same endpoint and keyspace under another token may grant different access, so the token is part of it
+        token_hash = hashlib.sha256((self.token or "").encode()).hexdigest()[:16]
+        vector_store.langflow_store_location = f"{database.api_endpoint}/{database.keyspace}#{token_hash}"
         return vector_store
 
     def _add_documents_to_vector_store(self, vector_store) -> None:
@@ -0,0 +1,324 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from lfx.custom import Component
+from lfx.helpers.data import docs_to_data
+from lfx.io import (
+    BoolInput,
+    DictInput,
+    DropdownInput,
+    FloatInput,
+    HandleInput,
+    IntInput,
+    MessageTextInput,
+    Output,
+)
+from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame
+
+
+class QueryResultCache:
+    """Thread-safe LRU cache of search results with per-entry TTL and per-store invalidation.
+
+    Every store key has a generation number that is part of each entry key. Bumping the generation
+    after an ingest makes all earlier entries for that store unreachable; they age out through LRU.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def entry_key(self, store_key: str, params: dict) -> str:
+        with self._lock:
+            generation = self._generations.get(store_key, 0)
+        payload = json.dumps({"store": store_key, "generation": generation, **params}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> list[dict] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, value: list[dict], ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(1, self.max_entries):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, store_key: str) -> None:
+        with self._lock:
+            self._generations[store_key] = self._generations.get(store_key, 0) + 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+# Fixed for the module: the cache is shared by every instance of the component
+CACHE_MAX_ENTRIES = 1024
+
+# Shared by every instance of the component, so repeated flow runs reuse results
+_QUERY_CACHE = QueryResultCache(max_entries=CACHE_MAX_ENTRIES)
+
+
+class CachedVectorStoreSearchComponent(Component):
+    """Searches any vector store through a shared result cache with TTL, LRU eviction and ingest invalidation."""
+
+    display_name = "Cached Vector Store Search"
+    description = (
+        "Search any vector store and cache the results. Identical queries from chat flows and agents are "
+        "answered from memory until the TTL expires or documents are ingested, either by the connected vector "
+        "store component or through this component. Writes made outside Langflow are picked up when the TTL "
+        "expires. Stores without a stable location are searched without caching."
+    )
+    icon = "database-zap"
+    name = "CachedVectorStoreSearch"
+
+    inputs = [
+        HandleInput(
+            name="vector_store",
+            display_name="Vector Store",
+            input_types=["VectorStore"],
+            info="The vector store handle to search.",
+            required=True,
+        ),
+        MessageTextInput(
+            name="search_query",
+            display_name="Search Query",
+            info="Text to search for.",
+            tool_mode=True,
+        ),
+        HandleInput(
+            name="ingest_data",
+            display_name="Ingest Data",
+            input_types=["Data", "DataFrame"],
+            is_list=True,
+            info="Documents added to the vector store before searching. Ingesting invalidates its cached results.",
+            required=False,
+        ),
+        DropdownInput(
+            name="search_type",
+            display_name="Search Type",
+            options=["Similarity", "Similarity with score threshold", "MMR (Max Marginal Relevance)"],
+            value="Similarity",
+            advanced=True,
+        ),
+        IntInput(
+            name="number_of_results",
+            display_name="Number of Results",
+            info="Number of results to return.",
+            value=4,
+            advanced=True,
+        ),
+        FloatInput(
+            name="search_score_threshold",
+            display_name="Search Score Threshold",
+            info="Minimum relevance score (when using 'Similarity with score threshold').",
+            value=0,
+            advanced=True,
+        ),
+        DictInput(
+            name="search_filter",
+            display_name="Search Metadata Filter",
+            info="Optional metadata filter passed to the vector store search.",
+            advanced=True,
+            list=True,
+        ),
+        BoolInput(
+            name="use_cache",
+            display_name="Use Cache",
+            info="Serve repeated queries from the cache.",
+            value=True,
+        ),
+        IntInput(
+            name="cache_ttl",
+            display_name="Cache TTL (seconds)",
+            info="How long a cached result stays valid. Results can be stale for up to this long when documents "
+            "are written to the store outside Langflow.",
+            value=300,
+            advanced=True,
+        ),
+    ]
+
+    outputs = [
+        Output(display_name="Search Results", name="search_results", method="search_documents"),
+        Output(display_name="Cache Stats", name="cache_stats", method="get_cache_stats"),
+    ]
+
+    @staticmethod
+    def _client_location(client) -> str:
+        init_options = getattr(client, "init_options", None)
+        if isinstance(init_options, dict):
+            # Qdrant
+            keys = ("url", "host", "port", "location", "path")
+            return ",".join(f"{key}={init_options[key]}" for key in keys if init_options.get(key))
+        description = repr(client)
+        # Elasticsearch, OpenSearch and Redis clients describe their hosts; default reprs only hold a memory address
+        return "" if " at 0x" in description else description
+
+    def _store_location(self) -> str:
+        """Identify where the store lives: persist directory, connection string or client host.
+
+        Returns an empty string when no stable location is known; such stores are not cached.
+        """
+        store = self.vector_store
+        # Set by the vector store components whose store objects carry no location of their own (FAISS, Astra DB)
+        explicit = getattr(store, "langflow_store_location", None)
+        if explicit:
+            return str(explicit)
+        attributes = ("_persist_directory", "persist_directory", "connection_string", "_connection_string", "redis_url")
+        for attribute in attributes:
+            value = getattr(store, attribute, None)
+            if value:
+                return f"{attribute}={value}"
+        client = getattr(store, "client", None) or getattr(store, "_client", None)
+        return self._client_location(client) if client is not None else ""
+
+    def _store_key(self) -> str | None:
+        """Identify the store by backend type, location, collection/index and embedding model."""
+        store = self.vector_store
+        collection = next(
+            (
+                str(getattr(store, attribute))
+                for attribute in ("collection_name", "_collection_name", "index_name", "_index_name", "table_name")
+                if getattr(store, attribute, None)
+            ),
+            "",
+        )
+        if not collection and getattr(store, "_collection", None) is not None:
+            collection = str(getattr(store._collection, "name", ""))
+        embedding = getattr(store, "embeddings", None)
+        model = next(
+            (
+                str(getattr(embedding, attribute))
+                for attribute in ("model", "model_name", "deployment")
+                if getattr(embedding, attribute, None)
+            ),
+            type(embedding).__name__,
+        )
+        location = self._store_location()
+        if not location:
+            return None
+        return f"{type(store).__module__}.{type(store).__name__}:{location}:{collection}:{model}"
+
+    def _data_version(self) -> int | None:
+        """Document count for stores that expose it cheaply, so writes made elsewhere miss the cache."""
+        store = self.vector_store
+        try:
+            if getattr(store, "index", None) is not None and hasattr(store.index, "ntotal"):
+                return int(store.index.ntotal)
+            if getattr(store, "_collection", None) is not None and hasattr(store._collection, "count"):
+                return int(store._collection.count())
+        except Exception:  # noqa: BLE001
+            return None
+        return None
+
+    def _ingest(self, store_key: str | None) -> None:
+        items = self.ingest_data if isinstance(self.ingest_data, list) else [self.ingest_data]
+        documents = []
+        for item in items:
+            if isinstance(item, DataFrame):
+                documents.extend(data.to_lc_document() for data in item.to_data_list())
+            elif isinstance(item, Data):
+                documents.append(item.to_lc_document())
+        if documents:
+            self.vector_store.add_documents(documents)
+            persist = getattr(self.vector_store, "persist", None)
+            if callable(persist):
+                persist()
+            if store_key is not None:
+                _QUERY_CACHE.invalidate(store_key)
+            self.log(f"Ingested {len(documents)} documents; cached results for this store were invalidated.")
+
+    def _search(self, query: str, search_filter: dict) -> list[Data]:
+        kwargs = {"k": self.number_of_results}
+        if search_filter:
+            kwargs["filter"] = search_filter
+        if self.search_type == "MMR (Max Marginal Relevance)":
+            docs = self.vector_store.max_marginal_relevance_search(query, **kwargs)
+        elif self.search_type == "Similarity with score threshold":
+            docs_with_scores = self.vector_store.similarity_search_with_relevance_scores(
+                query, score_threshold=self.search_score_threshold, **kwargs
+            )
+            docs = [doc for doc, _ in docs_with_scores]
+        else:
+            docs = self.vector_store.similarity_search(query, **kwargs)
+        return docs_to_data(docs)
+
+    def search_documents(self) -> list[Data]:
+        store_key = self._store_key()
+        if store_key is not None and getattr(self.vector_store, "langflow_ingested", False):
+            # The vector store component ingested documents while building this store
+            _QUERY_CACHE.invalidate(store_key)
+            self.vector_store.langflow_ingested = False
+        if self.ingest_data:
+            self._ingest(store_key)
+
+        query = self.search_query if isinstance(self.search_query, str) else ""
+        if not query.strip():
+            return []
+
+        search_filter = {key: value for key, value in (self.search_filter or {}).items() if key}
+        if not self.use_cache:
+            return self._search(query, search_filter)
+        if store_key is None:
+            self.status = "Cache skipped: the vector store has no stable location to key results on."
+            return self._search(query, search_filter)
+
+        key = _QUERY_CACHE.entry_key(
+            store_key,
+            {
+                "query": hashlib.sha256(query.encode()).hexdigest(),
+                "k": self.number_of_results,
+                "filter": search_filter,
+                "search_type": self.search_type,
+                "score_threshold": self.search_score_threshold,
+                "data_version": self._data_version(),
+            },
+        )
+
+        cached = _QUERY_CACHE.get(key)
+        if cached is not None:
+            data = [Data(**entry) for entry in cached]
+        else:
+            data = self._search(query, search_filter)
+            _QUERY_CACHE.put(
+                key, [{"data": dict(item.data), "text_key": item.text_key} for item in data], self.cache_ttl or 0
+            )
+
+        stats = _QUERY_CACHE.stats()
+        self.status = (
+            f"{'Cache hit' if cached is not None else 'Cache miss'} · {len(data)} results · "
+            f"hit rate {stats['hit_rate']:.1%} ({stats['hits']} hits / {stats['misses']} misses)"
+        )
+        return data
+
+    def get_cache_stats(self) -> Data:
+        stats = _QUERY_CACHE.stats()
+        self.status = stats
+        return Data(data=stats)
@@ -1,6 +1,10 @@
+import uuid
+from collections import deque
+
 from langchain_community.vectorstores import Cassandra
 
 from lfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from lfx.base.vectorstores.vector_store_connection_decorator import vector_store_connection
 from lfx.helpers.data import docs_to_data
 from lfx.inputs.inputs import BoolInput, DictInput, FloatInput
 from lfx.io import (
@@ -13,6 +17,7 @@ from lfx.io import (
 from lfx.schema.data import Data
 
 
+@vector_store_connection
 class CassandraVectorStoreComponent(LCVectorStoreComponent):
     display_name = "Cassandra"
     description = "Cassandra Vector Store with search capabilities"
@@ -61,6 +66,13 @@ class CassandraVectorStoreComponent(LCVectorStoreComponent):
             value=16,
             advanced=True,
         ),
+        IntInput(
+            name="write_concurrency",
+            display_name="Write Concurrency",
+            info="Maximum number of asynchronous insert requests in flight while ingesting.",
+            value=64,
+            advanced=True,
+        ),
         DropdownInput(
             name="setup_mode",
             display_name="Setup Mode",
@@ -180,15 +192,16 @@ class CassandraVectorStoreComponent(LCVectorStoreComponent):
 
         if documents:
             self.log(f"Adding {len(documents)} documents to the Vector Store.")
-            table = Cassandra.from_documents(
-                documents=documents,
+            table = Cassandra(
                 embedding=self.embedding,
                 table_name=self.table_name,
                 keyspace=self.keyspace,
                 ttl_seconds=self.ttl_seconds or None,
-                batch_size=self.batch_size,
                 body_index_options=body_index_options,
+                # The table must exist before concurrent writes start
+                setup_mode=SetupMode.OFF if setup_mode == SetupMode.OFF else SetupMode.SYNC,
             )
+            self._add_documents_concurrently(table, documents)
         else:
             self.log("No documents to add to the Vector Store.")
             table = Cassandra(
@@ -199,8 +212,40 @@ class CassandraVectorStoreComponent(LCVectorStoreComponent):
                 body_index_options=body_index_options,
                 setup_mode=setup_mode,
             )
+        table.langflow_ingested = bool(self.ingest_data)
         return table
 
+    def _add_documents_concurrently(self, table: Cassandra, documents) -> None:
+        """Write documents with a sliding window of asynchronous inserts.
+
+        Texts are embedded ``batch_size`` at a time. Each row is sent with the driver's async execution on
+        the table's prepared insert statement, keeping up to ``write_concurrency`` requests in flight instead
+        of waiting for every batch to finish.
+        """
+        batch_size = max(1, self.batch_size or 16)
+        concurrency = max(1, self.write_concurrency or 1)
+        ttl_seconds = self.ttl_seconds or None
+        in_flight: deque = deque()
+
+        for start in range(0, len(documents), batch_size):
+            batch = documents[start : start + batch_size]
+            vectors = self.embedding.embed_documents([doc.page_content for doc in batch])
+            for doc, vector in zip(batch, vectors):
+                if len(in_flight) >= concurrency:
+                    in_flight.popleft().result()
+                in_flight.append(
+                    table.table.put_async(
+                        row_id=uuid.uuid4().hex,
+                        body_blob=doc.page_content,
+                        vector=vector,
+                        metadata=doc.metadata or {},
+                        ttl_seconds=ttl_seconds,
+                    )
+                )
+
+        while in_flight:
+            in_flight.popleft().result()
+
     def _map_search_type(self) -> str:
         if self.search_type == "Similarity with score threshold":
             return "similarity_score_threshold"
@@ -1,4 +1,5 @@
-from copy import deepcopy
+import hashlib
+import json
 from typing import TYPE_CHECKING
 
 from chromadb.config import Settings
@@ -6,6 +7,7 @@ from langchain_chroma import Chroma
 from typing_extensions import override
 
 from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from langflow.base.vectorstores.vector_store_connection_decorator import vector_store_connection
 from langflow.base.vectorstores.utils import chroma_collection_to_data
 from langflow.inputs.inputs import BoolInput, DropdownInput, HandleInput, IntInput, StrInput
 from langflow.schema.data import Data
@@ -14,6 +16,7 @@ if TYPE_CHECKING:
     from langflow.schema.dataframe import DataFrame
 
 
+@vector_store_connection
 class ChromaVectorStoreComponent(LCVectorStoreComponent):
     """Chroma Vector Store with search capabilities."""
 
@@ -83,10 +86,32 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
             name="limit",
             display_name="Limit",
             advanced=True,
-            info="Limit the number of records to compare when Allow Duplicates is False.",
+            info="Limit the number of records loaded into the component status after ingestion.",
+        ),
+        IntInput(
+            name="dedupe_batch_size",
+            display_name="Dedupe Batch Size",
+            advanced=True,
+            info="Number of document IDs checked per request against the collection when Allow Duplicates is False.",
+            value=1000,
         ),
     ]
 
+    @staticmethod
+    def _content_hash_id(data: Data) -> str:
+        """Deterministic document ID derived from the text and metadata of a Data object."""
+        payload = json.dumps(data.data, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_existing_ids(self, vector_store: "Chroma", ids: list[str]) -> set[str]:
+        """Return which of the given IDs are already stored, querying the collection in batches."""
+        batch_size = max(1, int(self.dedupe_batch_size or 1000))
+        existing_ids: set[str] = set()
+        for start in range(0, len(ids), batch_size):
+            result = vector_store.get(ids=ids[start : start + batch_size], include=[])
+            existing_ids.update(result.get("ids", []))
+        return existing_ids
+
     @override
     @check_cached_vector_store
     def build_vector_store(self) -> Chroma:
@@ -123,6 +148,7 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
         self._add_documents_to_vector_store(chroma)
         limit = int(self.limit) if self.limit is not None and str(self.limit).strip() else None
         self.status = chroma_collection_to_data(chroma.get(limit=limit))
+        chroma.langflow_ingested = bool(self.ingest_data)
         return chroma
 
     def _add_documents_to_vector_store(self, vector_store: "Chroma") -> None:
@@ -135,25 +161,32 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
         # Convert DataFrame to Data if needed using parent's method
         ingest_data = self._prepare_ingest_data()
 
-        stored_documents_without_id = []
-        if self.allow_duplicates:
-            stored_data = []
-        else:
-            limit = int(self.limit) if self.limit is not None and str(self.limit).strip() else None
-            stored_data = chroma_collection_to_data(vector_store.get(limit=limit))
-            for value in deepcopy(stored_data):
-                del value.id
-                stored_documents_without_id.append(value)
-
         documents = []
+        ids: list[str] = []
+        seen_ids: set[str] = set()
         for _input in ingest_data or []:
             if isinstance(_input, Data):
-                if _input not in stored_documents_without_id:
+                if self.allow_duplicates:
+                    documents.append(_input.to_lc_document())
+                    continue
+                # Content-hash IDs make duplicates (in the batch or in the collection) detectable by ID lookup
+                doc_id = self._content_hash_id(_input)
+                if doc_id not in seen_ids:
+                    seen_ids.add(doc_id)
+                    ids.append(doc_id)
                     documents.append(_input.to_lc_document())
             else:
                 msg = "Vector Store Inputs must be Data objects."
                 raise TypeError(msg)
 
+        if ids:
+            existing_ids = self._get_existing_ids(vector_store, ids)
+            if existing_ids:
+                self.log(f"Skipping {len(existing_ids)} documents already in the Vector Store.")
+                kept = [(doc, doc_id) for doc, doc_id in zip(documents, ids) if doc_id not in existing_ids]
+                documents = [doc for doc, _ in kept]
+                ids = [doc_id for _, doc_id in kept]
+
         if documents and self.embedding is not None:
             self.log(f"Adding {len(documents)} documents to the Vector Store.")
             # Filter complex metadata to prevent ChromaDB errors
@@ -161,9 +194,9 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
                 from langchain_community.vectorstores.utils import filter_complex_metadata
 
                 filtered_documents = filter_complex_metadata(documents)
-                vector_store.add_documents(filtered_documents)
+                vector_store.add_documents(filtered_documents, ids=ids or None)
             except ImportError:
                 self.log("Warning: Could not import filter_complex_metadata. Adding documents without filtering.")
-                vector_store.add_documents(documents)
+                vector_store.add_documents(documents, ids=ids or None)
         else:
             self.log("No documents to add to the Vector Store.")
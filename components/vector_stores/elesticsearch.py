@@ -1,10 +1,13 @@
+import uuid
+from collections.abc import Iterator
 from typing import Any
 
-from elasticsearch import Elasticsearch
+from elasticsearch import Elasticsearch, helpers
 from langchain_core.documents import Document
 from langchain_elasticsearch import ElasticsearchStore
 
 from lfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from lfx.base.vectorstores.vector_store_connection_decorator import vector_store_connection
 from lfx.io import (
     BoolInput,
     DropdownInput,
@@ -17,6 +20,7 @@ from lfx.io import (
 from lfx.schema.data import Data
 
 
+@vector_store_connection
 class ElasticsearchVectorStoreComponent(LCVectorStoreComponent):
     """Elasticsearch Vector Store with with advanced, customizable search capabilities."""
 
@@ -106,6 +110,42 @@ class ElasticsearchVectorStoreComponent(LCVectorStoreComponent):
             advanced=True,
             info="Whether to verify SSL certificates when connecting to Elasticsearch.",
         ),
+        IntInput(
+            name="bulk_chunk_size",
+            display_name="Bulk Chunk Size",
+            info="Number of documents per bulk request when ingesting.",
+            value=500,
+            advanced=True,
+        ),
+        IntInput(
+            name="bulk_thread_count",
+            display_name="Bulk Threads",
+            info="Number of threads sending bulk requests in parallel when ingesting.",
+            value=4,
+            advanced=True,
+        ),
+        IntInput(
+            name="embedding_batch_size",
+            display_name="Embedding Batch Size",
+            info="Number of documents embedded at a time. Only this many vectors are held in memory while ingesting.",
+            value=1000,
+            advanced=True,
+        ),
+        StrInput(
+            name="ingest_refresh_interval",
+            display_name="Ingest Refresh Interval",
+            value="-1",
+            info="Index refresh_interval applied while ingesting and restored afterwards ('-1' disables refresh). "
+            "Leave empty to keep the index setting.",
+            advanced=True,
+        ),
+        IntInput(
+            name="scroll_batch_size",
+            display_name="Read Batch Size",
+            info="Number of documents fetched per page when reading the whole index.",
+            value=1000,
+            advanced=True,
+        ),
     ]
 
     @check_cached_vector_store
@@ -158,8 +198,9 @@ class ElasticsearchVectorStoreComponent(LCVectorStoreComponent):
         if self.ingest_data:
             documents = self._prepare_documents()
             if documents:
-                elasticsearch.add_documents(documents)
+                self._bulk_add_documents(elasticsearch, documents)
 
+        elasticsearch.langflow_ingested = bool(self.ingest_data)
         return elasticsearch
 
     def _prepare_documents(self) -> list[Document]:
@@ -181,10 +222,75 @@ class ElasticsearchVectorStoreComponent(LCVectorStoreComponent):
         documents = self._prepare_documents()
         if documents and self.embedding:
             self.log(f"Adding {len(documents)} documents to the Vector Store.")
-            vector_store.add_documents(documents)
+            self._bulk_add_documents(vector_store, documents)
         else:
             self.log("No documents to add to the Vector Store.")
 
+    def _bulk_add_documents(self, vector_store: ElasticsearchStore, documents: list[Document]) -> None:
+        """Embed documents in batches and index them with parallel_bulk.
+
+        The first batch goes through the store so the index is created with its vector mapping.
+        The rest are streamed as bulk actions while the refresh interval is relaxed.
+        """
+        texts = [doc.page_content for doc in documents]
+        metadatas = [doc.metadata for doc in documents]
+        embedding_batch_size = max(1, self.embedding_batch_size or 1000)
+
+        first_vectors = self.embedding.embed_documents(texts[:embedding_batch_size])
+        vector_store.add_embeddings(
+            text_embeddings=list(zip(texts[:embedding_batch_size], first_vectors)),
+            metadatas=metadatas[:embedding_batch_size],
+            refresh_indices=False,
+        )
+        if len(texts) <= embedding_batch_size:
+            vector_store.client.indices.refresh(index=self.index_name)
+            return
+
+        query_field = getattr(vector_store, "query_field", "text")
+        vector_field = getattr(vector_store, "vector_query_field", "vector")
+
+        def generate_actions():
+            for start in range(embedding_batch_size, len(texts), embedding_batch_size):
+                batch_texts = texts[start : start + embedding_batch_size]
+                vectors = self.embedding.embed_documents(batch_texts)
+                batch_metadatas = metadatas[start : start + embedding_batch_size]
+                for text, metadata, vector in zip(batch_texts, batch_metadatas, vectors):
+                    yield {
+                        "_op_type": "index",
+                        "_index": self.index_name,
+                        "_id": str(uuid.uuid4()),
+                        query_field: text,
+                        vector_field: vector,
+                        "metadata": metadata,
+                    }
+
+        client = vector_store.client
+        refresh_interval = (self.ingest_refresh_interval or "").strip()
+        previous_interval = None
+        if refresh_interval:
+            settings = client.indices.get_settings(index=self.index_name, name="index.refresh_interval")
+            previous_interval = next(iter(settings.values()), {}).get("settings", {}).get("index", {}).get(
+                "refresh_interval"
+            )
+            client.indices.put_settings(
+                index=self.index_name, settings={"index": {"refresh_interval": refresh_interval}}
+            )
+        try:
+            for _ in helpers.parallel_bulk(
+                client,
+                generate_actions(),
+                thread_count=max(1, self.bulk_thread_count or 1),
+                chunk_size=max(1, self.bulk_chunk_size or 500),
+            ):
+                pass
+        finally:
+            if refresh_interval:
+                # None resets the setting to the index default
+                client.indices.put_settings(
+                    index=self.index_name, settings={"index": {"refresh_interval": previous_interval}}
+                )
+            client.indices.refresh(index=self.index_name)
+
     def search(self, query: str | None = None) -> list[dict[str, Any]]:
         """Search for similar documents in the vector store or retrieve all documents if no query is provided."""
         vector_store = self.build_vector_store()
@@ -217,26 +323,62 @@ class ElasticsearchVectorStoreComponent(LCVectorStoreComponent):
         results = self.get_all_documents(vector_store, **search_kwargs)
         return [{"page_content": doc.page_content, "metadata": doc.metadata, "score": score} for doc, score in results]
 
-    def get_all_documents(self, vector_store: ElasticsearchStore, **kwargs) -> list[tuple[Document, float]]:
-        """Retrieve all documents from the vector store."""
+    def iter_all_documents(
+        self, vector_store: ElasticsearchStore, batch_size: int | None = None
+    ) -> Iterator[list[tuple[Document, float]]]:
+        """Stream every document of the index in batches using a point in time and search_after.
+
+        The point in time gives a consistent snapshot while paging, so memory stays bounded by the
+        batch size regardless of the index size.
+        """
         client = vector_store.client
-        index_name = self.index_name
+        batch_size = max(1, batch_size or self.scroll_batch_size or 1000)
+        vector_field = getattr(vector_store, "vector_query_field", "vector")
 
-        query = {
-            "query": {"match_all": {}},
-            "size": kwargs.get("k", self.number_of_results),
-        }
+        pit_id = client.open_point_in_time(index=self.index_name, keep_alive="1m")["id"]
+        search_after = None
+        try:
+            while True:
+                params: dict[str, Any] = {
+                    "query": {"match_all": {}},
+                    "size": batch_size,
+                    "pit": {"id": pit_id, "keep_alive": "1m"},
+                    "sort": [{"_shard_doc": "asc"}],
+                    "track_scores": True,
+                    "source_excludes": [vector_field],
+                }
+                if search_after is not None:
+                    params["search_after"] = search_after
+                response = client.search(**params)
 
-        response = client.search(index=index_name, body=query)
+                hits = response["hits"]["hits"]
+                if not hits:
+                    return
+                pit_id = response.get("pit_id", pit_id)
+                search_after = hits[-1]["sort"]
 
-        results = []
-        for hit in response["hits"]["hits"]:
-            doc = Document(
-                page_content=hit["_source"].get("text", ""),
-                metadata=hit["_source"].get("metadata", {}),
-            )
-            score = hit["_score"]
-            results.append((doc, score))
+                yield [
+                    (
+                        Document(
+                            page_content=hit["_source"].get("text", ""),
+                            metadata=hit["_source"].get("metadata", {}),
+                        ),
+                        hit["_score"],
+                    )
+                    for hit in hits
+                ]
+        finally:
+            client.close_point_in_time(id=pit_id)
+
+    def get_all_documents(self, vector_store: ElasticsearchStore, **kwargs) -> list[tuple[Document, float]]:
+        """Retrieve all documents from the vector store, up to ``k``."""
+        limit = kwargs.get("k", self.number_of_results)
+
+        results: list[tuple[Document, float]] = []
+        for batch in self.iter_all_documents(vector_store, batch_size=min(limit, self.scroll_batch_size or 1000)):
+            results.extend(batch[: limit - len(results)])
+            if len(results) >= limit:
+                break
 
         return results
 
@@ -1,13 +1,45 @@
+import copy
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
 from pathlib import Path
 
 from langchain_community.vectorstores import FAISS
 
 from lfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from lfx.base.vectorstores.vector_store_connection_decorator import vector_store_connection
 from lfx.helpers.data import docs_to_data
-from lfx.io import BoolInput, HandleInput, IntInput, StrInput
+from lfx.io import BoolInput, DropdownInput, HandleInput, IntInput, StrInput
 from lfx.schema.data import Data
 
+# Process-wide cache of loaded indexes: (folder, index_name) -> (index file mtime, FAISS store)
+_LOADED_INDEXES: dict[tuple[str, str], tuple[float, FAISS]] = {}
+_LOADED_INDEXES_LOCK = threading.Lock()
+# One lock per index path, held while appending so concurrent components do not overwrite each other's additions,
+# and while reading the files so an in-process load never sees a half-replaced .faiss/.pkl pair
+_INDEX_WRITE_LOCKS: dict[tuple[str, str], threading.RLock] = {}
 
+# faiss.index_factory descriptions for the supported index types
+INDEX_TYPES = ["Flat", "IVF-Flat", "IVF-PQ", "HNSW"]
+
+
+class _ParameterizedIndex:
+    """Wraps a FAISS index so every search call uses the given SearchParameters."""
+
+    def __init__(self, index, params) -> None:
+        self._index = index
+        self._params = params
+
+    def search(self, x, k, **kwargs):
+        return self._index.search(x, k, params=self._params, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._index, name)
+
+
+@vector_store_connection
 class FaissVectorStoreComponent(LCVectorStoreComponent):
     """FAISS Vector Store with search capabilities."""
 
@@ -36,6 +68,14 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             advanced=True,
             value=True,
         ),
+        BoolInput(
+            name="append_mode",
+            display_name="Append to Existing Index",
+            info="Load the saved index and embed only documents whose content hash is not already in it, "
+            "instead of rebuilding the index from all ingest data.",
+            advanced=True,
+            value=False,
+        ),
         HandleInput(name="embedding", display_name="Embedding", input_types=["Embeddings"]),
         IntInput(
             name="number_of_results",
@@ -44,6 +84,64 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             advanced=True,
             value=4,
         ),
+        DropdownInput(
+            name="index_type",
+            display_name="Index Type",
+            info="Flat is exact search. IVF-Flat, IVF-PQ and HNSW are approximate indexes that trade "
+            "some recall for lower query time and, with PQ, much lower memory. Applies when a new index is built.",
+            options=INDEX_TYPES,
+            value="Flat",
+            advanced=True,
+        ),
+        IntInput(
+            name="nlist",
+            display_name="IVF Lists",
+            info="Number of IVF clusters. A common choice is about 4 * sqrt(number of vectors).",
+            advanced=True,
+            value=1024,
+        ),
+        IntInput(
+            name="pq_m",
+            display_name="PQ Sub-quantizers",
+            info="Number of PQ sub-vectors for IVF-PQ. Must divide the embedding dimension.",
+            advanced=True,
+            value=16,
+        ),
+        IntInput(
+            name="pq_nbits",
+            display_name="PQ Bits",
+            info="Bits per PQ sub-vector code for IVF-PQ.",
+            advanced=True,
+            value=8,
+        ),
+        IntInput(
+            name="hnsw_m",
+            display_name="HNSW M",
+            info="Number of neighbors per node in the HNSW graph.",
+            advanced=True,
+            value=32,
+        ),
+        IntInput(
+            name="training_sample_size",
+            display_name="Training Sample Size",
+            info="Maximum number of vectors sampled to train IVF indexes.",
+            advanced=True,
+            value=100000,
+        ),
+        IntInput(
+            name="nprobe",
+            display_name="nprobe",
+            info="Number of IVF lists visited per query. Higher values improve recall at the cost of latency.",
+            advanced=True,
+            value=16,
+        ),
+        IntInput(
+            name="ef_search",
+            display_name="efSearch",
+            info="Size of the HNSW candidate list per query. Higher values improve recall at the cost of latency.",
+            advanced=True,
+            value=64,
+        ),
     ]
 
     @staticmethod
@@ -63,9 +161,212 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             return Path(self.resolve_path(self.persist_directory))
         return Path()
 
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """Deterministic document ID derived from the page content."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_index_path(self) -> Path:
+        return self.get_persist_directory() / f"{self.index_name}.faiss"
+
+    def load_index(self) -> FAISS | None:
+        """Load the saved index, reusing the in-process copy while the file on disk is unchanged."""
+        path = self.get_persist_directory()
+        index_path = self.get_index_path()
+        if not index_path.exists():
+            return None
+
+        key = (str(path), self.index_name)
+        mtime = index_path.stat().st_mtime
+        with _LOADED_INDEXES_LOCK:
+            cached = _LOADED_INDEXES.get(key)
+            if cached is not None and cached[0] == mtime:
+                # Shallow copy: the index is shared, but queries use this component's embedding model
+                vector_store = copy.copy(cached[1])
+                vector_store.embedding_function = self.embedding
+                return vector_store
+
+        with self.get_write_lock():
+            mtime = index_path.stat().st_mtime
+            vector_store = FAISS.load_local(
+                folder_path=str(path),
+                embeddings=self.embedding,
+                index_name=self.index_name,
+                allow_dangerous_deserialization=self.allow_dangerous_deserialization,
+            )
+        with _LOADED_INDEXES_LOCK:
+            _LOADED_INDEXES[key] = (mtime, vector_store)
+        return vector_store
+
+    def save_index(self, vector_store: FAISS) -> None:
+        """Save the index to a temporary folder and move each file into place, so readers never see a partial file.
+
+        Only each file's replacement is atomic: the .pkl and .faiss files are swapped one after the other. Loads
+        in this process take the write lock and never see a mixed pair, but another process reading the folder
+        between the two renames can load the new docstore with the old index.
+        """
+        path = self.get_persist_directory()
+        tmp_dir = tempfile.mkdtemp(prefix=f".{self.index_name}.", dir=str(path))
+        try:
+            vector_store.save_local(tmp_dir, self.index_name)
+            # Replace the docstore first: the .faiss file is what readers check for
+            with self.get_write_lock():
+                for suffix in (".pkl", ".faiss"):
+                    os.replace(Path(tmp_dir) / f"{self.index_name}{suffix}", path / f"{self.index_name}{suffix}")
+        except Exception:
+            # The in-process copy may hold unsaved additions; make the next load read from disk
+            with _LOADED_INDEXES_LOCK:
+                _LOADED_INDEXES.pop((str(path), self.index_name), None)
+            raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        with _LOADED_INDEXES_LOCK:
+            _LOADED_INDEXES[(str(path), self.index_name)] = (self.get_index_path().stat().st_mtime, vector_store)
+
+    def get_write_lock(self) -> threading.RLock:
+        key = (str(self.get_persist_directory()), self.index_name)
+        with _LOADED_INDEXES_LOCK:
+            return _INDEX_WRITE_LOCKS.setdefault(key, threading.RLock())
+
+    def copy_index(self, vector_store: FAISS) -> FAISS:
+        """Deep copy a loaded store so additions never touch the cached copy before they are saved."""
+        import faiss as faiss_lib
+        from langchain_community.docstore.in_memory import InMemoryDocstore
+
+        return FAISS(
+            embedding_function=self.embedding,
+            index=faiss_lib.clone_index(vector_store.index),
+            docstore=InMemoryDocstore(dict(vector_store.docstore._dict)),
+            index_to_docstore_id=dict(vector_store.index_to_docstore_id),
+            normalize_L2=vector_store._normalize_L2,
+            distance_strategy=vector_store.distance_strategy,
+        )
+
+    def get_index_factory(self, dimension: int, num_vectors: int) -> str:
+        """Return the faiss.index_factory description for the selected index type."""
+        index_type = self.index_type or "Flat"
+        if index_type == "Flat":
+            return "Flat"
+        if index_type == "HNSW":
+            return f"HNSW{int(self.hnsw_m)},Flat"
+
+        # IVF needs at least one training vector per list
+        training_vectors = min(num_vectors, max(1, int(self.training_sample_size)))
+        nlist = max(1, min(int(self.nlist), training_vectors))
+        if nlist != int(self.nlist):
+            self.log(f"Reducing IVF lists from {self.nlist} to {nlist} to match the number of training vectors.")
+        if training_vectors < 39 * nlist:
+            self.log(
+                f"Training {nlist} IVF lists on {training_vectors} vectors; about {39 * nlist} are recommended "
+                "for good clustering."
+            )
+        if index_type == "IVF-Flat":
+            return f"IVF{nlist},Flat"
+        if index_type == "IVF-PQ":
+            if dimension % int(self.pq_m) != 0:
+                msg = f"PQ Sub-quantizers ({self.pq_m}) must divide the embedding dimension ({dimension})."
+                raise ValueError(msg)
+            # Each PQ codebook has 2**nbits centroids and needs at least that many training vectors
+            min_training_vectors = 2 ** int(self.pq_nbits)
+            if training_vectors < min_training_vectors:
+                self.log(
+                    f"IVF-PQ with {self.pq_nbits} bits needs at least {min_training_vectors} training vectors, "
+                    f"but only {training_vectors} are available. Falling back to a Flat index."
+                )
+                return "Flat"
+            return f"IVF{nlist},PQ{int(self.pq_m)}x{int(self.pq_nbits)}"
+        msg = f"Unsupported index type: {index_type}"
+        raise ValueError(msg)
+
+    def create_index(self, texts: list[str], embeddings: list[list[float]], metadatas: list[dict], ids: list[str]):
+        """Create a FAISS store backed by the selected index type, training it on a sample when needed."""
+        import faiss as faiss_lib
+        import numpy as np
+        from langchain_community.docstore.in_memory import InMemoryDocstore
+
+        vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+        factory = self.get_index_factory(vectors.shape[1], vectors.shape[0])
+        index = faiss_lib.index_factory(vectors.shape[1], factory)
+
+        if not index.is_trained:
+            sample_size = min(len(vectors), max(1, int(self.training_sample_size)))
+            rng = np.random.default_rng(0)
+            sample = vectors[rng.choice(len(vectors), size=sample_size, replace=False)]
+            self.log(f"Training {factory} index on {sample_size} vectors.")
+            index.train(sample)
+
+        vector_store = FAISS(
+            embedding_function=self.embedding,
+            index=index,
+            docstore=InMemoryDocstore(),
+            index_to_docstore_id={},
+        )
+        vector_store.add_embeddings(text_embeddings=list(zip(texts, embeddings)), metadatas=metadatas, ids=ids)
+        return vector_store
+
+    def apply_search_parameters(self, vector_store: FAISS) -> FAISS:
+        """Return a view of the store that searches with this component's nprobe/efSearch.
+
+        The parameters are passed to each search call instead of being set on the index, which is shared
+        with other components through the loaded-index cache.
+        """
+        import faiss as faiss_lib
+
+        index = vector_store.index
+        if faiss_lib.try_extract_index_ivf(index) is not None:
+            params = faiss_lib.SearchParametersIVF(nprobe=max(1, int(self.nprobe)))
+        elif hasattr(index, "hnsw"):
+            params = faiss_lib.SearchParametersHNSW(efSearch=max(int(self.number_of_results), int(self.ef_search)))
+        else:
+            return vector_store
+        search_store = copy.copy(vector_store)
+        search_store.index = _ParameterizedIndex(index, params)
+        return search_store
+
+    def _filter_new_documents(self, documents: list, existing_ids: set[str]) -> tuple[list, list[str]]:
+        """Drop documents whose content hash is already stored or repeated within the batch."""
+        new_documents = []
+        new_ids = []
+        seen = set(existing_ids)
+        for document in documents:
+            doc_id = self.content_hash(document.page_content)
+            if doc_id in seen:
+                continue
+            seen.add(doc_id)
+            new_documents.append(document)
+            new_ids.append(doc_id)
+        return new_documents, new_ids
+
+    def _document_ids(self, documents: list) -> list[str]:
+        """Content hash ids for every document; repeated contents get a numbered suffix and are all kept."""
+        ids = []
+        counts: dict[str, int] = {}
+        for document in documents:
+            doc_id = self.content_hash(document.page_content)
+            counts[doc_id] = counts.get(doc_id, 0) + 1
+            ids.append(doc_id if counts[doc_id] == 1 else f"{doc_id}-{counts[doc_id] - 1}")
+        return ids
+
+    def _attach_persist_hook(self, vector_store: FAISS) -> FAISS:
+        """Let consumers of the vector store handle (e.g. pipelined ingestion) save documents they add."""
+
+        def persist() -> None:
+            with self.get_write_lock():
+                self.save_index(vector_store)
+
+        vector_store.persist = persist
+        return vector_store
+
     @check_cached_vector_store
     def build_vector_store(self) -> FAISS:
         """Builds the FAISS object."""
+        vector_store = self._attach_persist_hook(self._build_or_update_index())
+        vector_store.langflow_ingested = bool(self.ingest_data)
+        vector_store.langflow_store_location = str(self.get_index_path())
+        return vector_store
+
+    def _build_or_update_index(self) -> FAISS:
         path = self.get_persist_directory()
         path.mkdir(parents=True, exist_ok=True)
 
@@ -79,30 +380,59 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             else:
                 documents.append(_input)
 
-        faiss = FAISS.from_documents(documents=documents, embedding=self.embedding)
-        faiss.save_local(str(path), self.index_name)
+        if not self.append_mode:
+            return self._build_new_index(documents, self._document_ids(documents))
+
+        with self.get_write_lock():
+            loaded = self.load_index()
+            if loaded is None:
+                documents, ids = self._filter_new_documents(documents, set())
+                return self._build_new_index(documents, ids)
+
+            documents, ids = self._filter_new_documents(documents, set(loaded.index_to_docstore_id.values()))
+            if not documents:
+                self.log("No new documents to add to the FAISS index.")
+                return loaded
+
+            self.log(f"Adding {len(documents)} new documents to the FAISS index.")
+            texts = [document.page_content for document in documents]
+            embeddings = self.embedding.embed_documents(texts)
+            # The cached store is only replaced once the new version is on disk
+            faiss = self.copy_index(loaded)
+            faiss.add_embeddings(
+                text_embeddings=list(zip(texts, embeddings)),
+                metadatas=[document.metadata for document in documents],
+                ids=ids,
+            )
+            self.save_index(faiss)
+            return faiss
+
+    def _build_new_index(self, documents: list, ids: list[str]) -> FAISS:
+        if (self.index_type or "Flat") == "Flat":
+            faiss = FAISS.from_documents(documents=documents, embedding=self.embedding, ids=ids)
+        else:
+            texts = [document.page_content for document in documents]
+            faiss = self.create_index(
+                texts,
+                self.embedding.embed_documents(texts),
+                [document.metadata for document in documents],
+                ids,
+            )
+        self.save_index(faiss)
         return faiss
 
     def search_documents(self) -> list[Data]:
         """Search for documents in the FAISS vector store."""
-        path = self.get_persist_directory()
-        index_path = path / f"{self.index_name}.faiss"
-
-        if not index_path.exists():
+        vector_store = self.load_index()
+        if vector_store is None:
             vector_store = self.build_vector_store()
-        else:
-            vector_store = FAISS.load_local(
-                folder_path=str(path),
-                embeddings=self.embedding,
-                index_name=self.index_name,
-                allow_dangerous_deserialization=self.allow_dangerous_deserialization,
-            )
 
         if not vector_store:
             msg = "Failed to load the FAISS index."
             raise ValueError(msg)
 
         if self.search_query and isinstance(self.search_query, str) and self.search_query.strip():
+            vector_store = self.apply_search_parameters(vector_store)
             docs = vector_store.similarity_search(
                 query=self.search_query,
                 k=self.number_of_results,
@@ -4,14 +4,17 @@ import time
 import certifi
 from langchain_community.vectorstores import MongoDBAtlasVectorSearch
 from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
 from pymongo.operations import SearchIndexModel
 
 from lfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from lfx.base.vectorstores.vector_store_connection_decorator import vector_store_connection
 from lfx.helpers.data import docs_to_data
 from lfx.io import BoolInput, DropdownInput, HandleInput, IntInput, SecretStrInput, StrInput
 from lfx.schema.data import Data
 
 
+@vector_store_connection
 class MongoVectorStoreComponent(LCVectorStoreComponent):
     display_name = "MongoDB Atlas"
     description = "MongoDB Atlas Vector Store with search capabilities"
@@ -91,6 +94,20 @@ class MongoVectorStoreComponent(LCVectorStoreComponent):
             info="Quantization reduces memory costs converting 32-bit floats to smaller data types",
             advanced=True,
         ),
+        IntInput(
+            name="insert_batch_size",
+            display_name="Insert Batch Size",
+            info="Number of documents embedded and written per unordered insert_many call.",
+            value=1000,
+            advanced=True,
+        ),
+        IntInput(
+            name="index_ready_timeout",
+            display_name="Index Ready Timeout",
+            info="Maximum seconds to wait for the search index to become queryable.",
+            value=300,
+            advanced=True,
+        ),
     ]
 
     @check_cached_vector_store
@@ -150,11 +167,13 @@ class MongoVectorStoreComponent(LCVectorStoreComponent):
 
         if documents:
             self.__insert_mode(collection)
+            self.__insert_documents(collection, documents)
 
-            return MongoDBAtlasVectorSearch.from_documents(
-                documents=documents, embedding=self.embedding, collection=collection, index_name=self.index_name
-            )
-        return MongoDBAtlasVectorSearch(embedding=self.embedding, collection=collection, index_name=self.index_name)
+        vector_store = MongoDBAtlasVectorSearch(
+            embedding=self.embedding, collection=collection, index_name=self.index_name
+        )
+        vector_store.langflow_ingested = bool(self.ingest_data)
+        return vector_store
 
     def search_documents(self) -> list[Data]:
         from bson.objectid import ObjectId
@@ -182,6 +201,53 @@ class MongoVectorStoreComponent(LCVectorStoreComponent):
         if self.insert_mode == "overwrite":
             collection.delete_many({})  # Delete all documents while preserving collection structure
 
+    def __insert_documents(self, collection: Collection, documents: list) -> None:
+        """Embed and insert documents in batches with unordered insert_many.
+
+        Unordered inserts let the server apply a batch in parallel and continue past failed documents.
+        Duplicate key errors are skipped; any other write error is raised.
+        """
+        batch_size = max(1, self.insert_batch_size or 1000)
+        inserted = 0
+        for start in range(0, len(documents), batch_size):
+            batch = documents[start : start + batch_size]
+            vectors = self.embedding.embed_documents([doc.page_content for doc in batch])
+            # Same layout as MongoDBAtlasVectorSearch: text, embedding and flattened metadata
+            records = [
+                {"text": doc.page_content, "embedding": vector, **doc.metadata} for doc, vector in zip(batch, vectors)
+            ]
+            try:
+                inserted += len(collection.insert_many(records, ordered=False).inserted_ids)
+            except BulkWriteError as e:
+                errors = [error for error in e.details.get("writeErrors", []) if error.get("code") != 11000]
+                if errors:
+                    msg = f"Failed to insert {len(errors)} documents into MongoDB Atlas: {errors[0].get('errmsg')}"
+                    raise ValueError(msg) from e
+                inserted += e.details.get("nInserted", 0)
+        self.log(f"Inserted {inserted} documents into {self.db_name}.{self.collection_name}")
+
+    def wait_for_search_index(self, collection: Collection) -> None:
+        """Poll the search index with exponential backoff until it is queryable.
+
+        Args:
+            collection (Collection): The collection that owns the search index.
+        """
+        deadline = time.monotonic() + max(0, self.index_ready_timeout or 0)
+        delay = 1.0
+        while True:
+            index = next(iter(collection.list_search_indexes(self.index_name)), None)
+            if index is not None and index.get("queryable") and index.get("status", "READY") == "READY":
+                return
+            if index is not None and index.get("status") == "FAILED":
+                msg = f"Search index '{self.index_name}' failed to build."
+                raise ValueError(msg)
+            if time.monotonic() + delay > deadline:
+                status = index.get("status") if index else "missing"
+                msg = f"Search index '{self.index_name}' is not queryable yet (status: {status})."
+                raise TimeoutError(msg)
+            time.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
     def verify_search_index(self, collection: Collection) -> None:
         """Verify if the search index exists, if not, create it.
 
@@ -196,7 +262,8 @@ class MongoVectorStoreComponent(LCVectorStoreComponent):
         if self.index_name not in index_names and index_type != "vectorSearch":
             collection.create_search_index(self.__create_index_definition())
 
-            time.sleep(20)  # Give some time for index to be ready
+        # Wait until the index is built, so the first queries do not silently return nothing
+        self.wait_for_search_index(collection)
 
     def __create_index_definition(self) -> SearchIndexModel:
         fields = [
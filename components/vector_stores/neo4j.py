@@ -1,9 +1,14 @@
 from lfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from lfx.base.vectorstores.vector_store_connection_decorator import vector_store_connection
 from lfx.helpers.data import docs_to_data
 from lfx.io import StrInput, SecretStrInput, IntInput, DropdownInput, FloatInput, HandleInput
 from lfx.schema.data import Data
 from lfx.log import logger
 
+NODE_LABEL = "Chunk"
+TEXT_PROPERTY = "text"
+EMBEDDING_PROPERTY = "embedding"
+
 
 def normalize_neo4j_uri(uri: str) -> str:
     """
@@ -50,6 +55,115 @@ def normalize_neo4j_uri(uri: str) -> str:
     return uri
 
 
+def flatten_metadata(value, max_depth=10, current_depth=0):
+    """
+    Flatten metadata values to ensure Neo4j compatibility.
+    Neo4j only accepts primitive types (str, int, float, bool) or arrays of primitives.
+    Nested dicts are either flattened (with key prefixes) or converted to JSON strings.
+    """
+    if current_depth >= max_depth:
+        # Prevent infinite recursion, convert to string
+        return str(value)
+    
+    # Handle None
+    if value is None:
+        return None
+    
+    # Handle primitive types (Neo4j compatible)
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    
+    # Handle lists - recursively process each item
+    if isinstance(value, list):
+        flattened_list = []
+        for item in value:
+            flattened_item = flatten_metadata(item, max_depth, current_depth + 1)
+            # Only add if it's a primitive type
+            if isinstance(flattened_item, (str, int, float, bool, type(None))):
+                flattened_list.append(flattened_item)
+            else:
+                # Convert complex types to string
+                flattened_list.append(str(flattened_item))
+        return flattened_list
+    
+    # Handle dicts - flatten with key prefixes or convert to JSON string
+    if isinstance(value, dict):
+        # If dict is too complex or has nested dicts, convert to JSON string
+        has_nested_dicts = any(isinstance(v, dict) for v in value.values())
+        if has_nested_dicts or len(value) > 5:
+            # Convert to JSON string for complex nested structures
+            import json
+            try:
+                return json.dumps(value, default=str)
+            except (TypeError, ValueError):
+                return str(value)
+        else:
+            # Flatten simple dicts with key prefixes
+            flattened = {}
+            for k, v in value.items():
+                flat_key = str(k)
+                flat_value = flatten_metadata(v, max_depth, current_depth + 1)
+                # Only add if value is primitive
+                if isinstance(flat_value, (str, int, float, bool, type(None), list)):
+                    flattened[flat_key] = flat_value
+                else:
+                    flattened[flat_key] = str(flat_value)
+            return flattened
+    
+    # Handle Properties objects
+    if hasattr(value, '__class__') and 'Properties' in str(type(value)):
+        try:
+            if hasattr(value, 'model_dump'):
+                dict_value = value.model_dump()
+            elif hasattr(value, 'dict'):
+                dict_value = value.dict()
+            elif hasattr(value, '__dict__'):
+                dict_value = dict(value.__dict__)
+            else:
+                return str(value)
+            # Recursively flatten the dict
+            return flatten_metadata(dict_value, max_depth, current_depth + 1)
+        except (TypeError, ValueError, AttributeError):
+            return str(value)
+    
+    # Convert all other types to string
+    return str(value)
+
+
+_NEO4J_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+def flatten_metadata_rows(metadatas: list[dict]) -> list[dict]:
+    """
+    Flatten a batch of metadata dicts column by column.
+    Columns whose values are all primitives are copied as-is; only columns holding
+    nested values go through flatten_metadata.
+    """
+    missing = object()
+    keys = list(dict.fromkeys(key for metadata in metadatas for key in metadata))
+    columns = {}
+    for key in keys:
+        column = [metadata.get(key, missing) for metadata in metadatas]
+        if not all(type(value) in _NEO4J_PRIMITIVES or value is missing for value in column):
+            column = [value if value is missing else _clean_metadata_value(value) for value in column]
+        columns[str(key)] = column
+
+    return [
+        {key: column[i] for key, column in columns.items() if column[i] is not missing}
+        for i in range(len(metadatas))
+    ]
+
+
+def _clean_metadata_value(value):
+    # Flatten the value, then make sure it is a valid Neo4j type
+    flattened_value = flatten_metadata(value)
+    if isinstance(flattened_value, (*_NEO4J_PRIMITIVES, list)):
+        return flattened_value
+    # Convert to string as last resort
+    return str(flattened_value)
+
+
+@vector_store_connection
 class Neo4jVectorStoreComponent(LCVectorStoreComponent):
     display_name: str = "Neo4j"
     description: str = "Implementation of Vector Store using Neo4j with search capabilities"
@@ -119,6 +233,13 @@ class Neo4jVectorStoreComponent(LCVectorStoreComponent):
             value=0,
             advanced=True,
         ),
+        IntInput(
+            name="batch_size",
+            display_name="Batch Size",
+            info="Number of documents embedded and written per UNWIND transaction.",
+            value=1000,
+            advanced=True,
+        ),
     ]
 
     @check_cached_vector_store
@@ -135,100 +256,10 @@ class Neo4jVectorStoreComponent(LCVectorStoreComponent):
         # Convert DataFrame to Data if needed using parent's method
         self.ingest_data = self._prepare_ingest_data()
 
-        def flatten_metadata(value, max_depth=10, current_depth=0):
-            """
-            Flatten metadata values to ensure Neo4j compatibility.
-            Neo4j only accepts primitive types (str, int, float, bool) or arrays of primitives.
-            Nested dicts are either flattened (with key prefixes) or converted to JSON strings.
-            """
-            if current_depth >= max_depth:
-                # Prevent infinite recursion, convert to string
-                return str(value)
-            
-            # Handle None
-            if value is None:
-                return None
-            
-            # Handle primitive types (Neo4j compatible)
-            if isinstance(value, (str, int, float, bool)):
-                return value
-            
-            # Handle lists - recursively process each item
-            if isinstance(value, list):
-                flattened_list = []
-                for item in value:
-                    flattened_item = flatten_metadata(item, max_depth, current_depth + 1)
-                    # Only add if it's a primitive type
-                    if isinstance(flattened_item, (str, int, float, bool, type(None))):
-                        flattened_list.append(flattened_item)
-                    else:
-                        # Convert complex types to string
-                        flattened_list.append(str(flattened_item))
-                return flattened_list
-            
-            # Handle dicts - flatten with key prefixes or convert to JSON string
-            if isinstance(value, dict):
-                # If dict is too complex or has nested dicts, convert to JSON string
-                has_nested_dicts = any(isinstance(v, dict) for v in value.values())
-                if has_nested_dicts or len(value) > 5:
-                    # Convert to JSON string for complex nested structures
-                    import json
-                    try:
-                        return json.dumps(value, default=str)
-                    except (TypeError, ValueError):
-                        return str(value)
-                else:
-                    # Flatten simple dicts with key prefixes
-                    flattened = {}
-                    for k, v in value.items():
-                        flat_key = str(k)
-                        flat_value = flatten_metadata(v, max_depth, current_depth + 1)
-                        # Only add if value is primitive
-                        if isinstance(flat_value, (str, int, float, bool, type(None), list)):
-                            flattened[flat_key] = flat_value
-                        else:
-                            flattened[flat_key] = str(flat_value)
-                    return flattened
-            
-            # Handle Properties objects
-            if hasattr(value, '__class__') and 'Properties' in str(type(value)):
-                try:
-                    if hasattr(value, 'model_dump'):
-                        dict_value = value.model_dump()
-                    elif hasattr(value, 'dict'):
-                        dict_value = value.dict()
-                    elif hasattr(value, '__dict__'):
-                        dict_value = dict(value.__dict__)
-                    else:
-                        return str(value)
-                    # Recursively flatten the dict
-                    return flatten_metadata(dict_value, max_depth, current_depth + 1)
-                except (TypeError, ValueError, AttributeError):
-                    return str(value)
-            
-            # Convert all other types to string
-            return str(value)
-
         documents = []
         for _input in self.ingest_data or []:
             if isinstance(_input, Data):
-                doc = _input.to_lc_document()
-                # Clean and flatten metadata to ensure Neo4j compatibility
-                if hasattr(doc, 'metadata') and doc.metadata:
-                    clean_metadata = {}
-                    for key, value in doc.metadata.items():
-                        # Flatten the value to ensure it's Neo4j-compatible
-                        flattened_value = flatten_metadata(value)
-                        # Neo4j property keys must be strings
-                        clean_key = str(key)
-                        # Only add if value is a valid Neo4j type
-                        if isinstance(flattened_value, (str, int, float, bool, type(None), list)):
-                            clean_metadata[clean_key] = flattened_value
-                        else:
-                            # Convert to string as last resort
-                            clean_metadata[clean_key] = str(flattened_value)
-                    doc.metadata = clean_metadata
-                documents.append(doc)
+                documents.append(_input.to_lc_document())
             else:
                 documents.append(_input)
 
@@ -237,14 +268,25 @@ class Neo4jVectorStoreComponent(LCVectorStoreComponent):
         logger.debug(f"Using Neo4j URI: {connection_url}")
 
         if documents:
-            neo4j_vector = Neo4jVector.from_documents(
-                documents=documents,
+            dimension = self._bulk_load_documents(documents, connection_url)
+
+            # The vector index is created once the nodes are loaded, not maintained row by row
+            neo4j_vector = Neo4jVector(
                 embedding=self.embedding,
                 url=connection_url,
                 username=self.username,
                 password=self.password,
                 database=self.database_name,
+                index_name=self.index_name,
+                node_label=NODE_LABEL,
+                text_node_property=TEXT_PROPERTY,
+                embedding_node_property=EMBEDDING_PROPERTY,
             )
+            neo4j_vector.embedding_dimension = dimension
+            existing_index = neo4j_vector.retrieve_existing_index()
+            existing_dimension = existing_index[0] if isinstance(existing_index, tuple) else existing_index
+            if existing_dimension is None:
+                neo4j_vector.create_new_index()
         else:
             neo4j_vector = Neo4jVector.from_existing_index(
                 embedding=self.embedding,
@@ -255,8 +297,63 @@ class Neo4jVectorStoreComponent(LCVectorStoreComponent):
                 index_name=self.index_name,
             )
 
+        neo4j_vector.langflow_ingested = bool(self.ingest_data)
         return neo4j_vector
 
+    def _bulk_load_documents(self, documents, connection_url: str) -> int:
+        """Embed and write documents in batches, one UNWIND transaction per batch.
+
+        Returns:
+            int: The embedding dimension.
+        """
+        from hashlib import md5
+
+        from neo4j import GraphDatabase
+
+        texts = [doc.page_content for doc in documents]
+        metadatas = flatten_metadata_rows([doc.metadata or {} for doc in documents])
+        batch_size = max(1, int(self.batch_size or 1000))
+
+        import_query = (
+            f"UNWIND $rows AS row "
+            f"MERGE (c:`{NODE_LABEL}` {{id: row.id}}) "
+            f"SET c.`{TEXT_PROPERTY}` = row.text, c.`{EMBEDDING_PROPERTY}` = row.embedding "
+            f"SET c += row.metadata"
+        )
+
+        dimension = 0
+        driver = GraphDatabase.driver(connection_url, auth=(self.username, self.password))
+        try:
+            with driver.session(database=self.database_name) as session:
+                # MERGE on id needs an index, otherwise every row scans all chunks.
+                # Backtick-quoted (with backticks doubled) so any index name is a valid identifier.
+                id_index_name = f"{self.index_name}_id".replace("`", "``")
+                session.run(
+                    f"CREATE INDEX `{id_index_name}` IF NOT EXISTS FOR (c:`{NODE_LABEL}`) ON (c.id)"
+                ).consume()
+
+                for start in range(0, len(texts), batch_size):
+                    batch_texts = texts[start : start + batch_size]
+                    vectors = self.embedding.embed_documents(batch_texts)
+                    if vectors:
+                        dimension = len(vectors[0])
+                    rows = [
+                        {
+                            # Same content-derived ids as Neo4jVector, so re-ingesting updates nodes in place
+                            "id": md5(text.encode("utf-8")).hexdigest(),  # noqa: S324
+                            "text": text,
+                            "embedding": vector,
+                            "metadata": metadata,
+                        }
+                        for text, vector, metadata in zip(batch_texts, vectors, metadatas[start : start + batch_size])
+                    ]
+                    session.execute_write(lambda tx, rows=rows: tx.run(import_query, rows=rows).consume())
+                    logger.debug(f"Loaded {start + len(rows)}/{len(texts)} documents into Neo4j")
+        finally:
+            driver.close()
+
+        return dimension
+
     def search_documents(self) -> list[Data]:
         vector_store = self.build_vector_store()
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import itertools
 import json
 import uuid
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from opensearchpy import OpenSearch, helpers
@@ -57,6 +59,11 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
         "ef_construction",
         "m",
         "docs_metadata",
+        "bulk_thread_count",
+        "bulk_chunk_size",
+        "bulk_max_chunk_mb",
+        "embedding_batch_size",
+        "disable_refresh_during_ingest",
     ]
 
     inputs = [
@@ -245,6 +252,48 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
                 "Disable for self-signed certificates in development environments."
             ),
         ),
+        # ----- Bulk ingestion -----
+        IntInput(
+            name="bulk_thread_count",
+            display_name="Bulk Threads",
+            value=4,
+            advanced=True,
+            info="Number of threads sending bulk requests in parallel during ingestion.",
+        ),
+        IntInput(
+            name="bulk_chunk_size",
+            display_name="Bulk Chunk Size",
+            value=500,
+            advanced=True,
+            info="Maximum number of documents per bulk request.",
+        ),
+        IntInput(
+            name="bulk_max_chunk_mb",
+            display_name="Bulk Max Chunk Size (MB)",
+            value=10,
+            advanced=True,
+            info="Maximum size of a single bulk request in megabytes.",
+        ),
+        IntInput(
+            name="embedding_batch_size",
+            display_name="Embedding Batch Size",
+            value=1000,
+            advanced=True,
+            info=(
+                "Number of documents embedded at a time. Vectors are streamed into bulk requests batch by batch, "
+                "so only this many vectors are held in memory."
+            ),
+        ),
+        BoolInput(
+            name="disable_refresh_during_ingest",
+            display_name="Disable Refresh During Ingest",
+            value=True,
+            advanced=True,
+            info=(
+                "Set the index refresh_interval to -1 while loading an existing index and restore it afterwards. "
+                "Not applied on Amazon OpenSearch Serverless."
+            ),
+        ),
     ]
 
     # ---------- helper functions for index management ----------
@@ -325,26 +374,28 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
         self,
         client: OpenSearch,
         index_name: str,
-        embeddings: list[list[float]],
+        embeddings: list[list[float]] | Iterable[tuple[int, list[list[float]]]],
         texts: list[str],
         metadatas: list[dict] | None = None,
         ids: list[str] | None = None,
         vector_field: str = "vector_field",
         text_field: str = "text",
         mapping: dict | None = None,
-        max_chunk_bytes: int | None = 1 * 1024 * 1024,
+        max_chunk_bytes: int | None = 10 * 1024 * 1024,
         *,
         is_aoss: bool = False,
     ) -> list[str]:
         """Efficiently ingest multiple documents with embeddings into OpenSearch.
 
-        This method uses bulk operations to insert documents with their vector
-        embeddings and metadata into the specified OpenSearch index.
+        Bulk actions are generated lazily and sent with ``helpers.parallel_bulk``, so only the
+        vectors of the batch currently being streamed are held in memory. Per-document errors are
+        collected instead of aborting the load, and reported once all chunks were sent.
 
         Args:
             client: OpenSearch client instance
             index_name: Target index for document storage
-            embeddings: List of vector embeddings for each document
+            embeddings: Either a list with one vector per document, or an iterable of
+                ``(start_offset, vectors)`` batches aligned with ``texts``
             texts: List of document texts
             metadatas: Optional metadata dictionaries for each document
             ids: Optional document IDs (UUIDs generated if not provided)
@@ -356,34 +407,100 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
 
         Returns:
             List of document IDs that were successfully ingested
+
+        Raises:
+            ValueError: If any document failed to index (successful documents stay indexed)
         """
         if not mapping:
             mapping = {}
 
-        requests = []
-        return_ids = []
-
-        for i, text in enumerate(texts):
-            metadata = metadatas[i] if metadatas else {}
-            _id = ids[i] if ids else str(uuid.uuid4())
-            request = {
-                "_op_type": "index",
-                "_index": index_name,
-                vector_field: embeddings[i],
-                text_field: text,
-                **metadata,
-            }
-            if is_aoss:
-                request["id"] = _id
-            else:
-                request["_id"] = _id
-            requests.append(request)
-            return_ids.append(_id)
+        if isinstance(embeddings, list):
+            embeddings = [(0, embeddings)]
+        return_ids = list(ids) if ids else [str(uuid.uuid4()) for _ in texts]
+
+        def generate_actions() -> Iterator[dict[str, Any]]:
+            for start, vectors in embeddings:
+                for offset, vector in enumerate(vectors):
+                    i = start + offset
+                    metadata = metadatas[i] if metadatas else {}
+                    request = {
+                        "_op_type": "index",
+                        "_index": index_name,
+                        vector_field: vector,
+                        text_field: texts[i],
+                        **metadata,
+                    }
+                    if is_aoss:
+                        request["id"] = return_ids[i]
+                    else:
+                        request["_id"] = return_ids[i]
+                    yield request
+
         if metadatas:
             self.log(f"Sample metadata: {metadatas[0] if metadatas else {}}")
-        helpers.bulk(client, requests, max_chunk_bytes=max_chunk_bytes)
+
+        previous_refresh = self._disable_refresh(client, index_name, is_aoss=is_aoss)
+        failed_ids: set[str] = set()
+        sample_errors: list[Any] = []
+        try:
+            for ok, info in helpers.parallel_bulk(
+                client,
+                generate_actions(),
+                thread_count=max(1, int(getattr(self, "bulk_thread_count", 4) or 1)),
+                chunk_size=max(1, int(getattr(self, "bulk_chunk_size", 500) or 1)),
+                max_chunk_bytes=max_chunk_bytes,
+                raise_on_error=False,
+                raise_on_exception=False,
+            ):
+                if not ok:
+                    item = next(iter(info.values()), {}) if isinstance(info, dict) else {}
+                    failed_ids.add(str(item.get("_id", "")))
+                    if len(sample_errors) < 5:
+                        sample_errors.append(item.get("error", info))
+        finally:
+            self._restore_refresh(client, index_name, previous_refresh)
+
+        if failed_ids:
+            msg = f"{len(failed_ids)} of {len(texts)} documents failed to index. Sample errors: {sample_errors}"
+            raise ValueError(msg)
         return return_ids
 
+    def _disable_refresh(self, client: OpenSearch, index_name: str, *, is_aoss: bool) -> dict | None:
+        """Turn off periodic refresh on an existing index for the duration of a bulk load.
+
+        Returns:
+            The previous ``refresh_interval`` setting to restore, or None if refresh was not changed
+        """
+        if is_aoss or not getattr(self, "disable_refresh_during_ingest", True):
+            return None
+        try:
+            if not client.indices.exists(index=index_name):
+                return None
+            settings = client.indices.get_settings(index=index_name, name="index.refresh_interval")
+            previous = next(iter(settings.values()), {}).get("settings", {}).get("index", {}).get("refresh_interval")
+            client.indices.put_settings(index=index_name, body={"index": {"refresh_interval": "-1"}})
+        except Exception as e:
+            logger.debug(f"Could not disable refresh on '{index_name}': {e}")
+            return None
+        return {"refresh_interval": previous}
+
+    def _restore_refresh(self, client: OpenSearch, index_name: str, previous: dict | None) -> None:
+        """Restore the refresh interval saved by ``_disable_refresh`` and make new documents searchable."""
+        if previous is None:
+            return
+        try:
+            # None resets the setting to the cluster default
+            client.indices.put_settings(index=index_name, body={"index": previous})
+            client.indices.refresh(index=index_name)
+        except Exception as e:
+            logger.warning(f"Could not restore refresh_interval on '{index_name}': {e}")
+
+    def _iter_embedded_batches(self, texts: list[str]) -> Iterator[tuple[int, list[list[float]]]]:
+        """Embed texts batch by batch, yielding ``(start_offset, vectors)``."""
+        batch_size = max(1, int(getattr(self, "embedding_batch_size", 1000) or 1))
+        for start in range(0, len(texts), batch_size):
+            yield start, self.embedding.embed_documents(texts[start : start + batch_size])
+
     # ---------- auth / client ----------
     def _build_auth_kwargs(self) -> dict[str, Any]:
         """Build authentication configuration for OpenSearch client.
@@ -435,6 +552,7 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
         self.log(self.ingest_data)
         client = self.build_client()
         self._add_documents_to_vector_store(client=client)
+        client.langflow_ingested = bool(self.ingest_data)
         return client
 
     # ---------- ingest ----------
@@ -493,15 +611,16 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
             msg = "Embedding handle is required to embed documents."
             raise ValueError(msg)
 
-        # Generate embeddings
-        vectors = self.embedding.embed_documents(texts)
+        # Generate embeddings lazily; the first batch gives the vector dimension
+        embedded_batches = self._iter_embedded_batches(texts)
+        first_batch = next(embedded_batches, None)
 
-        if not vectors:
+        if first_batch is None or not first_batch[1]:
             self.log("No vectors generated from documents.")
             return
 
         # Get vector dimension for mapping
-        dim = len(vectors[0]) if vectors else 768  # default fallback
+        dim = len(first_batch[1][0])
 
         # Check for AOSS
         auth_kwargs = self._build_auth_kwargs()
@@ -531,12 +650,13 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
         return_ids = self._bulk_ingest_embeddings(
             client=client,
             index_name=self.index_name,
-            embeddings=vectors,
+            embeddings=itertools.chain([first_batch], embedded_batches),
             texts=texts,
             metadatas=metadatas,
             vector_field=self.vector_field,
             text_field="text",
             mapping=mapping,
+            max_chunk_bytes=max(1, int(getattr(self, "bulk_max_chunk_mb", 10) or 1)) * 1024 * 1024,
             is_aoss=is_aoss,
         )
         self.log(metadatas)
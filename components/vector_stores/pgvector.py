@@ -1,12 +1,57 @@
+import csv
+import io
+import json
+import uuid
+
 from langchain_community.vectorstores import PGVector
 
 from lfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from lfx.base.vectorstores.vector_store_connection_decorator import vector_store_connection
 from lfx.helpers.data import docs_to_data
-from lfx.io import HandleInput, IntInput, SecretStrInput, StrInput
+from lfx.io import BoolInput, DropdownInput, HandleInput, IntInput, SecretStrInput, StrInput
 from lfx.schema.data import Data
 from lfx.utils.connection_string_parser import transform_connection_string
 
+EMBEDDING_TABLE = "langchain_pg_embedding"
+COLLECTION_TABLE = "langchain_pg_collection"
+COPY_COLUMNS = "uuid, collection_id, embedding, document, cmetadata, custom_id"
+
+
+class CollectionIndexedPGVector(PGVector):
+    """PGVector whose unfiltered searches match the per-collection cast indexes built by the component."""
+
+    def similarity_search_with_score_by_vector(self, embedding, k=4, filter=None, **kwargs):  # noqa: A002
+        if filter:
+            return super().similarity_search_with_score_by_vector(embedding, k=k, filter=filter, **kwargs)
+
+        from langchain_core.documents import Document
+        from sqlalchemy import text
+
+        dimensions = len(embedding)
+        with self.session_maker() as session:
+            collection_id = session.execute(
+                text(f"SELECT uuid FROM {COLLECTION_TABLE} WHERE name = :name"),  # noqa: S608
+                {"name": self.collection_name},
+            ).scalar()
+            if collection_id is None:
+                return []
+            # The collection id is a literal so the planner can match the partial index predicate
+            rows = session.execute(
+                text(
+                    "SELECT document, cmetadata, custom_id, "
+                    f"embedding::vector({dimensions}) <=> CAST(:query AS vector({dimensions})) AS distance "  # noqa: S608
+                    f"FROM {EMBEDDING_TABLE} WHERE collection_id = '{uuid.UUID(str(collection_id))}' "
+                    "ORDER BY distance LIMIT :k"
+                ),
+                {"query": "[" + ",".join(str(float(value)) for value in embedding) + "]", "k": k},
+            ).all()
+        return [
+            (Document(page_content=document, metadata=metadata or {}, id=custom_id), distance)
+            for document, metadata, custom_id, distance in rows
+        ]
+
 
+@vector_store_connection
 class PGVectorStoreComponent(LCVectorStoreComponent):
     display_name = "PGVector"
     description = "PGVector Vector Store with search capabilities"
@@ -25,8 +70,208 @@ class PGVectorStoreComponent(LCVectorStoreComponent):
             value=4,
             advanced=True,
         ),
+        BoolInput(
+            name="use_copy",
+            display_name="Bulk Load with COPY",
+            info="Load documents with COPY into a staging table instead of row-by-row inserts.",
+            value=True,
+            advanced=True,
+        ),
+        IntInput(
+            name="batch_size",
+            display_name="Batch Size",
+            info="Number of documents embedded and copied per batch.",
+            value=1000,
+            advanced=True,
+        ),
+        DropdownInput(
+            name="index_type",
+            display_name="Index Type",
+            options=["None", "HNSW", "IVFFlat"],
+            value="HNSW",
+            info="Approximate nearest neighbor index built for the collection after documents are loaded.",
+            advanced=True,
+        ),
+        IntInput(
+            name="hnsw_m",
+            display_name="HNSW M",
+            info="Maximum connections per layer of the HNSW graph.",
+            value=16,
+            advanced=True,
+        ),
+        IntInput(
+            name="hnsw_ef_construction",
+            display_name="HNSW ef_construction",
+            info="Candidate list size used while building the HNSW graph.",
+            value=64,
+            advanced=True,
+        ),
+        IntInput(
+            name="ivfflat_lists",
+            display_name="IVFFlat Lists",
+            info="Number of IVFFlat lists. Use 0 for rows / 1000 (at least 1).",
+            value=0,
+            advanced=True,
+        ),
+        IntInput(
+            name="ef_search",
+            display_name="HNSW ef_search",
+            info="Candidate list size at query time (hnsw.ef_search). Higher is more accurate and slower.",
+            value=40,
+            advanced=True,
+        ),
+        IntInput(
+            name="probes",
+            display_name="IVFFlat Probes",
+            info="Lists scanned at query time (ivfflat.probes). Higher is more accurate and slower.",
+            value=10,
+            advanced=True,
+        ),
     ]
 
+    def _get_engine_args(self) -> dict:
+        # Search-time parameters are set as session options on every pooled connection
+        options = f"-c hnsw.ef_search={int(self.ef_search or 40)} -c ivfflat.probes={int(self.probes or 1)}"
+        return {"connect_args": {"options": options}}
+
+    @staticmethod
+    def _copy(cursor, sql: str, buffer: io.StringIO) -> None:
+        if hasattr(cursor, "copy_expert"):
+            # psycopg2
+            cursor.copy_expert(sql, buffer)
+        else:
+            # psycopg 3
+            with cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+
+    def _copy_documents(self, documents, connection_string: str, engine_args: dict) -> PGVector:
+        """Embed documents in batches and bulk load them with COPY through a staging table."""
+        from sqlalchemy import create_engine
+
+        texts = [doc.page_content for doc in documents]
+        metadatas = [doc.metadata for doc in documents]
+        batch_size = max(1, int(self.batch_size or 1000))
+
+        first_vectors = self.embedding.embed_documents(texts[:batch_size])
+        if not first_vectors:
+            msg = "The embedding model returned no vectors."
+            raise ValueError(msg)
+
+        # Creates the extension, tables and collection if they do not exist yet
+        pgvector = CollectionIndexedPGVector(
+            connection_string=connection_string,
+            embedding_function=self.embedding,
+            collection_name=self.collection_name,
+            embedding_length=len(first_vectors[0]),
+            engine_args=engine_args,
+        )
+
+        engine = create_engine(connection_string)
+        connection = engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(f"SELECT uuid FROM {COLLECTION_TABLE} WHERE name = %s", (self.collection_name,))  # noqa: S608
+            collection_id = str(cursor.fetchone()[0])
+            cursor.execute(
+                f"CREATE TEMP TABLE langflow_pg_embedding_staging (LIKE {EMBEDDING_TABLE}) ON COMMIT DROP"
+            )
+            copy_sql = f"COPY langflow_pg_embedding_staging ({COPY_COLUMNS}) FROM STDIN WITH (FORMAT csv)"
+
+            for start in range(0, len(texts), batch_size):
+                batch_texts = texts[start : start + batch_size]
+                vectors = first_vectors if start == 0 else self.embedding.embed_documents(batch_texts)
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                for text, metadata, vector in zip(batch_texts, metadatas[start : start + batch_size], vectors):
+                    writer.writerow(
+                        [
+                            str(uuid.uuid4()),
+                            collection_id,
+                            "[" + ",".join(str(float(value)) for value in vector) + "]",
+                            text,
+                            json.dumps(metadata, default=str),
+                            str(uuid.uuid4()),
+                        ]
+                    )
+                buffer.seek(0)
+                self._copy(cursor, copy_sql, buffer)
+                self.log(f"Copied {min(start + batch_size, len(texts))}/{len(texts)} documents")
+
+            # A single INSERT ... SELECT keeps the load atomic
+            cursor.execute(
+                f"INSERT INTO {EMBEDDING_TABLE} ({COPY_COLUMNS}) "  # noqa: S608
+                f"SELECT {COPY_COLUMNS} FROM langflow_pg_embedding_staging"
+            )
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+            engine.dispose()
+
+        return pgvector
+
+    def _create_ann_index(self, connection_string: str) -> None:
+        """Build the HNSW or IVFFlat index for this collection once its documents are loaded."""
+        if self.index_type not in ("HNSW", "IVFFlat"):
+            return
+
+        from sqlalchemy import create_engine, text
+
+        engine = create_engine(connection_string)
+        try:
+            with engine.begin() as connection:
+                collection_id = connection.execute(
+                    text(f"SELECT uuid FROM {COLLECTION_TABLE} WHERE name = :name"),  # noqa: S608
+                    {"name": self.collection_name},
+                ).scalar()
+                if collection_id is None:
+                    return
+                collection_id = str(collection_id)
+                stats = connection.execute(
+                    text(
+                        "SELECT COUNT(*), MIN(vector_dims(embedding)), MAX(vector_dims(embedding)) "
+                        f"FROM {EMBEDDING_TABLE} WHERE collection_id = :collection_id"  # noqa: S608
+                    ),
+                    {"collection_id": collection_id},
+                ).one()
+                rows, dimensions = stats[0], stats[2]
+                if not rows:
+                    return
+                if stats[1] != dimensions:
+                    self.log(
+                        f"Skipping {self.index_type} index: collection '{self.collection_name}' mixes embedding "
+                        f"dimensions ({stats[1]} and {dimensions})."
+                    )
+                    return
+
+                dimensions = int(dimensions)
+                index_name = (
+                    f"ix_{EMBEDDING_TABLE}_{self.index_type.lower()}_{dimensions}_{uuid.UUID(collection_id).hex[:12]}"
+                )
+                if self.index_type == "HNSW":
+                    method = "hnsw"
+                    params = f"m = {int(self.hnsw_m or 16)}, ef_construction = {int(self.hnsw_ef_construction or 64)}"
+                else:
+                    method = "ivfflat"
+                    params = f"lists = {int(self.ivfflat_lists or 0) or max(1, rows // 1000)}"
+
+                # The shared embedding column has no fixed dimension, so the index is built on a cast expression
+                # and limited to this collection's rows. Queries use the same cast and collection filter.
+                connection.execute(
+                    text(
+                        f"CREATE INDEX IF NOT EXISTS {index_name} ON {EMBEDDING_TABLE} "
+                        f"USING {method} ((embedding::vector({dimensions})) vector_cosine_ops) WITH ({params}) "
+                        f"WHERE collection_id = '{collection_id}'"
+                    )
+                )
+            self.log(f"{self.index_type} index '{index_name}' is ready for {rows} rows")
+        except Exception as e:
+            self.log(f"Could not create {self.index_type} index: {e}")
+        finally:
+            engine.dispose()
+
     @check_cached_vector_store
     def build_vector_store(self) -> PGVector:
         # Convert DataFrame to Data if needed using parent's method
@@ -40,21 +285,30 @@ class PGVectorStoreComponent(LCVectorStoreComponent):
                 documents.append(_input)
 
         connection_string_parsed = transform_connection_string(self.pg_server_url)
+        engine_args = self._get_engine_args()
 
-        if documents:
-            pgvector = PGVector.from_documents(
+        if documents and self.use_copy:
+            pgvector = self._copy_documents(documents, connection_string_parsed, engine_args)
+        elif documents:
+            pgvector = CollectionIndexedPGVector.from_documents(
                 embedding=self.embedding,
                 documents=documents,
                 collection_name=self.collection_name,
                 connection_string=connection_string_parsed,
+                engine_args=engine_args,
             )
         else:
-            pgvector = PGVector.from_existing_index(
+            pgvector = CollectionIndexedPGVector.from_existing_index(
                 embedding=self.embedding,
                 collection_name=self.collection_name,
                 connection_string=connection_string_parsed,
+                engine_args=engine_args,
             )
 
+        if documents:
+            self._create_ann_index(connection_string_parsed)
+
+        pgvector.langflow_ingested = bool(self.ingest_data)
         return pgvector
 
     def search_documents(self) -> list[Data]:
@@ -2,11 +2,13 @@ import numpy as np
 from langchain_core.vectorstores import VectorStore
 
 from lfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from lfx.base.vectorstores.vector_store_connection_decorator import vector_store_connection
 from lfx.helpers.data import docs_to_data
 from lfx.io import DropdownInput, HandleInput, IntInput, SecretStrInput, StrInput
 from lfx.schema.data import Data
 
 
+@vector_store_connection
 class PineconeVectorStoreComponent(LCVectorStoreComponent):
     display_name = "Pinecone"
     description = "Pinecone Vector Store with search capabilities"
@@ -39,6 +41,27 @@ class PineconeVectorStoreComponent(LCVectorStoreComponent):
             value=4,
             advanced=True,
         ),
+        IntInput(
+            name="upsert_batch_size",
+            display_name="Upsert Batch Size",
+            info="Number of vectors sent in each upsert request.",
+            value=100,
+            advanced=True,
+        ),
+        IntInput(
+            name="pool_threads",
+            display_name="Upsert Threads",
+            info="Number of upsert requests sent to Pinecone in parallel.",
+            value=4,
+            advanced=True,
+        ),
+        IntInput(
+            name="embedding_chunk_size",
+            display_name="Embedding Chunk Size",
+            info="Number of documents embedded at a time before their vectors are upserted.",
+            value=1000,
+            advanced=True,
+        ),
     ]
 
     @check_cached_vector_store
@@ -52,6 +75,7 @@ class PineconeVectorStoreComponent(LCVectorStoreComponent):
 
         try:
             from langchain_pinecone._utilities import DistanceStrategy
+            from pinecone import Pinecone
 
             # Wrap the embedding model to ensure float32 output
             wrapped_embeddings = Float32Embeddings(self.embedding)
@@ -60,9 +84,14 @@ class PineconeVectorStoreComponent(LCVectorStoreComponent):
             distance_strategy = self.distance_strategy.replace(" ", "_").upper()
             distance_strategy = DistanceStrategy[distance_strategy]
 
+            # The index's thread pool is what sends async upsert batches in parallel
+            index = Pinecone(api_key=self.pinecone_api_key).Index(
+                self.index_name, pool_threads=max(1, self.pool_threads or 1)
+            )
+
             # Initialize Pinecone instance with wrapped embeddings
             pinecone = PineconeVectorStore(
-                index_name=self.index_name,
+                index=index,
                 embedding=wrapped_embeddings,  # Use wrapped embeddings
                 text_key=self.text_key,
                 namespace=self.namespace,
@@ -87,8 +116,14 @@ class PineconeVectorStoreComponent(LCVectorStoreComponent):
                         documents.append(doc)
 
                 if documents:
-                    pinecone.add_documents(documents)
-
+                    pinecone.add_documents(
+                        documents,
+                        batch_size=max(1, self.upsert_batch_size or 1),
+                        embedding_chunk_size=max(1, self.embedding_chunk_size or 1),
+                        async_req=True,
+                    )
+
+            pinecone.langflow_ingested = bool(self.ingest_data)
             return pinecone
 
     def search_documents(self) -> list[Data]:
@@ -119,16 +154,18 @@ class Float32Embeddings:
 
     def embed_documents(self, texts):
         embeddings = self.base_embeddings.embed_documents(texts)
-        if isinstance(embeddings, np.ndarray):
-            return [[self._force_float32(x) for x in vec] for vec in embeddings]
-        return [[self._force_float32(x) for x in vec] for vec in embeddings]
+        return self._to_float32_lists(embeddings)
 
     def embed_query(self, text):
         embedding = self.base_embeddings.embed_query(text)
-        if isinstance(embedding, np.ndarray):
-            return [self._force_float32(x) for x in embedding]
-        return [self._force_float32(x) for x in embedding]
+        return np.ascontiguousarray(embedding, dtype=np.float32).tolist()
 
-    def _force_float32(self, value):
-        """Convert any numeric type to Python float."""
-        return float(np.float32(value))
+    def _to_float32_lists(self, embeddings):
+        """Convert a batch of vectors to float32 in one NumPy pass and return Python floats."""
+        if len(embeddings) == 0:
+            return []
+        try:
+            return np.ascontiguousarray(embeddings, dtype=np.float32).tolist()
+        except ValueError:
+            # Ragged batches cannot form a 2-D array; convert vector by vector
+            return [np.ascontiguousarray(vec, dtype=np.float32).tolist() for vec in embeddings]
@@ -0,0 +1,338 @@
+import hashlib
+import inspect
+import json
+import queue
+import threading
+import time
+import uuid
+
+from langchain_core.documents import Document
+
+from lfx.custom import Component
+from lfx.io import HandleInput, IntInput, Output
+from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame
+
+# Marks the end of a stage's output in the queue
+_END = object()
+
+
+class PipelinedVectorStoreIngestionComponent(Component):
+    """Streams documents into a vector store through chunk -> embed -> upsert stages with bounded queues."""
+
+    display_name = "Pipelined Vector Store Ingestion"
+    description = (
+        "Ingest documents into any vector store with overlapping chunking, embedding and upsert stages. "
+        "Bounded queues apply backpressure so memory stays constant regardless of dataset size."
+    )
+    icon = "workflow"
+    name = "PipelinedVectorStoreIngestion"
+
+    inputs = [
+        HandleInput(
+            name="vector_store",
+            display_name="Vector Store",
+            input_types=["VectorStore"],
+            info="The vector store handle to ingest into.",
+            required=True,
+        ),
+        HandleInput(
+            name="ingest_data",
+            display_name="Ingest Data",
+            input_types=["Data", "DataFrame"],
+            is_list=True,
+            required=True,
+        ),
+        HandleInput(
+            name="embedding",
+            display_name="Embedding",
+            input_types=["Embeddings"],
+            info="Embedding model for the embed stage. Defaults to the vector store's own embedding model.",
+            required=False,
+        ),
+        IntInput(
+            name="chunk_size",
+            display_name="Chunk Size",
+            info="Split documents into chunks of this many characters. Use 0 to ingest documents as they are.",
+            value=0,
+        ),
+        IntInput(
+            name="chunk_overlap",
+            display_name="Chunk Overlap",
+            info="Characters shared between consecutive chunks.",
+            value=200,
+            advanced=True,
+        ),
+        IntInput(
+            name="batch_size",
+            display_name="Batch Size",
+            info="Number of chunks embedded and upserted per batch.",
+            value=256,
+        ),
+        IntInput(
+            name="queue_size",
+            display_name="Queue Size",
+            info="Maximum batches waiting between stages. Bounds peak memory and applies backpressure.",
+            value=4,
+            advanced=True,
+        ),
+        IntInput(
+            name="embed_workers",
+            display_name="Embedding Workers",
+            info="Number of batches embedded in parallel.",
+            value=2,
+            advanced=True,
+        ),
+        IntInput(
+            name="upsert_workers",
+            display_name="Upsert Workers",
+            info="Number of batches written to the vector store in parallel.",
+            value=1,
+            advanced=True,
+        ),
+    ]
+
+    outputs = [
+        Output(display_name="Ingestion Report", name="report", method="run_ingestion"),
+    ]
+
+    def _iter_documents(self):
+        """Yield LangChain documents from the ingest inputs without materializing them all."""
+        items = self.ingest_data if isinstance(self.ingest_data, list) else [self.ingest_data]
+        rows_per_slice = max(1, int(self.batch_size or 1))
+        for item in items:
+            if isinstance(item, DataFrame):
+                # Convert one slice of rows at a time instead of the whole frame
+                text_key = getattr(item, "text_key", None) or "text"
+                for start in range(0, len(item), rows_per_slice):
+                    for row in item.iloc[start : start + rows_per_slice].to_dict(orient="records"):
+                        yield Data(data=row, text_key=text_key).to_lc_document()
+            elif isinstance(item, Data):
+                yield item.to_lc_document()
+            elif isinstance(item, Document):
+                yield item
+            elif item is not None:
+                msg = f"Unsupported ingest input type: {type(item).__name__}"
+                raise TypeError(msg)
+
+    def _iter_chunks(self):
+        chunk_size = int(self.chunk_size or 0)
+        if chunk_size <= 0:
+            yield from self._iter_documents()
+            return
+
+        from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+        splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=int(self.chunk_overlap or 0))
+        for document in self._iter_documents():
+            yield from splitter.split_documents([document])
+
+    def _get_embedding(self):
+        embedding = self.embedding or getattr(self.vector_store, "embeddings", None)
+        if embedding is None:
+            msg = "No embedding model connected and the vector store does not expose one."
+            raise ValueError(msg)
+        return embedding
+
+    @staticmethod
+    def content_id(text: str, metadata: dict) -> str:
+        """Deterministic document ID derived from the text and metadata, so re-runs overwrite instead of duplicating.
+
+        Identical text from different sources keeps distinct ids because the metadata is part of the hash.
+        """
+        payload = json.dumps({"text": text, "metadata": metadata}, sort_keys=True, default=str)
+        return str(uuid.UUID(hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]))
+
+    def _add_embeddings_style(self) -> str | None:
+        """Return which ``add_embeddings`` signature the vector store has, or None to use ``add_texts``."""
+        add_embeddings = getattr(self.vector_store, "add_embeddings", None)
+        if add_embeddings is None:
+            return None
+        try:
+            parameters = inspect.signature(add_embeddings).parameters
+        except (TypeError, ValueError):
+            return None
+        if "text_embeddings" in parameters:
+            # FAISS: add_embeddings(text_embeddings, metadatas, ids)
+            return "pairs"
+        if "texts" in parameters and "embeddings" in parameters:
+            # PGVector, Neo4jVector: add_embeddings(texts, embeddings, metadatas, ids)
+            return "columns"
+        return None
+
+    def _new_positions(self, ids: list[str]) -> list[int]:
+        """Positions of ids not yet written in this run nor present in a docstore (FAISS rejects known ids)."""
+        docstore = getattr(getattr(self.vector_store, "docstore", None), "_dict", None) or {}
+        positions = []
+        with self._ids_lock:
+            for position, doc_id in enumerate(ids):
+                if doc_id not in self._seen_ids and doc_id not in docstore:
+                    self._seen_ids.add(doc_id)
+                    positions.append(position)
+        return positions
+
+    def _upsert(self, texts, metadatas, vectors, style):
+        ids = [self.content_id(text, metadata) for text, metadata in zip(texts, metadatas)]
+        positions = self._new_positions(ids)
+        if not positions:
+            return 0
+        if len(positions) < len(ids):
+            texts = [texts[i] for i in positions]
+            metadatas = [metadatas[i] for i in positions]
+            ids = [ids[i] for i in positions]
+            vectors = [vectors[i] for i in positions] if vectors is not None else None
+        # Stores that accept precomputed vectors skip re-embedding; the rest embed inside add_texts
+        if vectors is not None and style == "pairs":
+            self.vector_store.add_embeddings(text_embeddings=list(zip(texts, vectors)), metadatas=metadatas, ids=ids)
+        elif vectors is not None and style == "columns":
+            self.vector_store.add_embeddings(texts=texts, embeddings=vectors, metadatas=metadatas, ids=ids)
+        else:
+            self.vector_store.add_texts(texts=texts, metadatas=metadatas, ids=ids)
+        return len(texts)
+
+    def run_ingestion(self) -> Data:
+        batch_size = max(1, int(self.batch_size or 1))
+        queue_size = max(1, int(self.queue_size or 1))
+        embed_workers = max(1, int(self.embed_workers or 1))
+        upsert_workers = max(1, int(self.upsert_workers or 1))
+        style = self._add_embeddings_style()
+        self._seen_ids: set[str] = set()
+        self._ids_lock = threading.Lock()
+        precompute = style is not None
+        embedding = self._get_embedding() if precompute else None
+
+        to_embed: queue.Queue = queue.Queue(maxsize=queue_size)
+        to_upsert: queue.Queue = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        errors: list[BaseException] = []
+        stats_lock = threading.Lock()
+        stats = {
+            "chunks": 0,
+            "duplicates_skipped": 0,
+            "batches": 0,
+            "chunk_seconds": 0.0,
+            "embed_seconds": 0.0,
+            "upsert_seconds": 0.0,
+        }
+
+        def add_stat(name, value):
+            with stats_lock:
+                stats[name] += value
+
+        def put(target, item):
+            # Blocking put that gives up when another stage has failed, so no thread hangs on a full queue
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=0.1)
+                except queue.Full:
+                    continue
+                return True
+            return False
+
+        def get(source):
+            # Blocking get that returns _END when another stage has failed
+            while not stop.is_set():
+                try:
+                    return source.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            return _END
+
+        def fail(error):
+            errors.append(error)
+            stop.set()
+
+        def chunk_stage():
+            try:
+                batch = []
+                started = time.perf_counter()
+                for chunk in self._iter_chunks():
+                    batch.append(chunk)
+                    if len(batch) >= batch_size:
+                        add_stat("chunk_seconds", time.perf_counter() - started)
+                        if not put(to_embed, batch):
+                            return
+                        batch = []
+                        started = time.perf_counter()
+                if batch:
+                    add_stat("chunk_seconds", time.perf_counter() - started)
+                    put(to_embed, batch)
+            except Exception as e:
+                fail(e)
+            finally:
+                for _ in range(embed_workers):
+                    put(to_embed, _END)
+
+        def embed_stage():
+            try:
+                while True:
+                    batch = get(to_embed)
+                    if batch is _END:
+                        return
+                    texts = [chunk.page_content for chunk in batch]
+                    metadatas = [chunk.metadata for chunk in batch]
+                    started = time.perf_counter()
+                    vectors = embedding.embed_documents(texts) if precompute else None
+                    add_stat("embed_seconds", time.perf_counter() - started)
+                    if not put(to_upsert, (texts, metadatas, vectors)):
+                        return
+            except Exception as e:
+                fail(e)
+
+        def upsert_stage():
+            try:
+                while True:
+                    item = get(to_upsert)
+                    if item is _END:
+                        return
+                    texts, metadatas, vectors = item
+                    started = time.perf_counter()
+                    written = self._upsert(texts, metadatas, vectors, style)
+                    add_stat("upsert_seconds", time.perf_counter() - started)
+                    add_stat("chunks", written)
+                    add_stat("duplicates_skipped", len(texts) - written)
+                    add_stat("batches", 1)
+            except Exception as e:
+                fail(e)
+
+        started_at = time.perf_counter()
+        chunker = threading.Thread(target=chunk_stage, name="ingest-chunk", daemon=True)
+        embedders = [
+            threading.Thread(target=embed_stage, name=f"ingest-embed-{i}", daemon=True) for i in range(embed_workers)
+        ]
+        upserters = [
+            threading.Thread(target=upsert_stage, name=f"ingest-upsert-{i}", daemon=True)
+            for i in range(upsert_workers)
+        ]
+        for thread in [chunker, *embedders, *upserters]:
+            thread.start()
+
+        chunker.join()
+        for thread in embedders:
+            thread.join()
+        for _ in range(upsert_workers):
+            put(to_upsert, _END)
+        for thread in upserters:
+            thread.join()
+
+        if errors:
+            msg = f"Ingestion failed after {stats['chunks']} chunks: {errors[0]}"
+            raise RuntimeError(msg) from errors[0]
+
+        # Stores kept in local files (FAISS) expose a persist hook; server-backed stores are already durable
+        persist = getattr(self.vector_store, "persist", None)
+        if callable(persist) and stats["chunks"]:
+            persist()
+
+        elapsed = time.perf_counter() - started_at
+        report = {
+            **{key: round(value, 3) if isinstance(value, float) else value for key, value in stats.items()},
+            "elapsed_seconds": round(elapsed, 3),
+            "chunks_per_second": round(stats["chunks"] / elapsed, 2) if elapsed else 0.0,
+            "precomputed_embeddings": precompute,
+        }
+        self.status = (
+            f"Ingested {report['chunks']} chunks in {report['batches']} batches "
+            f"({report['chunks_per_second']} chunks/sec)"
+        )
+        return Data(data=report)
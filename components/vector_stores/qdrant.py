@@ -1,7 +1,10 @@
+import uuid
+
 from langchain_community.vectorstores import Qdrant
 from langchain_core.embeddings import Embeddings
 
 from lfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from lfx.base.vectorstores.vector_store_connection_decorator import vector_store_connection
 from lfx.helpers.data import docs_to_data
 from lfx.io import (
     BoolInput,
@@ -14,6 +17,7 @@ from lfx.io import (
 from lfx.schema.data import Data
 
 
+@vector_store_connection
 class QdrantVectorStoreComponent(LCVectorStoreComponent):
     display_name = "Qdrant"
     description = "Qdrant Vector Store with search capabilities"
@@ -45,6 +49,55 @@ class QdrantVectorStoreComponent(LCVectorStoreComponent):
             advanced=True,
             info="If True, recreate the collection even if it already exists. Use this when you want to overwrite an existing collection.",
         ),
+        BoolInput(
+            name="prefer_grpc",
+            display_name="Prefer gRPC",
+            value=False,
+            advanced=True,
+            info="Use the gRPC interface (gRPC Port) for requests. Faster than HTTP for large ingests.",
+        ),
+        IntInput(
+            name="batch_size",
+            display_name="Batch Size",
+            value=256,
+            advanced=True,
+            info="Number of points embedded and uploaded per batch.",
+        ),
+        IntInput(
+            name="parallel",
+            display_name="Parallel Uploads",
+            value=1,
+            advanced=True,
+            info="Number of parallel upload workers. Not used with a local Path.",
+        ),
+        BoolInput(
+            name="on_disk",
+            display_name="Vectors On Disk",
+            value=False,
+            advanced=True,
+            info="Store original vectors on disk (memmap) when the collection is created, keeping RAM usage low.",
+        ),
+        DropdownInput(
+            name="quantization",
+            display_name="Quantization",
+            options=["None", "Scalar (int8)", "Binary"],
+            value="None",
+            advanced=True,
+            info="Quantization applied when the collection is created. Quantized vectors are kept in RAM.",
+        ),
+        BoolInput(
+            name="create_payload_indexes",
+            display_name="Create Payload Indexes",
+            value=True,
+            advanced=True,
+            info="Create payload indexes for metadata fields on ingest, so filtered searches avoid full scans.",
+        ),
+        StrInput(
+            name="payload_index_fields",
+            display_name="Payload Index Fields",
+            advanced=True,
+            info="Comma-separated metadata fields to index. Leave empty to index every scalar metadata field.",
+        ),
         *LCVectorStoreComponent.inputs,
         HandleInput(name="embedding", display_name="Embedding", input_types=["Embeddings"]),
         IntInput(
@@ -162,6 +215,8 @@ class QdrantVectorStoreComponent(LCVectorStoreComponent):
                 "path": self.path if self.path else None,
             }
 
+        if self.prefer_grpc:
+            server_kwargs["prefer_grpc"] = True
         server_kwargs = {k: v for k, v in server_kwargs.items() if v is not None}
 
         # Convert DataFrame to Data if needed using parent's method
@@ -184,26 +239,22 @@ class QdrantVectorStoreComponent(LCVectorStoreComponent):
                 qdrant_kwargs["force_recreate"] = True
             
             if documents:
-                # from_documents accepts connection parameters directly, not a client
+                # construct_instance accepts connection parameters directly, not a client
                 # For localhost, ensure we use host/port (not URL) to avoid SSL issues
-                qdrant = Qdrant.from_documents(
-                    documents, 
-                    embedding=self.embedding, 
-                    **qdrant_kwargs,
-                    **server_kwargs
-                )
+                qdrant = self._ingest_documents(documents, qdrant_kwargs, server_kwargs)
             else:
                 # For empty documents, create client explicitly to ensure HTTP is used
                 from qdrant_client import QdrantClient
                 # For localhost, explicitly disable HTTPS
                 if "host" in server_kwargs and server_kwargs["host"] in ("localhost", "127.0.0.1"):
                     # Create client with explicit HTTP for localhost
-                    client = QdrantClient(**server_kwargs, https=False, prefer_grpc=False)
+                    client = QdrantClient(**{"prefer_grpc": False, **server_kwargs}, https=False)
                 else:
                     client = QdrantClient(**server_kwargs)
                 
                 qdrant = Qdrant(embeddings=self.embedding, client=client, **qdrant_kwargs)
 
+            qdrant.langflow_ingested = bool(self.ingest_data)
             return qdrant
         except ConnectionRefusedError as e:
             host = self.host or "localhost"
@@ -245,6 +296,97 @@ class QdrantVectorStoreComponent(LCVectorStoreComponent):
                 raise ValueError(msg) from e
             raise
 
+    def _get_quantization_config(self):
+        from qdrant_client.http import models as rest
+
+        if self.quantization == "Scalar (int8)":
+            return rest.ScalarQuantization(
+                scalar=rest.ScalarQuantizationConfig(type=rest.ScalarType.INT8, always_ram=True)
+            )
+        if self.quantization == "Binary":
+            return rest.BinaryQuantization(binary=rest.BinaryQuantizationConfig(always_ram=True))
+        return None
+
+    def _ingest_documents(self, documents, qdrant_kwargs: dict, server_kwargs: dict) -> Qdrant:
+        """Create the collection if needed, then upload points in batches with parallel workers."""
+        from qdrant_client.http import models as rest
+
+        texts = [doc.page_content for doc in documents]
+        metadatas = [doc.metadata for doc in documents]
+
+        # Only creates (or validates) the collection; points are uploaded below
+        qdrant = Qdrant.construct_instance(
+            texts[:1],
+            self.embedding,
+            on_disk=True if self.on_disk else None,
+            quantization_config=self._get_quantization_config(),
+            **qdrant_kwargs,
+            **server_kwargs,
+        )
+
+        batch_size = max(1, int(self.batch_size or 64))
+
+        def generate_points():
+            # Embeddings are computed one batch at a time while earlier batches are uploading
+            for start in range(0, len(texts), batch_size):
+                batch_texts = texts[start : start + batch_size]
+                vectors = self.embedding.embed_documents(batch_texts)
+                for text, metadata, vector in zip(batch_texts, metadatas[start : start + batch_size], vectors):
+                    yield rest.PointStruct(
+                        id=uuid.uuid4().hex,
+                        vector=vector,
+                        payload={self.content_payload_key: text, self.metadata_payload_key: metadata},
+                    )
+
+        qdrant.client.upload_points(
+            collection_name=self.collection_name,
+            points=generate_points(),
+            batch_size=batch_size,
+            parallel=max(1, int(self.parallel or 1)),
+            max_retries=3,
+            wait=True,
+        )
+
+        if self.create_payload_indexes:
+            self._create_payload_indexes(qdrant.client, metadatas)
+        return qdrant
+
+    def _create_payload_indexes(self, client, metadatas: list[dict]) -> None:
+        """Index filterable metadata fields, inferring the schema type from the ingested values."""
+        from qdrant_client.http import models as rest
+
+        wanted = {field.strip() for field in (self.payload_index_fields or "").split(",") if field.strip()}
+        schemas: dict[str, str | None] = {}
+        for metadata in metadatas:
+            for key, value in (metadata or {}).items():
+                if wanted and key not in wanted:
+                    continue
+                if isinstance(value, bool):
+                    schema = "bool"
+                elif isinstance(value, int):
+                    schema = "integer"
+                elif isinstance(value, float):
+                    schema = "float"
+                elif isinstance(value, str):
+                    schema = "keyword"
+                else:
+                    schema = None
+                # Fields with mixed or non-scalar values are not indexed
+                schemas[key] = schema if schemas.get(key, schema) == schema else None
+
+        for key, schema in schemas.items():
+            if schema is None:
+                continue
+            try:
+                client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name=f"{self.metadata_payload_key}.{key}",
+                    field_schema=rest.PayloadSchemaType(schema),
+                    wait=False,
+                )
+            except Exception as e:
+                self.log(f"Could not create payload index for '{key}': {e}")
+
     def search_documents(self) -> list[Data]:
         try:
             vector_store = self.build_vector_store()
@@ -1,14 +1,40 @@
-from pathlib import Path
-
 from langchain_community.vectorstores.redis import Redis
 from langchain_text_splitters import CharacterTextSplitter
 
 from lfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from lfx.base.vectorstores.vector_store_connection_decorator import vector_store_connection
 from lfx.helpers.data import docs_to_data
-from lfx.io import HandleInput, IntInput, SecretStrInput, StrInput
+from lfx.io import DropdownInput, HandleInput, IntInput, SecretStrInput, StrInput
 from lfx.schema.data import Data
 
 
+
+def _is_numeric(value) -> bool:
+    try:
+        int(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def metadata_schema_sample(metadatas: list[dict]) -> dict:
+    """Merge all metadata dicts into one sample covering every key, for index schema generation.
+
+    A key stays numeric only if every value is numeric; otherwise it is sampled as text.
+    """
+    sample: dict = {}
+    for metadata in metadatas:
+        for key, value in metadata.items():
+            if value is None:
+                continue
+            if key not in sample:
+                sample[key] = value
+            elif _is_numeric(sample[key]) and not _is_numeric(value):
+                sample[key] = value if isinstance(value, (str, list, tuple)) else str(value)
+    return sample
+
+
+@vector_store_connection
 class RedisVectorStoreComponent(LCVectorStoreComponent):
     """A custom component for implementing a Vector Store using Redis."""
 
@@ -37,8 +63,55 @@ class RedisVectorStoreComponent(LCVectorStoreComponent):
             advanced=True,
         ),
         HandleInput(name="embedding", display_name="Embedding", input_types=["Embeddings"]),
+        IntInput(
+            name="batch_size",
+            display_name="Batch Size",
+            info="Number of documents embedded and written per pipelined batch of HSET commands.",
+            value=1000,
+            advanced=True,
+        ),
+        DropdownInput(
+            name="index_algorithm",
+            display_name="Index Algorithm",
+            options=["FLAT", "HNSW"],
+            value="FLAT",
+            info="FLAT is exact brute-force search. HNSW is approximate and much faster on large indexes.",
+            advanced=True,
+        ),
+        IntInput(
+            name="hnsw_m",
+            display_name="HNSW M",
+            info="Maximum outgoing edges per node in the HNSW graph.",
+            value=16,
+            advanced=True,
+        ),
+        IntInput(
+            name="hnsw_ef_construction",
+            display_name="HNSW EF Construction",
+            info="Candidate list size while building the HNSW graph.",
+            value=200,
+            advanced=True,
+        ),
+        IntInput(
+            name="hnsw_ef_runtime",
+            display_name="HNSW EF Runtime",
+            info="Candidate list size at query time. Higher is more accurate and slower.",
+            value=10,
+            advanced=True,
+        ),
     ]
 
+    def _get_vector_schema(self) -> dict:
+        """Vector field settings applied when the index is created."""
+        vector_schema = {"algorithm": self.index_algorithm}
+        if self.index_algorithm == "HNSW":
+            vector_schema.update(
+                m=int(self.hnsw_m or 16),
+                ef_construction=int(self.hnsw_ef_construction or 200),
+                ef_runtime=int(self.hnsw_ef_runtime or 10),
+            )
+        return vector_schema
+
     @check_cached_vector_store
     def build_vector_store(self) -> Redis:
         # Convert DataFrame to Data if needed using parent's method
@@ -50,7 +123,6 @@ class RedisVectorStoreComponent(LCVectorStoreComponent):
                 documents.append(_input.to_lc_document())
             else:
                 documents.append(_input)
-        Path("docuemnts.txt").write_text(str(documents), encoding="utf-8")
 
         if not documents:
             if self.schema is None:
@@ -66,12 +138,34 @@ class RedisVectorStoreComponent(LCVectorStoreComponent):
         else:
             text_splitter = CharacterTextSplitter(chunk_size=1000, chunk_overlap=0)
             docs = text_splitter.split_documents(documents)
-            redis_vs = Redis.from_documents(
-                documents=docs,
+            texts = [doc.page_content for doc in docs]
+            metadatas = [doc.metadata for doc in docs]
+            batch_size = max(1, int(self.batch_size or 1000))
+
+            # The index is created with the first batch, so its metadata schema must cover every batch
+            from langchain_community.vectorstores.redis.base import _generate_field_schema
+
+            index_schema = _generate_field_schema(metadata_schema_sample(metadatas))
+
+            # The first batch creates the index; the rest are embedded and pipelined batch by batch
+            redis_vs = Redis.from_texts(
+                texts=texts[:batch_size],
                 embedding=self.embedding,
+                metadatas=metadatas[:batch_size],
                 redis_url=self.redis_server_url,
                 index_name=self.redis_index_name,
+                index_schema=index_schema,
+                vector_schema=self._get_vector_schema(),
             )
+            for start in range(batch_size, len(texts), batch_size):
+                batch_texts = texts[start : start + batch_size]
+                redis_vs.add_texts(
+                    batch_texts,
+                    metadatas=metadatas[start : start + batch_size],
+                    embeddings=self.embedding.embed_documents(batch_texts),
+                    batch_size=batch_size,
+                )
+        redis_vs.langflow_ingested = bool(self.ingest_data)
         return redis_vs
 
     def search_documents(self) -> list[Data]:
@@ -0,0 +1,239 @@
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+"""
+FAISS Index Benchmark
+=====================
+
+Measures recall vs. query latency for the index types offered by the FAISS vector store
+component (Flat, IVF-Flat, IVF-PQ, HNSW) on synthetic clustered vectors, so index settings
+can be chosen before ingesting large corpora on CPU-only nodes.
+
+Ground truth comes from an exact Flat index. For every index type the script reports build
+time (training + adding), serialized index size, and for each nprobe/efSearch value the
+recall@k, p50/p99 single-query latency and batched queries per second.
+
+USAGE:
+------
+Default run (200k vectors, 384 dimensions):
+    python faiss_index_benchmark.py
+
+Larger corpus with a custom search sweep:
+    python faiss_index_benchmark.py --num-vectors 2000000 --nlist 4096 --nprobe 8,32,128
+
+Save the report as JSON:
+    python faiss_index_benchmark.py --output faiss_benchmark.json
+
+COMMAND LINE ARGUMENTS:
+----------------------
+    --num-vectors       Number of synthetic vectors to index (default: 200000)
+    --dim               Vector dimension (default: 384)
+    --num-queries       Number of query vectors (default: 1000)
+    --k                 Number of neighbors for recall@k (default: 10)
+    --index-types       Comma-separated index types (default: Flat,IVF-Flat,IVF-PQ,HNSW)
+    --nlist             IVF lists (default: 4 * sqrt(num-vectors))
+    --pq-m              PQ sub-quantizers (default: 48)
+    --pq-nbits          Bits per PQ code (default: 8)
+    --hnsw-m            HNSW neighbors per node (default: 32)
+    --training-sample   Max vectors used to train IVF indexes (default: 100000)
+    --nprobe            Comma-separated nprobe values for IVF (default: 1,4,16,64)
+    --ef-search         Comma-separated efSearch values for HNSW (default: 16,64,256)
+    --threads           FAISS OpenMP threads, 0 keeps the library default (default: 0)
+    --seed              Random seed (default: 42)
+    --output            Path to save the JSON report (optional)
+
+REQUIREMENTS:
+------------
+    pip install faiss-cpu numpy
+"""
+
+INDEX_TYPES = ["Flat", "IVF-Flat", "IVF-PQ", "HNSW"]
+
+
+def parse_int_list(value):
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def generate_vectors(num_vectors, num_queries, dim, seed):
+    """Generate clustered vectors (closer to real embeddings than uniform noise) and queries."""
+    rng = np.random.default_rng(seed)
+    num_clusters = max(1, int(np.sqrt(num_vectors) / 4))
+    centers = rng.standard_normal((num_clusters, dim), dtype=np.float32)
+
+    def sample(count):
+        assignments = rng.integers(0, num_clusters, size=count)
+        noise = rng.standard_normal((count, dim), dtype=np.float32) * 0.35
+        return np.ascontiguousarray(centers[assignments] + noise, dtype=np.float32)
+
+    return sample(num_vectors), sample(num_queries)
+
+
+def index_factory_string(index_type, nlist, pq_m, pq_nbits, hnsw_m):
+    if index_type == "Flat":
+        return "Flat"
+    if index_type == "IVF-Flat":
+        return f"IVF{nlist},Flat"
+    if index_type == "IVF-PQ":
+        return f"IVF{nlist},PQ{pq_m}x{pq_nbits}"
+    if index_type == "HNSW":
+        return f"HNSW{hnsw_m},Flat"
+    raise ValueError(f"Unsupported index type: {index_type}")
+
+
+def build_index(faiss, factory, vectors, training_sample, seed):
+    start = time.perf_counter()
+    index = faiss.index_factory(vectors.shape[1], factory)
+    if not index.is_trained:
+        rng = np.random.default_rng(seed)
+        sample_size = min(len(vectors), training_sample)
+        index.train(vectors[rng.choice(len(vectors), size=sample_size, replace=False)])
+    index.add(vectors)
+    build_seconds = time.perf_counter() - start
+    size_bytes = int(faiss.serialize_index(index).nbytes)
+    return index, build_seconds, size_bytes
+
+
+def recall_at_k(found, truth, k):
+    hits = sum(len(set(found_row[:k]) & set(truth_row[:k])) for found_row, truth_row in zip(found, truth))
+    return hits / (len(truth) * k)
+
+
+def measure_search(index, queries, truth, k):
+    """Return recall@k, p50/p99 single-query latency (ms) and batched queries per second."""
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query.reshape(1, -1), k)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    _, found = index.search(queries, k)
+    batch_seconds = time.perf_counter() - start
+
+    return {
+        "recall_at_k": round(recall_at_k(found, truth, k), 4),
+        "p50_ms": round(float(np.percentile(latencies, 50)), 3),
+        "p99_ms": round(float(np.percentile(latencies, 99)), 3),
+        "batch_qps": round(len(queries) / batch_seconds, 1) if batch_seconds > 0 else None,
+    }
+
+
+def run_benchmark(args):
+    try:
+        import faiss
+    except ImportError:
+        print("❌ faiss is not installed. Install it with: pip install faiss-cpu")
+        sys.exit(1)
+
+    if args.threads > 0:
+        faiss.omp_set_num_threads(args.threads)
+
+    nlist = args.nlist or max(1, int(4 * np.sqrt(args.num_vectors)))
+    print(f"🔧 Generating {args.num_vectors} vectors and {args.num_queries} queries (dim={args.dim})...")
+    vectors, queries = generate_vectors(args.num_vectors, args.num_queries, args.dim, args.seed)
+
+    print("📏 Computing exact ground truth...")
+    exact = faiss.IndexFlatL2(args.dim)
+    exact.add(vectors)
+    _, truth = exact.search(queries, args.k)
+
+    results = []
+    for index_type in args.index_types:
+        factory = index_factory_string(index_type, nlist, args.pq_m, args.pq_nbits, args.hnsw_m)
+        print(f"\n🏗️  Building {index_type} ({factory})...")
+        index, build_seconds, size_bytes = build_index(
+            faiss, factory, vectors, args.training_sample, args.seed
+        )
+        print(f"   Build: {build_seconds:.2f}s | Size: {size_bytes / 1024 / 1024:.1f} MB")
+
+        if index_type in ("IVF-Flat", "IVF-PQ"):
+            sweep = [("nprobe", value) for value in args.nprobe if value <= nlist]
+        elif index_type == "HNSW":
+            sweep = [("efSearch", value) for value in args.ef_search]
+        else:
+            sweep = [(None, None)]
+
+        for parameter, value in sweep:
+            if parameter == "nprobe":
+                faiss.extract_index_ivf(index).nprobe = value
+            elif parameter == "efSearch":
+                index.hnsw.efSearch = max(value, args.k)
+
+            metrics = measure_search(index, queries, truth, args.k)
+            row = {
+                "index_type": index_type,
+                "factory": factory,
+                "parameter": parameter,
+                "value": value,
+                "build_seconds": round(build_seconds, 3),
+                "size_mb": round(size_bytes / 1024 / 1024, 2),
+                **metrics,
+            }
+            results.append(row)
+            label = f"{parameter}={value}" if parameter else "exact"
+            print(
+                f"   {label:<14} recall@{args.k}={metrics['recall_at_k']:.4f} "
+                f"p50={metrics['p50_ms']:.3f}ms p99={metrics['p99_ms']:.3f}ms qps={metrics['batch_qps']}"
+            )
+
+    return {
+        "generated_at": datetime.now().isoformat(),
+        "config": {
+            "num_vectors": args.num_vectors,
+            "dim": args.dim,
+            "num_queries": args.num_queries,
+            "k": args.k,
+            "nlist": nlist,
+            "pq_m": args.pq_m,
+            "pq_nbits": args.pq_nbits,
+            "hnsw_m": args.hnsw_m,
+            "training_sample": args.training_sample,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark recall vs. latency of FAISS index types")
+    parser.add_argument("--num-vectors", type=int, default=200000, help="Number of synthetic vectors")
+    parser.add_argument("--dim", type=int, default=384, help="Vector dimension")
+    parser.add_argument("--num-queries", type=int, default=1000, help="Number of query vectors")
+    parser.add_argument("--k", type=int, default=10, help="Neighbors for recall@k")
+    parser.add_argument("--index-types", default=",".join(INDEX_TYPES), help="Comma-separated index types")
+    parser.add_argument("--nlist", type=int, default=0, help="IVF lists (default: 4 * sqrt(num-vectors))")
+    parser.add_argument("--pq-m", type=int, default=48, help="PQ sub-quantizers")
+    parser.add_argument("--pq-nbits", type=int, default=8, help="Bits per PQ code")
+    parser.add_argument("--hnsw-m", type=int, default=32, help="HNSW neighbors per node")
+    parser.add_argument("--training-sample", type=int, default=100000, help="Max vectors used for IVF training")
+    parser.add_argument("--nprobe", default="1,4,16,64", help="Comma-separated nprobe values")
+    parser.add_argument("--ef-search", default="16,64,256", help="Comma-separated efSearch values")
+    parser.add_argument("--threads", type=int, default=0, help="FAISS OpenMP threads (0 = library default)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", help="Path to save the JSON report")
+    args = parser.parse_args()
+
+    args.index_types = [item.strip() for item in args.index_types.split(",") if item.strip()]
+    unknown = [item for item in args.index_types if item not in INDEX_TYPES]
+    if unknown:
+        parser.error(f"Unknown index types: {', '.join(unknown)}. Choose from {', '.join(INDEX_TYPES)}")
+    if "IVF-PQ" in args.index_types and args.dim % args.pq_m != 0:
+        parser.error(f"--pq-m ({args.pq_m}) must divide --dim ({args.dim})")
+    args.nprobe = parse_int_list(args.nprobe)
+    args.ef_search = parse_int_list(args.ef_search)
+
+    report = run_benchmark(args)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,520 @@
+import argparse
+import hashlib
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+import numpy as np
+
+"""
+Vector Store Benchmark
+======================
+
+Compares ingest throughput, re-ingest (dedupe) throughput, top-k query latency and peak memory
+of the vector stores behind the vector store components, on a synthetic corpus with
+deterministic fake embeddings. No embedding provider or API key is needed, and every store
+sees exactly the same documents, vectors and queries, so the numbers are directly comparable.
+
+Each store is benchmarked in its own subprocess, which makes the reported peak RSS belong to
+that store alone. Every run goes through three phases:
+
+    1. ingest         add the corpus in batches, with content-hash ids
+    2. dedupe-ingest  re-add a mix of already ingested and new documents; existing ids must not
+                      create duplicates (FAISS and Chroma skip known ids, the server stores upsert)
+    3. search         top-k similarity search for random queries, one at a time
+
+FAISS and Chroma run locally. Qdrant, Redis, Elasticsearch and OpenSearch are benchmarked when
+their URL is given, for example against local containers:
+
+    docker run -p 6333:6333 qdrant/qdrant
+    docker run -p 6379:6379 redis/redis-stack-server
+    docker run -p 9200:9200 -e discovery.type=single-node -e xpack.security.enabled=false elasticsearch:8.15.0
+    docker run -p 9201:9200 -e discovery.type=single-node -e DISABLE_SECURITY_PLUGIN=true opensearchproject/opensearch:2
+
+USAGE:
+------
+Default run (FAISS and Chroma, 20k documents):
+    python vector_store_benchmark.py
+
+Include local containers:
+    python vector_store_benchmark.py --qdrant-url http://localhost:6333 --redis-url redis://localhost:6379
+
+Larger corpus, save the report as JSON:
+    python vector_store_benchmark.py --num-docs 200000 --dim 768 --output vector_store_benchmark.json
+
+COMMAND LINE ARGUMENTS:
+----------------------
+    --stores              Comma-separated stores to run (default: faiss, chroma and every store with a URL)
+    --num-docs            Number of synthetic documents (default: 20000)
+    --dim                 Embedding dimension (default: 384)
+    --words-per-doc       Words per synthetic document (default: 64)
+    --batch-size          Documents per add call (default: 500)
+    --dedupe-overlap      Fraction of the corpus re-ingested in the dedupe phase (default: 0.5)
+    --dedupe-new          Fraction of new documents added in the dedupe phase (default: 0.1)
+    --num-queries         Number of search queries (default: 500)
+    --k                   Results per query (default: 10)
+    --qdrant-url          Qdrant URL, e.g. http://localhost:6333 (optional)
+    --redis-url           Redis Stack URL, e.g. redis://localhost:6379 (optional)
+    --elasticsearch-url   Elasticsearch URL, e.g. http://localhost:9200 (optional)
+    --opensearch-url      OpenSearch URL, e.g. http://localhost:9201 (optional)
+    --seed                Random seed (default: 42)
+    --output              Path to save the JSON report (optional)
+
+REQUIREMENTS:
+------------
+    pip install numpy langchain-core langchain-community faiss-cpu langchain-chroma
+    Optional: qdrant-client, redis, langchain-elasticsearch, opensearch-py
+"""
+
+LOCAL_STORES = ["faiss", "chroma"]
+SERVER_STORES = ["qdrant", "redis", "elasticsearch", "opensearch"]
+STORES = LOCAL_STORES + SERVER_STORES
+COLLECTION_PREFIX = "langflow_benchmark"
+
+TOPICS = ["billing", "shipping", "security", "onboarding", "analytics", "support", "legal", "hardware"]
+
+
+def make_embeddings(dim):
+    from langchain_core.embeddings import Embeddings
+
+    class DeterministicEmbeddings(Embeddings):
+        """Fake embeddings: a unit vector seeded from the text hash, identical across runs and stores."""
+
+        def __init__(self, dim):
+            self.dim = dim
+
+        def _embed(self, text):
+            seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+            vector = np.random.default_rng(seed).standard_normal(self.dim, dtype=np.float32)
+            return (vector / np.linalg.norm(vector)).tolist()
+
+        def embed_documents(self, texts):
+            return [self._embed(text) for text in texts]
+
+        def embed_query(self, text):
+            return self._embed(text)
+
+    return DeterministicEmbeddings(dim)
+
+
+def generate_corpus(count, words_per_doc, seed, start=0):
+    """Generate synthetic documents from a fixed vocabulary, with metadata like real ingested chunks."""
+    rng = np.random.default_rng(seed)
+    vocabulary = [f"term{index}" for index in range(5000)]
+    texts, metadatas = [], []
+    for offset in range(count):
+        number = start + offset
+        words = rng.choice(vocabulary, size=words_per_doc)
+        texts.append(f"document {number} " + " ".join(words))
+        metadatas.append(
+            {"source": f"synthetic-{number // 100}.txt", "chunk": number, "topic": TOPICS[number % len(TOPICS)]}
+        )
+    return texts, metadatas
+
+
+def generate_queries(count, seed):
+    rng = np.random.default_rng(seed + 1)
+    vocabulary = [f"term{index}" for index in range(5000)]
+    return [" ".join(rng.choice(vocabulary, size=6)) for _ in range(count)]
+
+
+def content_ids(texts):
+    # UUIDs derived from the content hash: valid ids for every store, identical for identical text
+    return [str(uuid.UUID(hashlib.sha256(text.encode()).hexdigest()[:32])) for text in texts]
+
+
+def unique_batch(texts, metadatas, ids, known_ids):
+    keep = []
+    for position, doc_id in enumerate(ids):
+        if doc_id not in known_ids:
+            known_ids.add(doc_id)
+            keep.append(position)
+    return [texts[i] for i in keep], [metadatas[i] for i in keep], [ids[i] for i in keep]
+
+
+class FaissBackend:
+    def __init__(self, embedding, args):
+        self.embedding = embedding
+        self.store = None
+
+    def add(self, texts, metadatas, ids):
+        from langchain_community.vectorstores import FAISS
+
+        # Same id check as the FAISS component: skip ids already in the docstore
+        known_ids = set(self.store.docstore._dict) if self.store else set()
+        texts, metadatas, ids = unique_batch(texts, metadatas, ids, known_ids)
+        if not texts:
+            return 0
+        if self.store is None:
+            self.store = FAISS.from_texts(texts, self.embedding, metadatas=metadatas, ids=ids)
+        else:
+            self.store.add_texts(texts, metadatas=metadatas, ids=ids)
+        return len(texts)
+
+    def count(self):
+        return self.store.index.ntotal if self.store else 0
+
+    def cleanup(self):
+        pass
+
+
+class ChromaBackend:
+    def __init__(self, embedding, args):
+        from langchain_chroma import Chroma
+
+        self.directory = tempfile.mkdtemp(prefix=f"{COLLECTION_PREFIX}_chroma_")
+        self.store = Chroma(
+            collection_name=COLLECTION_PREFIX, embedding_function=embedding, persist_directory=self.directory
+        )
+
+    def add(self, texts, metadatas, ids):
+        # Same id check as the Chroma component: one lookup per batch, skip ids that already exist
+        existing = set(self.store.get(ids=ids, include=[])["ids"])
+        texts, metadatas, ids = unique_batch(texts, metadatas, ids, existing)
+        if texts:
+            self.store.add_texts(texts, metadatas=metadatas, ids=ids)
+        return len(texts)
+
+    def count(self):
+        return self.store._collection.count()
+
+    def cleanup(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class QdrantBackend:
+    def __init__(self, embedding, args):
+        self.embedding = embedding
+        self.url = args.qdrant_url
+        self.collection_name = f"{COLLECTION_PREFIX}_{os.getpid()}"
+        self.store = None
+
+    def add(self, texts, metadatas, ids):
+        from langchain_community.vectorstores import Qdrant
+
+        if self.store is None:
+            self.store = Qdrant.from_texts(
+                texts,
+                self.embedding,
+                metadatas=metadatas,
+                ids=ids,
+                url=self.url,
+                collection_name=self.collection_name,
+                force_recreate=True,
+                batch_size=len(texts),
+            )
+        else:
+            self.store.add_texts(texts, metadatas=metadatas, ids=ids, batch_size=len(texts))
+        return len(texts)
+
+    def count(self):
+        return self.store.client.count(self.collection_name, exact=True).count if self.store else 0
+
+    def cleanup(self):
+        if self.store is not None:
+            self.store.client.delete_collection(self.collection_name)
+
+
+class RedisBackend:
+    def __init__(self, embedding, args):
+        self.embedding = embedding
+        self.url = args.redis_url
+        self.index_name = f"{COLLECTION_PREFIX}_{os.getpid()}"
+        self.store = None
+
+    def add(self, texts, metadatas, ids):
+        from langchain_community.vectorstores.redis import Redis
+
+        if self.store is None:
+            self.store = Redis.from_texts(
+                texts, self.embedding, metadatas=metadatas, keys=ids, redis_url=self.url, index_name=self.index_name
+            )
+        else:
+            self.store.add_texts(texts, metadatas=metadatas, keys=ids, batch_size=len(texts))
+        return len(texts)
+
+    def count(self):
+        return int(self.store.client.ft(self.index_name).info()["num_docs"]) if self.store else 0
+
+    def cleanup(self):
+        if self.store is not None:
+            from langchain_community.vectorstores.redis import Redis
+
+            Redis.drop_index(self.index_name, delete_documents=True, redis_url=self.url)
+
+
+class ElasticsearchBackend:
+    def __init__(self, embedding, args):
+        from langchain_elasticsearch import ElasticsearchStore
+
+        self.index_name = f"{COLLECTION_PREFIX}_{os.getpid()}"
+        self.store = ElasticsearchStore(index_name=self.index_name, embedding=embedding, es_url=args.elasticsearch_url)
+
+    def add(self, texts, metadatas, ids):
+        self.store.add_texts(texts, metadatas=metadatas, ids=ids, refresh_indices=False)
+        return len(texts)
+
+    def count(self):
+        self.store.client.indices.refresh(index=self.index_name)
+        return self.store.client.count(index=self.index_name)["count"]
+
+    def cleanup(self):
+        self.store.client.indices.delete(index=self.index_name, ignore_unavailable=True)
+
+
+class OpenSearchBackend:
+    def __init__(self, embedding, args):
+        from langchain_community.vectorstores import OpenSearchVectorSearch
+
+        self.index_name = f"{COLLECTION_PREFIX}_{os.getpid()}"
+        self.store = OpenSearchVectorSearch(
+            opensearch_url=args.opensearch_url, index_name=self.index_name, embedding_function=embedding
+        )
+
+    def add(self, texts, metadatas, ids):
+        self.store.add_texts(texts, metadatas=metadatas, ids=ids, bulk_size=len(texts))
+        return len(texts)
+
+    def count(self):
+        self.store.client.indices.refresh(index=self.index_name)
+        return self.store.client.count(index=self.index_name)["count"]
+
+    def cleanup(self):
+        self.store.client.indices.delete(index=self.index_name, ignore_unavailable=True)
+
+
+BACKENDS = {
+    "faiss": FaissBackend,
+    "chroma": ChromaBackend,
+    "qdrant": QdrantBackend,
+    "redis": RedisBackend,
+    "elasticsearch": ElasticsearchBackend,
+    "opensearch": OpenSearchBackend,
+}
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return round(peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def ingest(backend, texts, metadatas, ids, batch_size):
+    added = 0
+    start = time.perf_counter()
+    for offset in range(0, len(texts), batch_size):
+        added += backend.add(
+            texts[offset : offset + batch_size],
+            metadatas[offset : offset + batch_size],
+            ids[offset : offset + batch_size],
+        )
+    seconds = time.perf_counter() - start
+    return {
+        "docs": len(texts),
+        "added": added,
+        "seconds": round(seconds, 3),
+        "docs_per_second": round(len(texts) / seconds, 1) if seconds > 0 else None,
+    }
+
+
+def search(backend, queries, k):
+    latencies = []
+    start = time.perf_counter()
+    for query in queries:
+        query_start = time.perf_counter()
+        backend.store.similarity_search(query, k=k)
+        latencies.append((time.perf_counter() - query_start) * 1000)
+    seconds = time.perf_counter() - start
+    return {
+        "queries": len(queries),
+        "p50_ms": round(float(np.percentile(latencies, 50)), 3),
+        "p99_ms": round(float(np.percentile(latencies, 99)), 3),
+        "qps": round(len(queries) / seconds, 1) if seconds > 0 else None,
+    }
+
+
+def run_store(store, args):
+    """Run all phases for one store in the current process and return its result row."""
+    embedding = make_embeddings(args.dim)
+    texts, metadatas = generate_corpus(args.num_docs, args.words_per_doc, args.seed)
+    ids = content_ids(texts)
+
+    # Dedupe phase: the first part of the corpus again, plus documents the store has not seen yet
+    overlap = int(args.num_docs * args.dedupe_overlap)
+    new_texts, new_metadatas = generate_corpus(
+        int(args.num_docs * args.dedupe_new), args.words_per_doc, args.seed + 2, start=args.num_docs
+    )
+    dedupe_texts = texts[:overlap] + new_texts
+    dedupe_metadatas = metadatas[:overlap] + new_metadatas
+    dedupe_ids = ids[:overlap] + content_ids(new_texts)
+    queries = generate_queries(args.num_queries, args.seed)
+    baseline_rss = peak_rss_mb()
+
+    backend = BACKENDS[store](embedding, args)
+    try:
+        print(f"📥 [{store}] Ingesting {len(texts)} documents...")
+        ingest_metrics = ingest(backend, texts, metadatas, ids, args.batch_size)
+        print(f"🔁 [{store}] Re-ingesting {len(dedupe_texts)} documents ({overlap} already stored)...")
+        dedupe_metrics = ingest(backend, dedupe_texts, dedupe_metadatas, dedupe_ids, args.batch_size)
+        stored = backend.count()
+        print(f"🔎 [{store}] Running {len(queries)} top-{args.k} queries...")
+        search_metrics = search(backend, queries, args.k)
+    finally:
+        backend.cleanup()
+
+    expected = len(texts) + len(new_texts)
+    return {
+        "store": store,
+        "ingest": ingest_metrics,
+        "dedupe_ingest": dedupe_metrics,
+        "stored_docs": stored,
+        "expected_docs": expected,
+        "duplicates": stored - expected,
+        "search": search_metrics,
+        "baseline_rss_mb": baseline_rss,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_in_subprocess(store, args):
+    """Benchmark a store in a fresh interpreter so its peak RSS is not mixed with other stores."""
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as result_file:
+        result_path = result_file.name
+    command = [sys.executable, os.path.abspath(__file__), "--run-one", store, "--result-file", result_path]
+    for name in (
+        "num_docs",
+        "dim",
+        "words_per_doc",
+        "batch_size",
+        "dedupe_overlap",
+        "dedupe_new",
+        "num_queries",
+        "k",
+        "qdrant_url",
+        "redis_url",
+        "elasticsearch_url",
+        "opensearch_url",
+        "seed",
+    ):
+        value = getattr(args, name)
+        if value is not None:
+            command += [f"--{name.replace('_', '-')}", str(value)]
+
+    try:
+        completed = subprocess.run(command, check=False)  # noqa: S603
+        if completed.returncode != 0:
+            return {"store": store, "error": f"benchmark process exited with code {completed.returncode}"}
+        with open(result_path, encoding="utf-8") as f:
+            return json.load(f)
+    finally:
+        os.unlink(result_path)
+
+
+def print_report(results):
+    header = (
+        f"{'Store':<14}{'Ingest docs/s':>15}{'Dedupe docs/s':>15}{'Duplicates':>12}"
+        f"{'p50 ms':>10}{'p99 ms':>10}{'QPS':>10}{'Peak RSS MB':>13}"
+    )
+    print("\n📊 Results")
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        if "error" in row:
+            print(f"{row['store']:<14}❌ {row['error']}")
+            continue
+        print(
+            f"{row['store']:<14}{row['ingest']['docs_per_second']:>15}{row['dedupe_ingest']['docs_per_second']:>15}"
+            f"{row['duplicates']:>12}{row['search']['p50_ms']:>10}{row['search']['p99_ms']:>10}"
+            f"{row['search']['qps']:>10}{row['peak_rss_mb']:>13}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare ingest throughput and query latency of vector stores")
+    parser.add_argument("--stores", help="Comma-separated stores (default: faiss, chroma and stores with a URL)")
+    parser.add_argument("--num-docs", type=int, default=20000, help="Number of synthetic documents")
+    parser.add_argument("--dim", type=int, default=384, help="Embedding dimension")
+    parser.add_argument("--words-per-doc", type=int, default=64, help="Words per synthetic document")
+    parser.add_argument("--batch-size", type=int, default=500, help="Documents per add call")
+    parser.add_argument("--dedupe-overlap", type=float, default=0.5, help="Fraction of the corpus re-ingested")
+    parser.add_argument("--dedupe-new", type=float, default=0.1, help="Fraction of new documents in the re-ingest")
+    parser.add_argument("--num-queries", type=int, default=500, help="Number of search queries")
+    parser.add_argument("--k", type=int, default=10, help="Results per query")
+    parser.add_argument("--qdrant-url", help="Qdrant URL")
+    parser.add_argument("--redis-url", help="Redis Stack URL")
+    parser.add_argument("--elasticsearch-url", help="Elasticsearch URL")
+    parser.add_argument("--opensearch-url", help="OpenSearch URL")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", help="Path to save the JSON report")
+    # Internal: run a single store and write its result row to a file
+    parser.add_argument("--run-one", choices=STORES, help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        result = run_store(args.run_one, args)
+        with open(args.result_file, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        return
+
+    if args.stores:
+        stores = [item.strip().lower() for item in args.stores.split(",") if item.strip()]
+    else:
+        stores = LOCAL_STORES + [store for store in SERVER_STORES if getattr(args, f"{store}_url")]
+    unknown = [store for store in stores if store not in STORES]
+    if unknown:
+        parser.error(f"Unknown stores: {', '.join(unknown)}. Choose from {', '.join(STORES)}")
+    missing_url = [store for store in stores if store in SERVER_STORES and not getattr(args, f"{store}_url")]
+    if missing_url:
+        parser.error(f"Missing URL for: {', '.join(missing_url)} (use --{missing_url[0]}-url)")
+    if not 0 <= args.dedupe_overlap <= 1:
+        parser.error("--dedupe-overlap must be between 0 and 1")
+    if args.dedupe_new < 0:
+        parser.error("--dedupe-new must be 0 or greater")
+
+    print(
+        f"🔧 Benchmarking {', '.join(stores)} with {args.num_docs} documents, dim={args.dim}, "
+        f"{args.num_queries} queries (k={args.k})"
+    )
+    results = []
+    for store in stores:
+        print(f"\n🚀 {store}")
+        row = run_in_subprocess(store, args)
+        results.append(row)
+        if "error" in row:
+            print(f"❌ {store}: {row['error']}")
+        elif row["duplicates"]:
+            print(f"⚠️  {store}: {row['duplicates']} duplicate documents after the dedupe phase")
+
+    print_report(results)
+
+    if args.output:
+        report = {
+            "generated_at": datetime.now().isoformat(),
+            "config": {
+                "num_docs": args.num_docs,
+                "dim": args.dim,
+                "words_per_doc": args.words_per_doc,
+                "batch_size": args.batch_size,
+                "dedupe_overlap": args.dedupe_overlap,
+                "dedupe_new": args.dedupe_new,
+                "num_queries": args.num_queries,
+                "k": args.k,
+                "seed": args.seed,
+            },
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()